@@ -6,6 +6,7 @@ from smart_decision_miniproject.solver.TSP import (
     SimulatedAnnealingTSPSolver,
     AntColonyOptimizationTSPSolver,
 )
+from smart_decision_miniproject.solver.tsp_arena import SolverArena
 
 from smart_decision_miniproject.TSP_datamodel.distance_matrix_factory import (
     RandomDistanceMatrixFactory,
@@ -544,6 +545,9 @@ async def start_comparison():
         convergence_threshold=aco_params.get("convergence_threshold", 1e-6),
         patience=aco_params.get("patience", 10),
         num_iterations=aco_params["num_iterations"],
+        # 按最大规模预分配信息素/可见度缓冲区，各规模复用；每个规模都是新矩阵，不使用启发式缓存
+        arena=SolverArena(int(scale_params["max_scale"])),
+        heuristic_cache=None,
     )
 
     total_steps = int(scale_params["max_scale"]) // int(scale_params["scale_interval"])
@@ -413,8 +413,8 @@ def show_vrp_results(result: VRPResult):
                 fig = go.Figure()
                 
                 # 添加客户点
-                x_coords = [customer.x for customer in result.customers]
-                y_coords = [customer.y for customer in result.customers]
+                x_coords = result.customers.x
+                y_coords = result.customers.y
                 
                 # 仓库点
                 fig.add_trace(go.Scatter(
@@ -443,15 +443,9 @@ def show_vrp_results(result: VRPResult):
                         continue
                         
                     # 构建路径坐标（包括从仓库出发和返回仓库）
-                    route_x = [x_coords[0]]  # 从仓库开始
-                    route_y = [y_coords[0]]
-                    
-                    for customer_id in route:
-                        route_x.append(x_coords[customer_id])
-                        route_y.append(y_coords[customer_id])
-                    
-                    route_x.append(x_coords[0])  # 返回仓库
-                    route_y.append(y_coords[0])
+                    stops = [0] + list(route) + [0]
+                    route_x = x_coords[stops]
+                    route_y = y_coords[stops]
                     
                     color = colors[i % len(colors)]
                     fig.add_trace(go.Scatter(
@@ -510,8 +504,8 @@ def create_results_visualization(result: VRPResult):
     fig = go.Figure()
     
     # 添加客户点
-    x_coords = [customer.x for customer in result.customers]
-    y_coords = [customer.y for customer in result.customers]
+    x_coords = result.customers.x
+    y_coords = result.customers.y
     
     # 仓库点
     fig.add_trace(go.Scatter(
@@ -540,15 +534,9 @@ def create_results_visualization(result: VRPResult):
             continue
             
         # 构建路径坐标（包括从仓库出发和返回仓库）
-        route_x = [x_coords[0]]  # 从仓库开始
-        route_y = [y_coords[0]]
-        
-        for customer_id in route:
-            route_x.append(x_coords[customer_id])
-            route_y.append(y_coords[customer_id])
-        
-        route_x.append(x_coords[0])  # 返回仓库
-        route_y.append(y_coords[0])
+        stops = [0] + list(route) + [0]
+        route_x = x_coords[stops]
+        route_y = y_coords[stops]
         
         color = colors[i % len(colors)]
         fig.add_trace(go.Scatter(
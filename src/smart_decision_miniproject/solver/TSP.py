@@ -1,5 +1,4 @@
-import random
-import math
+import numpy as np
 
 from smart_decision_miniproject.TSP_datamodel import DistanceMatrix
 from smart_decision_miniproject.TSP_datamodel import (
@@ -7,6 +6,24 @@ from smart_decision_miniproject.TSP_datamodel import (
 )
 from smart_decision_miniproject.timer import Timer
 from smart_decision_miniproject.timer.timer_manager import TimerManager
+from smart_decision_miniproject.solver.rng import MAX_EXPONENTIAL, RandomStream
+from smart_decision_miniproject.solver.tsp_arena import SolverArena, packed_size
+from smart_decision_miniproject.solver.tsp_heuristic import (
+    HeuristicCache,
+    default_heuristic_cache,
+    heuristic_matrix,
+    matrix_fingerprint,
+)
+from smart_decision_miniproject.solver.tsp_selection import ALIAS_ATTEMPTS, AliasTables, cumulative_choice
+from smart_decision_miniproject.solver.tsp_pheromone import (
+    CandidateEdgeMatrix,
+    PackedSymmetricMatrix,
+    candidate_count,
+    nearest_candidates,
+)
+
+# Moves drawn at once by the simulated annealing loop
+MOVE_BLOCK_SIZE = 4096
 
 class BaseTSPSolver:
     """Base class for TSP solvers."""
@@ -29,6 +46,8 @@ class SimulatedAnnealingTSPSolver(BaseTSPSolver):
         min_temperature: float = 0.01,
         cooling_rate: float = 0.995,
         max_iterations: int = 10000,
+        seed: int | None = None,
+        moves_per_temperature: int = 1,
     ):
         """Initialize the simulated annealing TSP solver.
 
@@ -38,12 +57,19 @@ class SimulatedAnnealingTSPSolver(BaseTSPSolver):
             min_temperature (float): Minimum temperature to stop the algorithm.
             cooling_rate (float): Rate at which temperature decreases (0 < cooling_rate < 1).
             max_iterations (int): Maximum number of iterations to run.
+            seed (int | None): Seed of the random stream, None for a random run.
+            moves_per_temperature (int): Moves tried at each temperature before cooling down;
+                max_iterations counts moves, not temperature levels.
         """
+        if moves_per_temperature < 1:
+            raise ValueError("moves_per_temperature must be at least 1")
         super().__init__(distance_matrix)
         self.initial_temperature = initial_temperature
         self.min_temperature = min_temperature
         self.cooling_rate = cooling_rate
         self.max_iterations = max_iterations
+        self.moves_per_temperature = moves_per_temperature
+        self.rng = RandomStream(seed)
         self.num_cities = len(distance_matrix)
     
     def update_distance_matrix(self, distance_matrix: DistanceMatrix):
@@ -71,7 +97,7 @@ class SimulatedAnnealingTSPSolver(BaseTSPSolver):
         """
         # Start with city 0 (A), then shuffle the remaining cities
         remaining_cities = list(range(1, self.num_cities))
-        random.shuffle(remaining_cities)
+        self.rng.shuffle(remaining_cities)
         return [0] + remaining_cities
 
     def get_neighbor(self, tour: list[int]) -> list[int]:
@@ -86,11 +112,43 @@ class SimulatedAnnealingTSPSolver(BaseTSPSolver):
         """
         new_tour = tour.copy()
         # Only swap cities from index 1 onwards (keep city 0 fixed)
-        if len(tour) > 2:  # Need at least 3 cities to swap
-            i, j = random.sample(range(1, len(tour)), 2)
+        swap = self._draw_swap(tour)  # Need at least 3 cities to swap
+        if swap is not None:
+            i, j = swap
             new_tour[i], new_tour[j] = new_tour[j], new_tour[i]
         return new_tour
 
+    def _draw_swap(self, tour: list[int]) -> tuple[int, int] | None:
+        """Draw the two positions get_neighbor would swap (None if the tour is too short)."""
+        if len(tour) > 2:
+            return self.rng.pair(1, len(tour))
+        return None
+
+    def swap_delta(self, tour: list[int], i: int, j: int) -> float:
+        """Change of the tour distance if the cities at positions i and j were swapped.
+
+        Only the (at most four) edges touching the two positions are read, so the
+        cost does not depend on the tour length.
+
+        Args:
+            tour (list[int]): Current tour.
+            i (int): First position (not 0).
+            j (int): Second position (not 0, different from i).
+
+        Returns:
+            float: New distance minus current distance.
+        """
+        if i > j:
+            i, j = j, i
+        matrix = self.distance_matrix.matrix
+        previous, a, b, following = tour[i - 1], tour[i], tour[j], tour[(j + 1) % len(tour)]
+        if j == i + 1:
+            return (matrix[previous][b] + matrix[b][a] + matrix[a][following]
+                    - matrix[previous][a] - matrix[a][b] - matrix[b][following])
+        after_i, before_j = tour[i + 1], tour[j - 1]
+        return (matrix[previous][b] + matrix[b][after_i] + matrix[before_j][a] + matrix[a][following]
+                - matrix[previous][a] - matrix[a][after_i] - matrix[before_j][b] - matrix[b][following])
+
     def accept_solution(
         self, current_distance: float, new_distance: float, temperature: float
     ) -> bool:
@@ -107,10 +165,33 @@ class SimulatedAnnealingTSPSolver(BaseTSPSolver):
         if new_distance < current_distance:
             return True
 
-        # Accept worse solutions with probability based on temperature
+        # Accept worse solutions with probability exp(-delta/T), i.e. if delta < -T·ln(u);
+        # beyond T·MAX_EXPONENTIAL no draw can accept, so none is made
         delta = new_distance - current_distance
-        probability = math.exp(-delta / temperature)
-        return random.random() < probability
+        return delta < temperature * MAX_EXPONENTIAL and delta < temperature * self.rng.exponential()
+
+    def draw_moves(self, start: int, count: int) -> tuple[list[int], list[int], list[float]]:
+        """Draw the swap positions and acceptance thresholds of a block of moves at once.
+
+        Move k (counted from the start of the run) is tried at the temperature
+        T = initial_temperature · cooling_rate^(k // moves_per_temperature) and
+        accepted if its delta is below the threshold T·(-ln u), which is
+        accepting with probability exp(-delta/T). The block stops before the
+        first move whose temperature is at or below min_temperature.
+
+        Args:
+            start (int): Index of the first move of the block.
+            count (int): Number of moves to draw.
+
+        Returns:
+            tuple[list[int], list[int], list[float]]: First positions, second positions and thresholds.
+        """
+        first, second = self.rng.pairs(1, self.num_cities, count)
+        levels = (start + np.arange(count)) // self.moves_per_temperature
+        temperatures = self.initial_temperature * self.cooling_rate ** levels
+        moves = int(np.count_nonzero(temperatures > self.min_temperature))  # Temperatures only decrease
+        thresholds = temperatures[:moves] * self.rng.exponentials(moves)
+        return first[:moves].tolist(), second[:moves].tolist(), thresholds.tolist()
 
     def solveTSP(self) -> list[int]:
         """Solve the TSP using simulated annealing algorithm.
@@ -126,28 +207,30 @@ class SimulatedAnnealingTSPSolver(BaseTSPSolver):
         best_tour = current_tour.copy()
         best_distance = current_distance
 
-        # Initialize temperature
-        temperature = self.initial_temperature
-
-        iteration = 0
-        while temperature > self.min_temperature and iteration < self.max_iterations:
-            # Generate a neighboring solution
-            new_tour = self.get_neighbor(current_tour)
-            new_distance = self.calculate_tour_distance(new_tour)
-
-            # Decide whether to accept the new solution
-            if self.accept_solution(current_distance, new_distance, temperature):
-                current_tour = new_tour
-                current_distance = new_distance
-
-                # Update best solution if necessary
-                if current_distance < best_distance:
-                    best_tour = current_tour.copy()
-                    best_distance = current_distance
-
-            # Cool down the temperature
-            temperature *= self.cooling_rate
-            iteration += 1
+        # Fewer than 3 cities: nothing can be swapped
+        if len(current_tour) < 3:
+            return best_tour
+
+        swap_delta = self.swap_delta
+        move = 0
+        while move < self.max_iterations:
+            # Positions and thresholds come in vectorized blocks; the loop only scores the swaps
+            firsts, seconds, thresholds = self.draw_moves(move, min(MOVE_BLOCK_SIZE, self.max_iterations - move))
+            for i, j, threshold in zip(firsts, seconds, thresholds):
+                # Score the neighbouring swap from the edges it changes, then apply it in place
+                delta = swap_delta(current_tour, i, j)
+                if delta < threshold:  # Thresholds are >= 0, so every improving move passes
+                    current_tour[i], current_tour[j] = current_tour[j], current_tour[i]
+                    current_distance += delta
+
+                    # Update best solution if necessary (copied into the existing list)
+                    if current_distance < best_distance:
+                        best_tour[:] = current_tour
+                        best_distance = current_distance
+
+            if len(thresholds) < MOVE_BLOCK_SIZE:
+                break  # Cooled down to min_temperature or reached max_iterations
+            move += len(thresholds)
 
         return best_tour
 
@@ -165,6 +248,12 @@ class AntColonyOptimizationTSPSolver(BaseTSPSolver):
         num_iterations: int = 100,
         convergence_threshold: float = 1e-6,
         patience: int = 10,
+        seed: int | None = None,
+        num_candidates: int = 20,
+        candidate_threshold: int = 2000,
+        arena: SolverArena | None = None,
+        heuristic_cache: HeuristicCache | None = default_heuristic_cache,
+        alias_tables: bool = True,
     ):
         """Initialize the Ant Colony Optimization TSP solver.
 
@@ -178,6 +267,22 @@ class AntColonyOptimizationTSPSolver(BaseTSPSolver):
             Q (float): Pheromone deposit factor.
             convergence_threshold (float): Minimum improvement threshold for convergence detection.
             patience (int): Number of iterations without improvement before stopping.
+            seed (int | None): Seed of the random stream, None for a random run.
+            num_candidates (int): Nearest neighbours per city in candidate-list mode.
+            candidate_threshold (int): Instances with more cities use candidate lists:
+                pheromone and visibility are only stored for candidate edges (n·k values
+                instead of a packed n(n+1)/2 triangle) and ants move to the nearest
+                unvisited city once all candidates of the current city are visited.
+            arena (SolverArena | None): Preallocated buffers reused by every
+                update_distance_matrix call (e.g. across a scale sweep), None to
+                allocate new arrays for each instance.
+            heuristic_cache (HeuristicCache | None): Cache of visibility^beta and of the
+                candidate lists shared by solvers working on the same matrix (by default
+                the module-wide cache); None to compute them for each instance, in the
+                arena buffers if there is an arena.
+            alias_tables (bool): In candidate-list mode, draw the next city from a per-city
+                alias table in O(1) (rebuilt only after the pheromone changed) instead of
+                a cumulative array over the open candidates.
         """
         super().__init__(distance_matrix)
         self.num_ants = num_ants
@@ -188,37 +293,94 @@ class AntColonyOptimizationTSPSolver(BaseTSPSolver):
         self.Q = Q
         self.convergence_threshold = convergence_threshold
         self.patience = patience
-        self.num_cities = len(distance_matrix)
-        
-        # Initialize pheromone matrix
-        self.pheromone = [[1.0 for _ in range(self.num_cities)] for _ in range(self.num_cities)]
-        
-        # Calculate heuristic information (visibility) matrix
-        self.visibility = self._calculate_visibility_matrix()
+        self.rng = RandomStream(seed)
+        self.num_candidates = num_candidates
+        self.candidate_threshold = candidate_threshold
+        self.arena = arena
+        self.heuristic_cache = heuristic_cache
+        self.alias_tables = alias_tables
+        # Incremented whenever the selection weights change; alias tables built for an older version are stale
+        self._weights_version = 0
+        self._initialize_matrices()
     
     def update_distance_matrix(self, distance_matrix: DistanceMatrix):
         """Update the distance matrix and reinitialize all dependent structures."""
         self.distance_matrix = distance_matrix
-        self.num_cities = len(distance_matrix)
-        
-        # Reinitialize pheromone matrix
-        self.pheromone = [[1.0 for _ in range(self.num_cities)] for _ in range(self.num_cities)]
-        
-        # Recalculate visibility matrix
-        self.visibility = self._calculate_visibility_matrix()
-
-    def _calculate_visibility_matrix(self) -> list[list[float]]:
-        """Calculate the visibility matrix (1/distance).
+        self._initialize_matrices()
+
+    @property
+    def uses_candidate_lists(self) -> bool:
+        """Whether the instance is large enough for candidate-list mode."""
+        return self.num_cities > self.candidate_threshold
+
+    def _buffer(self, name: str, size: int, capacity: int, dtype: np.dtype = np.float32) -> np.ndarray:
+        """View of an arena buffer, or a new array without an arena."""
+        if self.arena is None:
+            return np.empty(size, dtype=dtype)
+        return self.arena.array(name, size, capacity, dtype)
+
+    @property
+    def _max_dimension(self) -> int:
+        return self.arena.max_dimension if self.arena is not None else self.num_cities
+
+    def _initialize_matrices(self):
+        """Build the candidate lists (if used), the pheromone store and the heuristic store."""
+        self.num_cities = len(self.distance_matrix)
+        if self.arena is not None:
+            self.arena.check_dimension(self.num_cities)
+        self._fingerprint = None
+        if self.heuristic_cache is not None:
+            self._fingerprint = matrix_fingerprint(self.distance_matrix)
+        self.candidates = None
+        if self.uses_candidate_lists:
+            shape = (self.num_cities, candidate_count(self.num_cities, self.num_candidates))
+            size, capacity = shape[0] * shape[1], self._max_dimension * shape[1]
+            if self.heuristic_cache is not None:
+                self.candidates = self.heuristic_cache.candidates(
+                    self._fingerprint, self.distance_matrix, self.num_candidates
+                )
+            else:
+                self.candidates = nearest_candidates(
+                    self.distance_matrix, self.num_candidates,
+                    out=self._buffer('aco_candidates', size, capacity, np.int64).reshape(shape)
+                )
+            self.pheromone = CandidateEdgeMatrix(
+                self.candidates, fill_value=1.0, default=1.0,
+                values=self._buffer('aco_pheromone', size, capacity).reshape(shape)
+            )
+        else:
+            # Dense buffers never need room for instances beyond the candidate threshold
+            size = packed_size(self.num_cities)
+            capacity = packed_size(min(self._max_dimension, self.candidate_threshold))
+            self.pheromone = PackedSymmetricMatrix(
+                self.num_cities, fill_value=1.0, data=self._buffer('aco_pheromone_packed', size, capacity)
+            )
+        self.heuristic = self._calculate_heuristic_matrix()
+        self._alias = None
+        if self.candidates is not None and self.alias_tables:
+            self._alias = AliasTables(*self.candidates.shape)
+
+    def _calculate_heuristic_matrix(self) -> PackedSymmetricMatrix | CandidateEdgeMatrix:
+        """Calculate the heuristic matrix visibility^beta = (1/distance)^beta.
+
+        It is taken from the heuristic cache when the same matrix was seen with the
+        same beta, so the roulette never raises the visibility to beta itself.
         
         Returns:
-            list[list[float]]: Visibility matrix where visibility[i][j] = 1/distance[i][j].
+            PackedSymmetricMatrix | CandidateEdgeMatrix: Store where heuristic.get(i, j) =
+                (1/distance[i][j])^beta (candidate edges only in candidate-list mode).
         """
-        visibility = [[0.0 for _ in range(self.num_cities)] for _ in range(self.num_cities)]
-        for i in range(self.num_cities):
-            for j in range(self.num_cities):
-                if i != j and self.distance_matrix[i][j] > 0:
-                    visibility[i][j] = 1.0 / self.distance_matrix[i][j]
-        return visibility
+        self._heuristic_beta = self.beta
+        self._weights_version += 1
+        if self.heuristic_cache is not None:
+            return self.heuristic_cache.heuristic(self._fingerprint, self.distance_matrix, self.beta, self.candidates)
+        if self.candidates is not None:
+            shape = self.candidates.shape
+            values = self._buffer('aco_visibility', shape[0] * shape[1], self._max_dimension * shape[1])
+            return heuristic_matrix(self.distance_matrix, self.beta, self.candidates, values.reshape(shape))
+        data = self._buffer('aco_visibility_packed', packed_size(self.num_cities),
+                            packed_size(min(self._max_dimension, self.candidate_threshold)))
+        return heuristic_matrix(self.distance_matrix, self.beta, buffer=data)
 
     def calculate_tour_distance(self, tour: list[int]) -> float:
         """Calculate the total distance of a tour.
@@ -236,47 +398,70 @@ class AntColonyOptimizationTSPSolver(BaseTSPSolver):
             total_distance += self.distance_matrix[from_city][to_city]
         return total_distance
 
-    def _select_next_city(self, current_city: int, unvisited_cities: list[int]) -> int:
+    def _select_next_city(self, current_city: int, unvisited: np.ndarray) -> int:
         """Select the next city for an ant to visit based on pheromone and heuristic information.
 
         Args:
             current_city (int): Current city index.
-            unvisited_cities (list[int]): List of unvisited city indices.
+            unvisited (np.ndarray): Boolean mask of the unvisited cities.
 
         Returns:
             int: Index of the next city to visit.
         """
-        if not unvisited_cities:
+        if self.candidates is not None:
+            candidates = self.candidates[current_city]
+            if self._alias is not None and len(candidates):
+                next_city = self._alias_draw(current_city, candidates, unvisited)
+                if next_city >= 0:
+                    return next_city
+            open_candidates = unvisited[candidates]
+            if open_candidates.any():
+                pheromone = self.pheromone.values[current_city, open_candidates]
+                heuristic = self.heuristic.values[current_city, open_candidates]
+                return self._roulette(candidates[open_candidates], pheromone, heuristic)
+            # Every candidate is visited: move to the nearest unvisited city
+            cities = np.flatnonzero(unvisited)
+            if not len(cities):
+                return current_city
+            distances = np.asarray(self.distance_matrix[current_city], dtype=np.float64)[cities]
+            return int(cities[np.argmin(distances)])
+
+        cities = unvisited.nonzero()[0]
+        if not len(cities):
             return current_city
+        # Pheromone and heuristic share the packed layout
+        positions = self.pheromone.row_index(current_city, cities)
+        return self._roulette(cities, self.pheromone.data[positions], self.heuristic.data[positions])
 
-        # Calculate probabilities for each unvisited city
-        probabilities = []
-        total_probability = 0.0
+    def _alias_draw(self, current_city: int, candidates: np.ndarray, unvisited: np.ndarray) -> int:
+        """Draw a candidate from the alias table of the current city, rejecting visited ones.
 
-        for city in unvisited_cities:
-            pheromone_factor = self.pheromone[current_city][city] ** self.alpha
-            visibility_factor = self.visibility[current_city][city] ** self.beta
-            probability = pheromone_factor * visibility_factor
-            probabilities.append(probability)
-            total_probability += probability
+        Rejection keeps the draw proportional to the weights of the open candidates.
 
-        # Normalize probabilities
-        if total_probability > 0:
-            probabilities = [p / total_probability for p in probabilities]
-        else:
+        Returns:
+            int: The drawn city, or -1 after ALIAS_ATTEMPTS visited draws.
+        """
+        if not self._alias.is_current(current_city, self._weights_version):
+            pheromone = self.pheromone.values[current_city]
+            weights = (pheromone if self.alpha == 1.0 else pheromone ** self.alpha) * self.heuristic.values[current_city]
+            self._alias.build(current_city, weights, self._weights_version)
+        for _ in range(ALIAS_ATTEMPTS):
+            next_city = int(candidates[self._alias.draw(current_city, self.rng.random())])
+            if unvisited[next_city]:
+                return next_city
+        return -1
+
+    def _roulette(self, cities: np.ndarray, pheromone: np.ndarray, heuristic: np.ndarray) -> int:
+        """Draw one of the cities with probability proportional to pheromone^alpha * heuristic.
+
+        The cumulative weights are built once and searched by bisection.
+        """
+        pheromone_factor = pheromone if self.alpha == 1.0 else pheromone ** self.alpha
+        index = cumulative_choice(pheromone_factor * heuristic, self.rng.random())
+        if index < 0:
             # If all probabilities are 0, choose randomly
-            probabilities = [1.0 / len(unvisited_cities) for _ in unvisited_cities]
-
-        # Select city based on probabilities (roulette wheel selection)
-        rand = random.random()
-        cumulative_probability = 0.0
-        for i, probability in enumerate(probabilities):
-            cumulative_probability += probability
-            if rand <= cumulative_probability:
-                return unvisited_cities[i]
-
-        # Fallback: return the last city
-        return unvisited_cities[-1]
+            return int(cities[self.rng.randrange(len(cities))])
+        return int(cities[index])
 
     def _construct_ant_tour(self) -> list[int]:
         """Construct a tour for a single ant starting from city 0.
@@ -285,13 +470,14 @@ class AntColonyOptimizationTSPSolver(BaseTSPSolver):
             list[int]: A tour constructed by the ant.
         """
         tour = [0]  # Start from city 0 (A)
-        unvisited_cities = list(range(1, self.num_cities))
+        unvisited = self._buffer('aco_unvisited', self.num_cities, self._max_dimension, bool)
+        unvisited.fill(True)
+        unvisited[:1] = False
 
-        while unvisited_cities:
-            current_city = tour[-1]
-            next_city = self._select_next_city(current_city, unvisited_cities)
+        for _ in range(self.num_cities - 1):
+            next_city = self._select_next_city(tour[-1], unvisited)
             tour.append(next_city)
-            unvisited_cities.remove(next_city)
+            unvisited[next_city] = False
 
         return tour
 
@@ -303,19 +489,14 @@ class AntColonyOptimizationTSPSolver(BaseTSPSolver):
             ant_distances (list[float]): List of distances for each ant tour.
         """
         # Evaporation
-        for i in range(self.num_cities):
-            for j in range(self.num_cities):
-                self.pheromone[i][j] *= (1.0 - self.evaporation_rate)
+        self.pheromone.scale(1.0 - self.evaporation_rate)
 
-        # Pheromone deposit
+        # Pheromone deposit (the stores are symmetric)
         for tour, distance in zip(ant_tours, ant_distances):
             if distance > 0:
-                pheromone_deposit = self.Q / distance
-                for i in range(len(tour)):
-                    from_city = tour[i]
-                    to_city = tour[(i + 1) % len(tour)]
-                    self.pheromone[from_city][to_city] += pheromone_deposit
-                    self.pheromone[to_city][from_city] += pheromone_deposit  # Symmetric
+                from_cities = np.asarray(tour)
+                self.pheromone.deposit(from_cities, np.roll(from_cities, -1), self.Q / distance)
+        self._weights_version += 1
 
     def _check_convergence(self, best_distances_history: list[float], window_size: int = 5) -> bool:
         """检查算法是否收敛（基于最近几次迭代的改进幅度）
@@ -343,6 +524,10 @@ class AntColonyOptimizationTSPSolver(BaseTSPSolver):
         Returns:
             list[int]: A list of city indices representing the best tour found.
         """
+        if self._heuristic_beta != self.beta:  # beta was changed since the matrix was set
+            self.heuristic = self._calculate_heuristic_matrix()
+        self._weights_version += 1  # alpha may have changed as well
+
         best_tour = []
         best_distance = float('inf')
         previous_best_distance = float('inf')
@@ -1,20 +1,31 @@
-import random
-import math
 import time
-from typing import List, Tuple, Dict, Optional, Any
-from dataclasses import dataclass
+from typing import List, Tuple, Dict, Optional, Any, Union
 
+import numpy as np
 
-@dataclass
-class Customer:
-    """客户点信息"""
-    id: int
-    x: float
-    y: float
-    demand: int
-    ready_time: int
-    due_time: int
-    service_time: int
+from smart_decision_miniproject.solver.rng import RandomStream, substream
+from smart_decision_miniproject.solver.vrp_construction import clarke_wright_savings, randomized_clarke_wright_savings
+from smart_decision_miniproject.solver.vrp_crossover import PermutationCrossover
+from smart_decision_miniproject.solver.vrp_customers import Customer, CustomerTable
+from smart_decision_miniproject.solver.vrp_fitness_cache import FitnessCache, canonical_solution_key, tour_key
+from smart_decision_miniproject.solver.vrp_insertion import InsertionCache
+from smart_decision_miniproject.solver.vrp_local_search import GranularLocalSearch
+from smart_decision_miniproject.solver.vrp_parallel import ParallelBreeder
+from smart_decision_miniproject.solver.vrp_population import RoutePopulation
+from smart_decision_miniproject.solver.vrp_route_metrics import RouteMetrics
+from smart_decision_miniproject.solver.vrp_solomon import (
+    SolomonInstance,
+    SolomonInstanceCache,
+    default_instance_cache,
+    parse_solomon_columns,
+)
+from smart_decision_miniproject.solver.vrp_split import routes_to_giant_tour, split_giant_tour
+from smart_decision_miniproject.solver.vrp_state import SolutionState
+from smart_decision_miniproject.solver.vrp_time_windows import TimeWindows
+from smart_decision_miniproject.solver.vrp_warm_start import perturb_solution, repair_solution
+
+# 热启动时 ALNS 在多少次迭代没有找到更优解后停止（小改动的实例通常很快收敛）
+WARM_START_ALNS_PATIENCE = 1000
 
 
 class SolomonDataParser:
@@ -24,80 +35,206 @@ class SolomonDataParser:
     def parse_solomon_file(file_content: str) -> Tuple[List[Customer], Dict[str, int]]:
         """解析Solomon格式的VRP数据文件
         
+        车辆信息与客户数据表头只查找一次，客户数据块一次性解析为NumPy数组。
+        
         Args:
             file_content: 文件内容字符串
             
         Returns:
             Tuple[List[Customer], Dict[str, int]]: 客户列表和参数字典
         """
-        lines = file_content.strip().split('\n')
-        customers = []
-        params = {}
+        return SolomonDataParser._to_customers(parse_solomon_columns(file_content))
+    
+    @staticmethod
+    def load_solomon_file(file_content: str,
+                          cache: Optional[SolomonInstanceCache] = None) -> Tuple[List[Customer], Dict[str, int]]:
+        """与parse_solomon_file相同，但按文件内容哈希缓存解析结果
         
-        # 解析文件头信息
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if not line:
-                continue
-                
-            # 查找车辆数量和容量信息
-            if 'NUMBER' in line.upper() and 'CAPACITY' in line.upper():
-                parts = line.split()
-                if len(parts) >= 4:
-                    params['num_vehicles'] = int(parts[1])
-                    params['vehicle_capacity'] = int(parts[3])
+        默认缓存只保存在内存中；设置环境变量SMART_DECISION_CACHE_DIR后，
+        解析结果同时以.npz文件写入该目录，可跨进程复用。
+        
+        Args:
+            file_content: 文件内容字符串
+            cache: 实例缓存，默认使用模块级共享缓存
             
-            # 查找客户数据开始位置 - 更灵活的匹配
-            if ('CUST NO.' in line.upper() or 'XCOORD' in line.upper() or 
-                'CUSTOMER' in line.upper() or line.upper().startswith('CUST')):
-                # 从下一行开始解析客户数据
-                for j in range(i + 1, len(lines)):
-                    customer_line = lines[j].strip()
-                    if not customer_line:
-                        continue
-                    
-                    # 跳过空行和非数字开头的行
-                    if not customer_line[0].isdigit():
-                        continue
-                    
-                    # 解析客户数据，去除多余空格
-                    parts = customer_line.split()
-                    if len(parts) >= 7:
-                        try:
-                            customer = Customer(
-                                id=int(parts[0]),
-                                x=float(parts[1]),
-                                y=float(parts[2]),
-                                demand=int(parts[3]),
-                                ready_time=int(parts[4]),
-                                due_time=int(parts[5]),
-                                service_time=int(parts[6])
-                            )
-                            customers.append(customer)
-                        except (ValueError, IndexError) as e:
-                            print(f"警告: 跳过无效的客户数据行: {customer_line} - {e}")
-                            continue
-                break
+        Returns:
+            Tuple[List[Customer], Dict[str, int]]: 客户列表和参数字典
+        """
+        table, params = SolomonDataParser.load_customer_table(file_content, cache)
+        return table.to_list(), params
+    
+    @staticmethod
+    def load_customer_table(file_content: str,
+                            cache: Optional[SolomonInstanceCache] = None) -> Tuple[CustomerTable, Dict[str, int]]:
+        """读取（并缓存）Solomon文件，以列式客户表返回，不创建逐个客户对象
         
-        # 设置默认参数
-        if 'num_vehicles' not in params:
-            params['num_vehicles'] = max(1, len(customers) // 10)  # 默认车辆数
-        if 'vehicle_capacity' not in params:
-            params['vehicle_capacity'] = 200  # 默认容量
+        Args:
+            file_content: 文件内容字符串
+            cache: 实例缓存，默认使用模块级共享缓存
             
-        return customers, params
+        Returns:
+            Tuple[CustomerTable, Dict[str, int]]: 客户表和参数字典
+        """
+        instance = (cache or default_instance_cache).load(file_content)
+        return CustomerTable(instance.columns), instance.params
+    
+    @staticmethod
+    def _to_customers(instance: SolomonInstance) -> Tuple[List[Customer], Dict[str, int]]:
+        """将列数组转换为Customer列表"""
+        return CustomerTable(instance.columns).to_list(), instance.params
 
 
 class VRPResult:
     """VRP求解结果"""
     
     def __init__(self, routes: List[List[int]], total_distance: float, 
-                 customers: List[Customer], solve_time: float = 0.0):
+                 customers: Union[CustomerTable, List[Customer]], solve_time: float = 0.0,
+                 vehicle_capacity: Optional[float] = None, num_vehicles: Optional[int] = None,
+                 time_windows: Optional[TimeWindows] = None,
+                 distance_matrix: Optional[List[List[float]]] = None,
+                 stop_reason: Optional[str] = None):
+        """
+        Args:
+            routes: 路径列表（客户在 customers 中的索引）
+            total_distance: 总距离
+            customers: 客户表或客户列表（0号为仓库），列表会转换为列式客户表
+            solve_time: 求解时间（秒）
+            vehicle_capacity: 车辆容量，动态插入/删除客户时需要
+            num_vehicles: 可用车辆数，None表示不限制
+            time_windows: 时间窗数据，None表示只考虑容量约束
+            distance_matrix: 距离矩阵，省略时由客户坐标计算
+            stop_reason: 求解器停止的原因（如 'converged'、'time_limit'）
+        """
         self.routes = routes
         self.total_distance = total_distance
+        if not isinstance(customers, CustomerTable):
+            customers = CustomerTable.from_customers(customers)
         self.customers = customers
         self.solve_time = solve_time
         self.num_vehicles_used = len([r for r in routes if r])
+        self.vehicle_capacity = vehicle_capacity
+        self.num_vehicles = num_vehicles
+        self.time_windows = time_windows
+        self.distance_matrix = distance_matrix
+        self.stop_reason = stop_reason
+        self._insertion_cache: Optional[InsertionCache] = None
+    
+    @property
+    def routes(self) -> List[List[int]]:
+        """路径列表；整体赋值会使缓存的路径指标失效"""
+        return self._routes
+    
+    @routes.setter
+    def routes(self, routes: List[List[int]]) -> None:
+        self._routes = routes
+        self._route_metrics: Optional[RouteMetrics] = None
+    
+    @property
+    def route_metrics(self) -> RouteMetrics:
+        """各非空路径的距离、载重、时长与时间窗余量（首次访问时一次性向量化计算并缓存）"""
+        if self._route_metrics is None:
+            if self.distance_matrix is not None:
+                distance_matrix = np.asarray(self.distance_matrix, dtype=float)
+            else:
+                distance_matrix = self.customers.distance_matrix()
+            self._route_metrics = RouteMetrics(
+                [route for route in self.routes if route], distance_matrix,
+                self.customers.demand.astype(float), self.customers.service_time.astype(float),
+                self.time_windows
+            )
+        return self._route_metrics
+    
+    def _dynamic_cache(self) -> InsertionCache:
+        """创建（或返回）动态更新所用的插入缓存"""
+        if self._insertion_cache is None:
+            if self.vehicle_capacity is None:
+                raise ValueError("Dynamic updates need the vehicle capacity of the instance")
+            if self.distance_matrix is None:
+                self.distance_matrix = self.customers.distance_matrix().tolist()
+            elif not isinstance(self.distance_matrix, list):
+                self.distance_matrix = np.asarray(self.distance_matrix, dtype=float).tolist()
+            if self.time_windows is not None and not isinstance(self.time_windows.travel_times, list):
+                self.time_windows.travel_times = np.asarray(self.time_windows.travel_times, dtype=float).tolist()
+            self._demands = self.customers.demand.astype(float).tolist()
+            self.routes = [route for route in self.routes if route]
+            self._insertion_cache = InsertionCache(
+                self.routes, self.distance_matrix, self._demands, self.vehicle_capacity,
+                self.num_vehicles, 0, self.time_windows
+            )
+        return self._insertion_cache
+    
+    def add_customers(self, new_customers: List[Customer], polish: bool = False) -> List[int]:
+        """将新订单插入现有方案（最便宜插入），无需重新求解
+        
+        Args:
+            new_customers: 新客户
+            polish: 插入后是否用局部搜索优化整个方案
+            
+        Returns:
+            新客户在 customers 中的索引；无法插入的客户见 unassigned_customers
+        """
+        cache = self._dynamic_cache()
+        indices = []
+        for customer in new_customers:
+            index = len(self.customers)
+            self.customers.append(customer)
+            distances = np.hypot(self.customers.x - customer.x, self.customers.y - customer.y).tolist()
+            for row, distance in zip(self.distance_matrix, distances):
+                row.append(distance)
+            self.distance_matrix.append(distances)
+            self._demands.append(float(customer.demand))
+            if self.time_windows is not None:
+                self.time_windows.ready_times.append(float(customer.ready_time))
+                self.time_windows.due_times.append(float(customer.due_time))
+                self.time_windows.service_times.append(float(customer.service_time))
+                travel_times = self.time_windows.travel_times
+                if travel_times is not self.distance_matrix:  # 新客户的行驶时间同样按坐标距离计算
+                    for row, distance in zip(travel_times, distances):
+                        row.append(distance)
+                    travel_times.append(list(distances))
+            cache.add(index)
+            indices.append(index)
+        
+        self.total_distance += cache.insert_pending()
+        self._routes_changed(polish)
+        return indices
+    
+    def remove_customers(self, indices: List[int], polish: bool = False) -> None:
+        """从现有方案中删除客户（取消的订单）
+        
+        释放的容量会用于插入此前无法安排的客户。
+        
+        Args:
+            indices: 客户在 customers 中的索引
+            polish: 删除后是否用局部搜索优化整个方案
+        """
+        cache = self._dynamic_cache()
+        pending = set(cache.pending)
+        for index in indices:
+            if index in pending:
+                cache.discard(index)
+            else:
+                self.total_distance -= cache.remove(index)
+        
+        self.total_distance += cache.insert_pending()
+        self._routes_changed(polish)
+    
+    @property
+    def unassigned_customers(self) -> List[int]:
+        """因容量、时间窗或车辆数限制尚未安排的客户"""
+        return self._insertion_cache.pending if self._insertion_cache is not None else []
+    
+    def _routes_changed(self, polish: bool) -> None:
+        """路径更新后的收尾：可选的局部搜索优化与统计更新"""
+        if polish and self.routes:
+            local_search = GranularLocalSearch(
+                self.distance_matrix, self._demands, self.vehicle_capacity, 0, self.time_windows
+            )
+            self.routes[:] = local_search.improve(self.routes)
+            self._insertion_cache.refresh()
+            self.total_distance = local_search.solution_cost(self.routes)
+        self.num_vehicles_used = len([r for r in self.routes if r])
+        self._route_metrics = None  # 路径已原地修改
     
     def get_statistics(self) -> Dict[str, Any]:
         """获取求解统计信息"""
@@ -107,12 +244,14 @@ class VRPResult:
                 'total_distance': 0.0,
                 'total_customers': 0,
                 'average_route_length': 0.0,
-                'solve_time': self.solve_time
+                'solve_time': self.solve_time,
+                'stop_reason': self.stop_reason
             }
         
         active_routes = [r for r in self.routes if r]
         route_lengths = [len(route) for route in active_routes]
         total_customers = sum(route_lengths)
+        metrics = self.route_metrics.as_records()
         
         return {
             'num_vehicles_used': self.num_vehicles_used,
@@ -120,50 +259,21 @@ class VRPResult:
             'total_customers': total_customers,
             'average_route_length': round(total_customers / self.num_vehicles_used, 2) if self.num_vehicles_used > 0 else 0,
             'solve_time': round(self.solve_time, 3),
+            'stop_reason': self.stop_reason,
             'routes_details': [
                 {
                     'route_id': i + 1,
                     'customers': route,
                     'num_customers': len(route),
-                    'route_distance': round(self._calculate_route_distance(route), 2),
-                    'total_demand': sum(self.customers[j].demand for j in route) if route else 0
+                    'route_distance': round(metric['distance'], 2),
+                    'total_demand': int(metric['load']),
+                    'route_duration': round(metric['duration'], 2),
+                    'time_window_slack': round(metric['slack'], 2) if metric['slack'] is not None else None
                 }
-                for i, route in enumerate(active_routes)
+                for i, (route, metric) in enumerate(zip(active_routes, metrics))
             ]
         }
     
-    def _calculate_route_distance(self, route: List[int]) -> float:
-        """计算单条路径的距离"""
-        if not route:
-            return 0.0
-            
-        total_distance = 0.0
-        # 从仓库到第一个客户
-        if route:
-            depot = self.customers[0]
-            first_customer = self.customers[route[0]]
-            dx = depot.x - first_customer.x
-            dy = depot.y - first_customer.y
-            total_distance += math.sqrt(dx * dx + dy * dy)
-        
-        # 客户之间的距离
-        for i in range(len(route) - 1):
-            customer_i = self.customers[route[i]]
-            customer_j = self.customers[route[i + 1]]
-            dx = customer_i.x - customer_j.x
-            dy = customer_i.y - customer_j.y
-            total_distance += math.sqrt(dx * dx + dy * dy)
-        
-        # 从最后一个客户回到仓库
-        if route:
-            last_customer = self.customers[route[-1]]
-            depot = self.customers[0]
-            dx = last_customer.x - depot.x
-            dy = last_customer.y - depot.y
-            total_distance += math.sqrt(dx * dx + dy * dy)
-            
-        return total_distance
-    
     def to_dict(self) -> Dict[str, Any]:
         """将结果转换为字典格式"""
         return {
@@ -171,6 +281,7 @@ class VRPResult:
             'total_distance': self.total_distance,
             'num_vehicles_used': self.num_vehicles_used,
             'solve_time': self.solve_time,
+            'stop_reason': self.stop_reason,
             'statistics': self.get_statistics()
         }
 
@@ -184,7 +295,8 @@ class BaseVRPSolver:
         demands: List[float],
         vehicle_capacity: float,
         num_vehicles: int,
-        depot_index: int = 0
+        depot_index: int = 0,
+        time_windows: Optional[TimeWindows] = None
     ):
         """Initialize the VRP solver.
         
@@ -194,14 +306,58 @@ class BaseVRPSolver:
             vehicle_capacity: Maximum capacity for each vehicle
             num_vehicles: Number of available vehicles
             depot_index: Index of the depot (default: 0)
+            time_windows: Time windows and service times for VRPTW instances,
+                None to solve the capacitated VRP only
         """
         self.distance_matrix = distance_matrix
         self.demands = demands
         self.vehicle_capacity = vehicle_capacity
         self.num_vehicles = num_vehicles
         self.depot_index = depot_index
+        self.time_windows = time_windows
         self.num_customers = len(distance_matrix) - 1  # Excluding depot
         self.num_locations = len(distance_matrix)
+        # Why the last solve_vrp run ended, for solvers that can stop early
+        self.stop_reason: Optional[str] = None
+
+    def calculate_route_distance(self, route: List[int]) -> float:
+        """Calculate the total distance of a route including depot visits.
+        
+        Args:
+            route: List of customer indices in the route
+            
+        Returns:
+            Total distance of the route
+        """
+        if not route:
+            return 0.0
+            
+        total_distance = 0.0
+        # Distance from depot to first customer
+        total_distance += self.distance_matrix[self.depot_index][route[0]]
+        
+        # Distance between consecutive customers
+        for i in range(len(route) - 1):
+            total_distance += self.distance_matrix[route[i]][route[i + 1]]
+        
+        # Distance from last customer back to depot
+        total_distance += self.distance_matrix[route[-1]][self.depot_index]
+        
+        return total_distance
+
+    def calculate_solution_fitness(self, solution: List[List[int]]) -> float:
+        """Calculate the fitness of a solution (lower is better).
+        
+        Args:
+            solution: List of routes
+            
+        Returns:
+            Total distance of all routes
+        """
+        total_distance = 0.0
+        for route in solution:
+            total_distance += self.calculate_route_distance(route)
+        return total_distance
 
     def solve_vrp(self) -> List[List[int]]:
         """Solve the Vehicle Routing Problem.
@@ -226,7 +382,23 @@ class GeneticAlgorithmVRPSolver(BaseVRPSolver):
         num_generations: int = 500,
         mutation_rate: float = 0.02,
         crossover_rate: float = 0.8,
-        elite_ratio: float = 0.1
+        elite_ratio: float = 0.1,
+        encoding: str = 'giant_tour',
+        crossover_operator: str = 'ox',
+        time_windows: Optional[TimeWindows] = None,
+        seed: Optional[int] = None,
+        num_workers: int = 1,
+        chunk_size: int = 8,
+        savings_ratio: float = 0.1,
+        local_search_rate: float = 0.0,
+        fitness_cache_size: int = 10000,
+        deduplicate: bool = True,
+        patience: Optional[int] = None,
+        convergence_threshold: float = 1e-6,
+        time_limit: Optional[float] = None,
+        target_fitness: Optional[float] = None,
+        warm_start_routes: Optional[List[List[int]]] = None,
+        warm_start_ratio: float = 0.2
     ):
         """Initialize the Genetic Algorithm VRP solver.
         
@@ -241,53 +413,105 @@ class GeneticAlgorithmVRPSolver(BaseVRPSolver):
             mutation_rate: Probability of mutation
             crossover_rate: Probability of crossover
             elite_ratio: Ratio of elite individuals to preserve
+            encoding: Chromosome representation, either 'giant_tour' (flat
+                customer permutations decoded by Split) or 'routes' (lists of routes)
+            crossover_operator: Giant-tour crossover, one of 'ox' (order),
+                'pmx' (partially mapped) or 'erx' (edge recombination)
+            time_windows: Time windows and service times for VRPTW instances
+            seed: Seed of the random number generator, None for a random run
+            num_workers: Number of processes breeding giant-tour offspring
+                (1 runs everything in the current process)
+            chunk_size: Number of parent pairs per breeding task; each chunk
+                gets its own RNG stream, so results do not depend on num_workers
+            savings_ratio: Share of the initial population built with the
+                Clarke-Wright savings heuristic (one deterministic solution,
+                the rest randomized); the remainder is random
+            local_search_rate: Probability that an offspring is educated by
+                granular local search before it is scored
+            fitness_cache_size: Number of fitness values kept in the LRU
+                cache (0 disables it)
+            deduplicate: Replace offspring identical to an individual already
+                in the next population by a fresh random individual
+            patience: Stop after this many generations in a row improving the
+                best fitness by less than ``convergence_threshold`` (None: never)
+            convergence_threshold: Minimum improvement that resets the patience counter
+            time_limit: Wall-clock budget in seconds (None: no limit)
+            target_fitness: Stop as soon as the best fitness reaches this value
+            warm_start_routes: Previous solution (e.g. for other parameters) that
+                is repaired and seeded into the initial population
+            warm_start_ratio: Share of the initial population made of the
+                repaired warm start and its perturbations
         """
-        super().__init__(distance_matrix, demands, vehicle_capacity, num_vehicles, depot_index)
+        super().__init__(distance_matrix, demands, vehicle_capacity, num_vehicles, depot_index, time_windows)
+        if encoding not in ('giant_tour', 'routes'):
+            raise ValueError(f"Unknown encoding: {encoding}")
+        if crossover_operator not in ('ox', 'pmx', 'erx'):
+            raise ValueError(f"Unknown crossover operator: {crossover_operator}")
+        if not 0.0 <= savings_ratio <= 1.0:
+            raise ValueError(f"savings_ratio must be between 0 and 1, got {savings_ratio}")
+        if not 0.0 <= warm_start_ratio <= 1.0:
+            raise ValueError(f"warm_start_ratio must be between 0 and 1, got {warm_start_ratio}")
         self.population_size = population_size
         self.num_generations = num_generations
         self.mutation_rate = mutation_rate
         self.crossover_rate = crossover_rate
         self.elite_ratio = elite_ratio
         self.elite_size = int(population_size * elite_ratio)
+        self.encoding = encoding
+        self.crossover_operator = crossover_operator
+        self.crossover = PermutationCrossover(self.num_locations)
+        # Reusable outputs of the crossover operators, one per child
+        self._child_buffers = ([0] * self.num_customers, [0] * self.num_customers)
+        self.seed = seed
+        self.rng = RandomStream(seed)
+        self.num_workers = num_workers
+        self.chunk_size = chunk_size
+        self.savings_ratio = savings_ratio
+        self.local_search_rate = local_search_rate
+        self._distance_array: Optional[np.ndarray] = None
+        # Array store of the solutions scored by evaluate_population, reused across generations
+        self._route_store: Optional[RoutePopulation] = None
+        self.fitness_cache = FitnessCache(fitness_cache_size)
+        self.deduplicate = deduplicate
+        self.duplicates_replaced = 0
+        self.patience = patience
+        self.convergence_threshold = convergence_threshold
+        self.time_limit = time_limit
+        self.target_fitness = target_fitness
+        self.warm_start_routes = warm_start_routes
+        self.warm_start_ratio = warm_start_ratio
+        self.local_search = None
+        if local_search_rate > 0:
+            self.local_search = GranularLocalSearch(
+                distance_matrix, demands, vehicle_capacity, depot_index, time_windows
+            )
 
-    def calculate_route_distance(self, route: List[int]) -> float:
-        """Calculate the total distance of a route including depot visits.
+    def evaluate_population(self, solutions: List[List[List[int]]]) -> List[float]:
+        """Calculate the fitness of many solutions with one vectorized pass.
         
-        Args:
-            route: List of customer indices in the route
-            
-        Returns:
-            Total distance of the route
-        """
-        if not route:
-            return 0.0
-            
-        total_distance = 0.0
-        # Distance from depot to first customer
-        total_distance += self.distance_matrix[self.depot_index][route[0]]
-        
-        # Distance between consecutive customers
-        for i in range(len(route) - 1):
-            total_distance += self.distance_matrix[route[i]][route[i + 1]]
-        
-        # Distance from last customer back to depot
-        total_distance += self.distance_matrix[route[-1]][self.depot_index]
-        
-        return total_distance
-
-    def calculate_solution_fitness(self, solution: List[List[int]]) -> float:
-        """Calculate the fitness of a solution (lower is better).
+        The solutions are written into the leading rows of a RoutePopulation
+        kept across calls (and generations) and their distances gathered from
+        the NumPy distance matrix at once.
         
         Args:
-            solution: List of routes
+            solutions: Solutions visiting every customer
             
         Returns:
-            Total distance of all routes
+            Fitness of each solution
         """
-        total_distance = 0.0
-        for route in solution:
-            total_distance += self.calculate_route_distance(route)
-        return total_distance
+        store = self._route_store
+        if store is None or len(store) < len(solutions) or store.tours.shape[1] != self.num_customers:
+            size = max(len(solutions), self.population_size)
+            store = self._route_store = RoutePopulation.empty(size, self.num_customers)
+        for row, routes in enumerate(solutions):
+            store.set_solution(row, routes)
+        return store.head(len(solutions)).distances(self._numpy_distances(), self.depot_index).tolist()
+
+    def _numpy_distances(self) -> np.ndarray:
+        """The distance matrix as a float64 array, converted on first use."""
+        if self._distance_array is None:
+            self._distance_array = np.asarray(self.distance_matrix, dtype=np.float64)
+        return self._distance_array
 
     def is_solution_feasible(self, solution: List[List[int]]) -> bool:
         """Check if a solution is feasible (capacity constraints).
@@ -317,6 +541,10 @@ class GeneticAlgorithmVRPSolver(BaseVRPSolver):
             route_demand = sum(self.demands[customer] for customer in route)
             if route_demand > self.vehicle_capacity:
                 return False
+        
+        # Check time windows
+        if self.time_windows is not None:
+            return all(self.time_windows.is_route_feasible(route) for route in solution)
                 
         return True
 
@@ -326,9 +554,13 @@ class GeneticAlgorithmVRPSolver(BaseVRPSolver):
         Returns:
             Random solution as list of routes
         """
+        if self.time_windows is not None:
+            # Greedy packing ignores time windows; let Split cut a random tour instead
+            return self.decode_giant_tour(self.generate_random_giant_tour())[1]
+        
         # Get all customers (excluding depot)
         customers = [i for i in range(self.num_locations) if i != self.depot_index]
-        random.shuffle(customers)
+        self.rng.shuffle(customers)
         
         routes = []
         current_route = []
@@ -352,17 +584,16 @@ class GeneticAlgorithmVRPSolver(BaseVRPSolver):
             routes.append(current_route)
         
         # If we have more routes than vehicles, merge some routes
+        loads = [sum(self.demands[c] for c in route) for route in routes]
         while len(routes) > self.num_vehicles and len(routes) > 1:
             # Find two routes that can be merged
             merged = False
             for i in range(len(routes)):
                 for j in range(i + 1, len(routes)):
-                    total_demand = (sum(self.demands[c] for c in routes[i]) + 
-                                  sum(self.demands[c] for c in routes[j]))
-                    if total_demand <= self.vehicle_capacity:
+                    if loads[i] + loads[j] <= self.vehicle_capacity:
                         # Merge routes j into i
-                        routes[i].extend(routes[j])
-                        routes.pop(j)
+                        routes[i].extend(routes.pop(j))
+                        loads[i] += loads.pop(j)
                         merged = True
                         break
                 if merged:
@@ -373,18 +604,188 @@ class GeneticAlgorithmVRPSolver(BaseVRPSolver):
         
         return routes
 
+    def generate_savings_solutions(self, count: int) -> List[List[List[int]]]:
+        """Build solutions with the Clarke-Wright savings heuristic.
+        
+        The first solution is the deterministic savings solution, the others
+        use a random shape parameter and noisy savings for diversity.
+        
+        Args:
+            count: Number of solutions to build
+            
+        Returns:
+            List of solutions
+        """
+        solutions = []
+        for i in range(count):
+            if i == 0:
+                routes = clarke_wright_savings(
+                    self.distance_matrix, self.demands, self.vehicle_capacity,
+                    self.depot_index, time_windows=self.time_windows
+                )
+            else:
+                routes = randomized_clarke_wright_savings(
+                    self.distance_matrix, self.demands, self.vehicle_capacity,
+                    self.depot_index, rng=self.rng, time_windows=self.time_windows
+                )
+            solutions.append(routes)
+        return solutions
+
+    def _num_savings_seeds(self) -> int:
+        """Number of initial individuals built with the savings heuristic."""
+        if self.num_locations <= 1:
+            return 0
+        return min(self.population_size, round(self.population_size * self.savings_ratio))
+
+    def generate_warm_start_solutions(self) -> List[List[List[int]]]:
+        """Repair the warm-start solution and build perturbed copies of it.
+        
+        The repaired solution comes first; customers it cannot place within
+        the fleet get routes of their own. The copies each have a random
+        share of customers removed and reinserted at their cheapest positions.
+        
+        Returns:
+            ``warm_start_ratio`` of the population size solutions (at least
+            one), or none without a warm start
+        """
+        if self.warm_start_routes is None or self.num_locations <= 1:
+            return []
+        routes, unassigned = repair_solution(
+            self.warm_start_routes, self.distance_matrix, self.demands, self.vehicle_capacity,
+            self.num_vehicles, self.depot_index, self.time_windows
+        )
+        routes += [[customer] for customer in unassigned]
+        count = min(self.population_size, max(1, round(self.population_size * self.warm_start_ratio)))
+        solutions = [routes]
+        for _ in range(count - 1):
+            solutions.append(perturb_solution(
+                routes, self.distance_matrix, self.demands, self.vehicle_capacity, self.rng,
+                num_vehicles=self.num_vehicles, depot_index=self.depot_index, time_windows=self.time_windows
+            ))
+        return solutions
+
+    def _seed_solutions(self) -> List[List[List[int]]]:
+        """Warm-start and savings solutions opening the initial population."""
+        seeds = self.generate_warm_start_solutions()
+        num_savings = min(self._num_savings_seeds(), self.population_size - len(seeds))
+        return seeds + self.generate_savings_solutions(num_savings)
+
     def generate_initial_population(self) -> List[List[List[int]]]:
         """Generate initial population.
         
+        The repaired warm start and its perturbations come first, then a
+        ``savings_ratio`` share of solutions from the savings heuristic; the
+        rest are random.
+        
         Returns:
             List of solutions (population)
         """
-        population = []
-        for _ in range(self.population_size):
+        population = self._seed_solutions()
+        for _ in range(self.population_size - len(population)):
             solution = self.generate_random_solution()
             population.append(solution)
         return population
 
+    def decode_giant_tour(self, giant_tour: List[int]) -> Tuple[float, List[List[int]]]:
+        """Decode a giant tour into routes with the optimal Split procedure.
+        
+        With time windows, every route of the result also meets its deadlines.
+        At most ``num_vehicles`` routes are used whenever the tour can be split
+        that way; otherwise the unlimited-fleet split is returned.
+        
+        Args:
+            giant_tour: Permutation of all customers without depot visits
+            
+        Returns:
+            Tuple of (total distance, list of routes)
+            
+        Raises:
+            ValueError: If a customer cannot be served within its time window
+                even on a route of its own
+        """
+        return split_giant_tour(
+            giant_tour,
+            self.distance_matrix,
+            self.demands,
+            self.vehicle_capacity,
+            self.depot_index,
+            self.num_vehicles,
+            self.time_windows
+        )
+
+    def generate_random_giant_tour(self) -> List[int]:
+        """Generate a random giant tour.
+        
+        Returns:
+            Random permutation of all customers (excluding depot)
+        """
+        giant_tour = [i for i in range(self.num_locations) if i != self.depot_index]
+        self.rng.shuffle(giant_tour)
+        return giant_tour
+
+    def giant_tour_crossover(self, parent1: List[int], parent2: List[int],
+                             out: Optional[Tuple[List[int], List[int]]] = None) -> Tuple[List[int], List[int]]:
+        """Cross two giant tours with the configured permutation operator.
+        
+        Args:
+            parent1: First parent giant tour
+            parent2: Second parent giant tour
+            out: Optional pair of buffers of the parents' length receiving the
+                offspring, e.g. the solver's child buffers
+            
+        Returns:
+            Two offspring giant tours
+        """
+        n = len(parent1)
+        if n <= 2:
+            return parent1[:], parent2[:]
+        out1, out2 = out if out is not None else (None, None)
+        
+        if self.crossover_operator == 'erx':
+            return (self.crossover.edge_recombination(parent1, parent2, out1, rng=self.rng),
+                    self.crossover.edge_recombination(parent2, parent1, out2, rng=self.rng))
+        
+        point1 = self.rng.randint(0, n // 2)
+        point2 = self.rng.randint(point1 + 1, n)
+        
+        if self.crossover_operator == 'pmx':
+            operator = self.crossover.partially_mapped_crossover
+        else:
+            operator = self.crossover.order_crossover
+        return (operator(parent1, parent2, point1, point2, out1),
+                operator(parent2, parent1, point1, point2, out2))
+
+    def mutate_giant_tour(self, giant_tour: List[int], in_place: bool = False) -> List[int]:
+        """Mutate a giant tour with a swap, insert or invert move.
+        
+        Every permutation decodes to a capacity-feasible solution, so no
+        feasibility check is needed.
+        
+        Args:
+            giant_tour: Giant tour to mutate
+            in_place: Modify the input (e.g. a child buffer) instead of a copy
+            
+        Returns:
+            Mutated tour, or the input itself if no mutation is applied
+        """
+        n = len(giant_tour)
+        if n < 2 or self.rng.random() > self.mutation_rate:
+            return giant_tour
+        
+        mutated = giant_tour if in_place else giant_tour[:]
+        mutation_type = self.rng.choice(['swap', 'insert', 'invert'])
+        pos1, pos2 = sorted(self.rng.pair(0, n))
+        
+        if mutation_type == 'swap':
+            mutated[pos1], mutated[pos2] = mutated[pos2], mutated[pos1]
+        elif mutation_type == 'insert':
+            customer = mutated.pop(pos1)
+            mutated.insert(pos2, customer)
+        else:
+            mutated[pos1:pos2 + 1] = mutated[pos1:pos2 + 1][::-1]
+        
+        return mutated
+
     def tournament_selection(self, population: List[List[List[int]]], tournament_size: int = 3) -> List[List[int]]:
         """Select a parent using tournament selection.
         
@@ -395,7 +796,7 @@ class GeneticAlgorithmVRPSolver(BaseVRPSolver):
         Returns:
             Selected parent solution
         """
-        tournament = random.sample(population, min(tournament_size, len(population)))
+        tournament = self.rng.sample(population, min(tournament_size, len(population)))
         best_solution = min(tournament, key=self.calculate_solution_fitness)
         return best_solution
 
@@ -410,130 +811,107 @@ class GeneticAlgorithmVRPSolver(BaseVRPSolver):
             Two offspring solutions
         """
         # Flatten parents to get customer sequences
-        customers1 = []
-        customers2 = []
-        for route in parent1:
-            customers1.extend(route)
-        for route in parent2:
-            customers2.extend(route)
+        customers1 = routes_to_giant_tour(parent1)
+        customers2 = routes_to_giant_tour(parent2)
         
         if len(customers1) != len(customers2):
-            # If parents have different structures, return copies
-            return [route[:] for route in parent1], [route[:] for route in parent2]
+            # If parents have different structures, return them unchanged (solutions are never modified in place)
+            return parent1, parent2
         
         n = len(customers1)
         if n <= 2:
-            return [route[:] for route in parent1], [route[:] for route in parent2]
-        
-        # Perform order crossover on flattened sequences
-        point1 = random.randint(0, n // 2)
-        point2 = random.randint(point1 + 1, n)
-        
-        offspring1 = [-1] * n
-        offspring2 = [-1] * n
-        
-        # Copy segments
-        offspring1[point1:point2] = customers1[point1:point2]
-        offspring2[point1:point2] = customers2[point1:point2]
-        
-        # Fill remaining positions
-        def fill_offspring(offspring, other_parent):
-            remaining = [c for c in other_parent if c not in offspring]
-            pos = 0
-            for i in range(n):
-                if offspring[i] == -1:
-                    offspring[i] = remaining[pos]
-                    pos += 1
-        
-        fill_offspring(offspring1, customers2)
-        fill_offspring(offspring2, customers1)
-        
-        # Convert back to route format
-        def customers_to_routes(customers):
-            routes = []
-            current_route = []
-            current_demand = 0.0
-            
-            for customer in customers:
-                customer_demand = self.demands[customer]
-                if current_demand + customer_demand > self.vehicle_capacity:
-                    if current_route:
-                        routes.append(current_route)
-                    current_route = [customer]
-                    current_demand = customer_demand
-                else:
-                    current_route.append(customer)
-                    current_demand += customer_demand
-            
-            if current_route:
-                routes.append(current_route)
-            return routes
+            return parent1, parent2
+        
+        # Perform order crossover on flattened sequences, into the child buffers
+        # (the decoded routes are new lists, so the buffers can be reused)
+        point1 = self.rng.randint(0, n // 2)
+        point2 = self.rng.randint(point1 + 1, n)
+        out1, out2 = self._child_buffers if n == self.num_customers else (None, None)
         
-        return customers_to_routes(offspring1), customers_to_routes(offspring2)
+        offspring1 = self.crossover.order_crossover(customers1, customers2, point1, point2, out1)
+        offspring2 = self.crossover.order_crossover(customers2, customers1, point1, point2, out2)
+        
+        # Convert back to route format with the optimal Split decoder
+        return self.decode_giant_tour(offspring1)[1], self.decode_giant_tour(offspring2)[1]
 
-    def mutate_solution(self, solution: List[List[int]]) -> List[List[int]]:
+    def mutate_solution(self, solution: List[List[int]], state: Optional[SolutionState] = None) -> List[List[int]]:
         """Mutate a solution using various mutation operators.
         
         Args:
             solution: Solution to mutate
+            state: Load state of ``solution``, built on demand if omitted
             
         Returns:
-            Mutated solution
+            Mutated solution, or the input itself if no feasible mutation is applied
         """
-        if random.random() > self.mutation_rate:
-            return [route[:] for route in solution]  # No mutation
+        if self.rng.random() > self.mutation_rate:
+            return solution  # No mutation
+        if state is None:
+            state = self._make_state(solution)
+        return self._apply_random_move(state).routes
+
+    def mutate_state(self, state: SolutionState) -> SolutionState:
+        """Mutate a solution state, checking feasibility before applying the move.
         
-        mutated = [route[:] for route in solution]
+        Args:
+            state: State of the solution to mutate
+            
+        Returns:
+            New state if a feasible mutation was applied, otherwise ``state`` itself
+        """
+        if self.rng.random() > self.mutation_rate:
+            return state  # No mutation
+        return self._apply_random_move(state)
+
+    def educate_state(self, state: SolutionState) -> SolutionState:
+        """Improve a state by local search with probability ``local_search_rate``."""
+        if self.local_search is None or self.rng.random() >= self.local_search_rate:
+            return state
+        return self._make_state(self.local_search.improve(state.routes, self.rng))
+
+    def _make_state(self, solution: List[List[int]]) -> SolutionState:
+        """Wrap a solution into a state tracking loads (and schedules)."""
+        return SolutionState(solution, self.demands, self.vehicle_capacity, time_windows=self.time_windows)
+
+    def _apply_random_move(self, state: SolutionState) -> SolutionState:
+        """Draw a swap, insert or invert move and apply it if it is feasible."""
+        routes = state.routes
         
         # Choose mutation type randomly
-        mutation_type = random.choice(['swap', 'insert', 'invert'])
+        mutation_type = self.rng.choice(['swap', 'insert', 'invert'])
         
         if mutation_type == 'swap':
             # Swap two customers (possibly between different routes)
-            all_customers = []
-            route_indices = []
-            for i, route in enumerate(mutated):
-                for j, customer in enumerate(route):
-                    all_customers.append((i, j, customer))
-                    route_indices.append(i)
-            
-            if len(all_customers) >= 2:
-                idx1, idx2 = random.sample(range(len(all_customers)), 2)
-                route1, pos1, customer1 = all_customers[idx1]
-                route2, pos2, customer2 = all_customers[idx2]
-                
-                # Swap customers
-                mutated[route1][pos1] = customer2
-                mutated[route2][pos2] = customer1
+            if state.num_customers >= 2:
+                idx1, idx2 = self.rng.pair(0, state.num_customers)
+                route1, pos1 = state.locate(idx1)
+                route2, pos2 = state.locate(idx2)
+                if state.can_swap(route1, pos1, route2, pos2):
+                    return state.apply_swap(route1, pos1, route2, pos2)
         
         elif mutation_type == 'insert':
             # Move a customer to a different position
-            non_empty_routes = [i for i, route in enumerate(mutated) if route]
+            non_empty_routes = [i for i, route in enumerate(routes) if len(route) > 1]
             if non_empty_routes:
-                route_idx = random.choice(non_empty_routes)
-                route = mutated[route_idx]
-                if len(route) > 1:
-                    pos1 = random.randint(0, len(route) - 1)
-                    customer = route.pop(pos1)
-                    pos2 = random.randint(0, len(route))
-                    route.insert(pos2, customer)
+                route_idx = self.rng.choice(non_empty_routes)
+                route_length = len(routes[route_idx])
+                pos1 = self.rng.randint(0, route_length - 1)
+                pos2 = self.rng.randint(0, route_length - 1)
+                if state.can_relocate(route_idx, pos1, route_idx, pos2):
+                    return state.apply_relocate(route_idx, pos1, route_idx, pos2)
         
         elif mutation_type == 'invert':
             # Invert a segment within a route
-            non_empty_routes = [i for i, route in enumerate(mutated) if len(route) >= 2]
+            non_empty_routes = [i for i, route in enumerate(routes) if len(route) >= 2]
             if non_empty_routes:
-                route_idx = random.choice(non_empty_routes)
-                route = mutated[route_idx]
-                if len(route) >= 2:
-                    pos1 = random.randint(0, len(route) - 2)
-                    pos2 = random.randint(pos1 + 1, len(route) - 1)
-                    route[pos1:pos2+1] = reversed(route[pos1:pos2+1])
+                route_idx = self.rng.choice(non_empty_routes)
+                route_length = len(routes[route_idx])
+                pos1 = self.rng.randint(0, route_length - 2)
+                pos2 = self.rng.randint(pos1 + 1, route_length - 1)
+                if state.can_invert(route_idx, pos1, pos2):
+                    return state.apply_invert(route_idx, pos1, pos2)
         
-        # Ensure the mutated solution is still feasible
-        if not self.is_solution_feasible(mutated):
-            return [route[:] for route in solution]  # Return original if infeasible
-        
-        return mutated
+        return state
 
     def solve_vrp(self) -> List[List[int]]:
         """Solve VRP using Genetic Algorithm.
@@ -543,8 +921,286 @@ class GeneticAlgorithmVRPSolver(BaseVRPSolver):
         """
         print("Starting Genetic Algorithm for VRP...")
         
+        if self.encoding == 'giant_tour':
+            return self._solve_giant_tour()
+        return self._solve_routes()
+
+    def _cached_fitness_scores(self, population: List[SolutionState]) -> List[float]:
+        """Fitness of route-encoded individuals; cache misses are scored in one vectorized pass."""
+        keys = [canonical_solution_key(state.routes) for state in population]
+        fitness_scores = [self.fitness_cache.get(key) for key in keys]
+        missing = [i for i, fitness in enumerate(fitness_scores) if fitness is None]
+        if missing:
+            computed = self.evaluate_population([population[i].routes for i in missing])
+            for i, fitness in zip(missing, computed):
+                fitness_scores[i] = fitness
+                self.fitness_cache.put(keys[i], fitness)
+        return fitness_scores
+
+    def _tournament_index(self, fitness_scores: List[float], tournament_size: int = 3) -> int:
+        """Select a parent index by tournament over precomputed fitness values."""
+        candidates = self.rng.sample(range(len(fitness_scores)), min(tournament_size, len(fitness_scores)))
+        return min(candidates, key=fitness_scores.__getitem__)
+
+    def breed_giant_tours(self, parent1: List[int], parent2: List[int]) -> Tuple[List[int], List[int]]:
+        """Produce two offspring giant tours by crossover and mutation.
+        
+        Args:
+            parent1: First parent giant tour
+            parent2: Second parent giant tour
+            
+        Returns:
+            Two offspring giant tours: the parents themselves if neither
+            crossover nor mutation was applied, and the solver's child buffers
+            after a crossover, overwritten by the next call (copy them to keep them)
+        """
+        if self.rng.random() >= self.crossover_rate:
+            return self.mutate_giant_tour(parent1), self.mutate_giant_tour(parent2)
+        
+        # The offspring are new to this call, so mutation can work on them in place
+        buffers = self._child_buffers if len(parent1) == self.num_customers else None
+        offspring1, offspring2 = self.giant_tour_crossover(parent1, parent2, buffers)
+        return self.mutate_giant_tour(offspring1, in_place=True), self.mutate_giant_tour(offspring2, in_place=True)
+
+    def evaluate_giant_tour(self, giant_tour: List[int]) -> Tuple[List[int], float, bytes]:
+        """Score an offspring, educating it by local search with probability ``local_search_rate``.
+        
+        Args:
+            giant_tour: Offspring giant tour
+            
+        Returns:
+            Tuple of (giant tour, possibly improved, its fitness and the
+            canonical key of its decoded routes)
+        """
+        if self.local_search is not None and self.rng.random() < self.local_search_rate:
+            routes = self.decode_giant_tour(giant_tour)[1]
+            if routes:
+                giant_tour = routes_to_giant_tour(self.local_search.improve(routes, self.rng))
+        return (giant_tour, *self.giant_tour_entry(giant_tour))
+
+    def giant_tour_entry(self, giant_tour: List[int]) -> Tuple[float, bytes]:
+        """Split cost of a giant tour and the canonical key of its decoded routes.
+        
+        Both are looked up in the fitness cache first. The cache is keyed on
+        a digest of the tour itself, since finding the routes is the work it
+        saves; the canonical key lets callers recognise tours that decode to
+        the same solution (e.g. with the routes in another order).
+        """
+        key = tour_key(giant_tour)
+        entry = self.fitness_cache.get(key)
+        if entry is None:
+            cost, routes = self.decode_giant_tour(giant_tour)
+            entry = (float(cost), canonical_solution_key(routes))
+            self.fitness_cache.put(key, entry)
+        return entry
+
+    def giant_tour_fitness(self, giant_tour: List[int]) -> float:
+        """Split cost of a giant tour, looked up in the fitness cache first."""
+        return self.giant_tour_entry(giant_tour)[0]
+
+    def cache_statistics(self) -> Dict[str, float]:
+        """Fitness cache counters of this process and the number of replaced duplicates.
+        
+        With ``num_workers > 1`` offspring are scored in the worker
+        processes, whose caches are not included.
+        """
+        statistics = self.fitness_cache.statistics()
+        statistics['duplicates_replaced'] = self.duplicates_replaced
+        return statistics
+
+    def breed_chunk(self, stream_key: Tuple[int, ...], parent_pairs: List[Tuple[List[int], List[int]]]) -> List[Tuple[List[int], float, bytes]]:
+        """Breed and score a chunk of parent pairs with a dedicated RNG stream.
+        
+        Args:
+            stream_key: Base seed and spawn key (generation, chunk) of the chunk's
+                random number stream
+            parent_pairs: Pairs of parent giant tours
+            
+        Returns:
+            List of (offspring giant tour, fitness, canonical key), two per
+            parent pair
+        """
+        solver_rng = self.rng
+        self.rng = substream(*stream_key)
+        try:
+            offspring = []
+            buffer1, buffer2 = self._child_buffers
+            for parent1, parent2 in parent_pairs:
+                for child in self.breed_giant_tours(parent1, parent2):
+                    giant_tour, fitness, key = self.evaluate_giant_tour(child)
+                    if giant_tour is buffer1 or giant_tour is buffer2:
+                        giant_tour = giant_tour[:]  # Kept beyond the next crossover
+                    offspring.append((giant_tour, fitness, key))
+            return offspring
+        finally:
+            self.rng = solver_rng
+
+    def initialize_population(self) -> None:
+        """Create and score the initial giant-tour population.
+        
+        Sets ``population``, ``fitness_scores``, ``population_keys``,
+        ``best_tour``, ``best_fitness`` and ``generation``, the state advanced
+        by ``evolve_generation``.
+        """
+        # Base of the per-chunk RNG stream keys
+        self._stream_base = self.seed if self.seed is not None else self.rng.getrandbits(64)
+        
+        self.population = [routes_to_giant_tour(routes) for routes in self._seed_solutions()]
+        self.population += [self.generate_random_giant_tour() for _ in range(self.population_size - len(self.population))]
+        entries = [self.giant_tour_entry(tour) for tour in self.population]
+        self.fitness_scores = [fitness for fitness, _ in entries]
+        # Canonical keys of the decoded routes, used to reject clones
+        self.population_keys = [key for _, key in entries]
+        self.generation = 0
+        
+        best_index = min(range(len(self.population)), key=self.fitness_scores.__getitem__)
+        self.best_tour = self.population[best_index]
+        self.best_fitness = self.fitness_scores[best_index]
+
+    def evolve_generation(self, breeder: Optional[ParallelBreeder] = None) -> None:
+        """Advance the giant-tour population by one generation.
+        
+        Args:
+            breeder: Process pool to breed offspring on, None to breed locally
+        """
+        population = self.population
+        fitness_scores = self.fitness_scores
+        
+        # Elitism: keep best individuals (tours are never modified in place)
+        elite_indices = sorted(range(len(fitness_scores)), key=fitness_scores.__getitem__)[:self.elite_size]
+        new_population = [population[idx] for idx in elite_indices]
+        new_fitness = [fitness_scores[idx] for idx in elite_indices]
+        new_keys = [self.population_keys[idx] for idx in elite_indices]
+        
+        # Select all parents up front, then breed them chunk by chunk
+        num_pairs = (self.population_size - len(new_population) + 1) // 2
+        parent_pairs = [
+            (population[self._tournament_index(fitness_scores)],
+             population[self._tournament_index(fitness_scores)])
+            for _ in range(num_pairs)
+        ]
+        parent_chunks = [parent_pairs[i:i + self.chunk_size]
+                         for i in range(0, num_pairs, self.chunk_size)]
+        stream_keys = [(self._stream_base, self.generation, i) for i in range(len(parent_chunks))]
+        
+        if breeder is not None:
+            offspring_chunks = breeder.breed(stream_keys, parent_chunks)
+        else:
+            offspring_chunks = [self.breed_chunk(key, chunk) for key, chunk in zip(stream_keys, parent_chunks)]
+        
+        # Tours decoding to the same routes are clones, whatever their order
+        seen = set(new_keys)
+        for offspring_chunk in offspring_chunks:
+            for offspring, fitness, key in offspring_chunk:
+                if self.deduplicate and key in seen:
+                    # Clone of an individual already kept: replace it by a fresh one
+                    offspring = self.generate_random_giant_tour()
+                    fitness, key = self.giant_tour_entry(offspring)
+                    self.duplicates_replaced += 1
+                seen.add(key)
+                new_population.append(offspring)
+                new_fitness.append(fitness)
+                new_keys.append(key)
+                if fitness < self.best_fitness:
+                    self.best_fitness = fitness
+                    self.best_tour = offspring
+        
+        # Trim population to exact size
+        self.population = new_population[:self.population_size]
+        self.fitness_scores = new_fitness[:self.population_size]
+        self.population_keys = new_keys[:self.population_size]
+        self.generation += 1
+
+    def best_individuals(self, count: int) -> List[Tuple[List[int], float]]:
+        """Return the ``count`` best (giant tour, fitness) pairs of the population."""
+        order = sorted(range(len(self.fitness_scores)), key=self.fitness_scores.__getitem__)[:count]
+        return [(self.population[idx], self.fitness_scores[idx]) for idx in order]
+
+    def replace_worst(self, individuals: List[Tuple[List[int], float]]) -> None:
+        """Replace the worst members of the population, e.g. with migrants.
+        
+        Args:
+            individuals: (giant tour, fitness) pairs to insert
+        """
+        worst = sorted(range(len(self.fitness_scores)), key=self.fitness_scores.__getitem__, reverse=True)
+        for idx, (tour, fitness) in zip(worst, individuals):
+            self.population[idx] = tour
+            self.fitness_scores[idx] = fitness
+            self.population_keys[idx] = self.giant_tour_entry(tour)[1]
+            if fitness < self.best_fitness:
+                self.best_fitness = fitness
+                self.best_tour = tour
+
+    def _start_run(self) -> None:
+        """Reset the early-stopping state at the start of a run."""
+        self._start_time = time.time()
+        self._previous_best = float('inf')
+        self._no_improvement_count = 0
+        self.stop_reason = 'max_generations'
+
+    def _should_stop(self, best_fitness: float) -> bool:
+        """Check the stopping criteria once per generation and record the reason.
+        
+        Args:
+            best_fitness: Best fitness found so far
+            
+        Returns:
+            True if the run should end now
+        """
+        if self.target_fitness is not None and best_fitness <= self.target_fitness:
+            self.stop_reason = 'target_fitness'
+            return True
+        
+        improvement = self._previous_best - best_fitness
+        if improvement < self.convergence_threshold:
+            self._no_improvement_count += 1
+        else:
+            self._no_improvement_count = 0
+        self._previous_best = best_fitness
+        if self.patience is not None and self._no_improvement_count >= self.patience:
+            self.stop_reason = 'converged'
+            return True
+        
+        if self.time_limit is not None and time.time() - self._start_time >= self.time_limit:
+            self.stop_reason = 'time_limit'
+            return True
+        return False
+
+    def _solve_giant_tour(self) -> List[List[int]]:
+        """Run the GA on giant-tour chromosomes decoded by Split."""
+        num_customers = self.num_locations - 1
+        if num_customers <= 0:
+            return []
+        
+        self._start_run()
+        self.initialize_population()
+        
+        breeder = ParallelBreeder(self, self.num_workers) if self.num_workers > 1 else None
+        try:
+            for generation in range(self.num_generations):
+                if self._should_stop(self.best_fitness):
+                    print(f"Stopping after {generation} generations: {self.stop_reason}")
+                    break
+                self.evolve_generation(breeder)
+                
+                # Print progress
+                if generation % 50 == 0:
+                    print(f"Generation {generation}: Best fitness = {self.best_fitness:.2f}")
+        finally:
+            if breeder is not None:
+                breeder.close()
+        
+        print(f"Final best fitness: {self.best_fitness:.2f}")
+        return self.decode_giant_tour(self.best_tour)[1]
+
+    def _solve_routes(self) -> List[List[int]]:
+        """Run the GA on route-list chromosomes."""
+        self._start_run()
+        
         # Generate initial population
-        population = self.generate_initial_population()
+        population = [
+            self._make_state(solution) for solution in self.generate_initial_population()
+        ]
         
         # Track best solution
         best_solution = None
@@ -552,39 +1208,42 @@ class GeneticAlgorithmVRPSolver(BaseVRPSolver):
         
         for generation in range(self.num_generations):
             # Calculate fitness for all individuals
-            fitness_scores = []
-            for solution in population:
-                fitness = self.calculate_solution_fitness(solution)
-                fitness_scores.append(fitness)
-                
-                if fitness < best_fitness:
-                    best_fitness = fitness
-                    best_solution = [route[:] for route in solution]
-            
-            # Create new population
-            new_population = []
+            fitness_scores = self._cached_fitness_scores(population)
+            best_index = min(range(len(fitness_scores)), key=fitness_scores.__getitem__)
+            if fitness_scores[best_index] < best_fitness:
+                best_fitness = fitness_scores[best_index]
+                best_solution = population[best_index].routes
+            if self._should_stop(best_fitness):
+                print(f"Stopping after {generation} generations: {self.stop_reason}")
+                break
             
-            # Elitism: keep best individuals
+            # Elitism: keep best individuals (states are never modified in place)
             elite_indices = sorted(range(len(fitness_scores)), key=lambda i: fitness_scores[i])[:self.elite_size]
-            for idx in elite_indices:
-                new_population.append([route[:] for route in population[idx]])
+            new_population = [population[idx] for idx in elite_indices]
+            seen = {canonical_solution_key(state.routes) for state in new_population}
             
             # Generate offspring
             while len(new_population) < self.population_size:
-                parent1 = self.tournament_selection(population)
-                parent2 = self.tournament_selection(population)
+                parent1 = population[self._tournament_index(fitness_scores)]
+                parent2 = population[self._tournament_index(fitness_scores)]
                 
-                if random.random() < self.crossover_rate:
-                    offspring1, offspring2 = self.order_crossover(parent1, parent2)
+                if self.rng.random() < self.crossover_rate:
+                    routes1, routes2 = self.order_crossover(parent1.routes, parent2.routes)
+                    offspring1 = self._make_state(routes1)
+                    offspring2 = self._make_state(routes2)
                 else:
-                    offspring1 = [route[:] for route in parent1]
-                    offspring2 = [route[:] for route in parent2]
+                    offspring1, offspring2 = parent1, parent2
                 
-                # Mutate offspring
-                offspring1 = self.mutate_solution(offspring1)
-                offspring2 = self.mutate_solution(offspring2)
-                
-                new_population.extend([offspring1, offspring2])
+                # Mutate and educate offspring, replacing clones by fresh individuals
+                for offspring in (offspring1, offspring2):
+                    state = self.educate_state(self.mutate_state(offspring))
+                    key = canonical_solution_key(state.routes)
+                    if self.deduplicate and key in seen:
+                        state = self._make_state(self.generate_random_solution())
+                        key = canonical_solution_key(state.routes)
+                        self.duplicates_replaced += 1
+                    seen.add(key)
+                    new_population.append(state)
             
             # Trim population to exact size
             population = new_population[:self.population_size]
@@ -594,52 +1253,103 @@ class GeneticAlgorithmVRPSolver(BaseVRPSolver):
                 print(f"Generation {generation}: Best fitness = {best_fitness:.2f}")
         
         print(f"Final best fitness: {best_fitness:.2f}")
-        return best_solution if best_solution is not None else []
+        return [route[:] for route in best_solution] if best_solution is not None else []
 
 
-def solve_solomon_vrp(file_content: str) -> VRPResult:
+def solve_solomon_vrp(file_content: str, use_time_windows: bool = False,
+                      solver_type: str = 'ga', time_limit: float = 10.0,
+                      warm_start: Optional[Union[VRPResult, List[List[int]]]] = None) -> VRPResult:
     """求解Solomon VRP实例的主函数
     
     Args:
         file_content: Solomon格式的文件内容
+        use_time_windows: 是否考虑时间窗约束（VRPTW），默认只考虑容量约束
+        solver_type: 求解算法，'ga'（遗传算法）、'alns'（自适应大邻域搜索）
+            或 'hgs'（混合遗传搜索，仅支持容量约束，车辆数不设上限）
+        time_limit: 求解时间上限（秒），遗传算法在达到上限或收敛时提前停止
+        warm_start: 之前的求解结果（VRPResult 或路线列表），例如修改容量、
+            车辆数或客户后重新求解时使用。解会先修复为当前实例的可行解，
+            再作为初始解注入求解器；ALNS 在一段时间没有改进后提前停止
         
     Returns:
         VRPResult: 求解结果
     """
+    if solver_type not in ('ga', 'alns', 'hgs'):
+        raise ValueError(f"Unknown solver type: {solver_type}")
+    if solver_type == 'hgs' and use_time_windows:
+        raise ValueError("The HGS solver does not support time windows; use use_time_windows=False")
     start_time = time.time()
     
-    # 解析数据
-    customers, params = SolomonDataParser.parse_solomon_file(file_content)
+    # 解析数据（相同内容的文件直接读取缓存）
+    customers, params = SolomonDataParser.load_customer_table(file_content)
+    
+    if not len(customers):
+        return VRPResult([], 0.0, customers, 0.0)
     
-    if not customers:
-        return VRPResult([], 0.0, [], 0.0)
+    # 构建距离矩阵（按列向量化计算）
+    distance_matrix = customers.distance_matrix().tolist()
+    demands = customers.demand.astype(float).tolist()
     
-    # 构建距离矩阵
-    n = len(customers)
-    distance_matrix = [[0.0 for _ in range(n)] for _ in range(n)]
-    demands = []
+    # 时间窗数据（行驶时间等于距离）
+    time_windows = None
+    if use_time_windows:
+        time_windows = TimeWindows(
+            ready_times=customers.ready_time.astype(float).tolist(),
+            due_times=customers.due_time.astype(float).tolist(),
+            service_times=customers.service_time.astype(float).tolist(),
+            travel_times=distance_matrix,
+            depot_index=0
+        )
     
-    for i in range(n):
-        demands.append(float(customers[i].demand))
-        for j in range(n):
-            if i != j:
-                dx = customers[i].x - customers[j].x
-                dy = customers[i].y - customers[j].y
-                distance_matrix[i][j] = math.sqrt(dx * dx + dy * dy)
+    # 热启动：之前的路线（由求解器修复为可行解）
+    warm_start_routes = None
+    if warm_start is not None:
+        warm_start_routes = [list(route) for route in getattr(warm_start, 'routes', warm_start)]
     
     # 创建求解器
-    solver = GeneticAlgorithmVRPSolver(
-        distance_matrix=distance_matrix,
-        demands=demands,
-        vehicle_capacity=float(params['vehicle_capacity']),
-        num_vehicles=params['num_vehicles'],
-        depot_index=0,
-        population_size=50,
-        num_generations=100,
-        mutation_rate=0.02,
-        crossover_rate=0.8,
-        elite_ratio=0.1
-    )
+    if solver_type == 'alns':
+        # 延迟导入：vrp_alns 依赖本模块
+        from smart_decision_miniproject.solver.vrp_alns import ALNSVRPSolver
+        solver = ALNSVRPSolver(
+            distance_matrix=distance_matrix,
+            demands=demands,
+            vehicle_capacity=float(params['vehicle_capacity']),
+            num_vehicles=params['num_vehicles'],
+            depot_index=0,
+            time_windows=time_windows,
+            time_limit=time_limit,
+            patience=None if warm_start_routes is None else WARM_START_ALNS_PATIENCE,
+            warm_start_routes=warm_start_routes
+        )
+    elif solver_type == 'hgs':
+        # 延迟导入：vrp_hgs 依赖本模块
+        from smart_decision_miniproject.solver.vrp_hgs import HGSVRPSolver
+        solver = HGSVRPSolver(
+            distance_matrix=distance_matrix,
+            demands=demands,
+            vehicle_capacity=float(params['vehicle_capacity']),
+            num_vehicles=params['num_vehicles'],
+            depot_index=0,
+            time_limit=time_limit,
+            warm_start_routes=warm_start_routes
+        )
+    else:
+        solver = GeneticAlgorithmVRPSolver(
+            distance_matrix=distance_matrix,
+            demands=demands,
+            vehicle_capacity=float(params['vehicle_capacity']),
+            num_vehicles=params['num_vehicles'],
+            depot_index=0,
+            population_size=50,
+            num_generations=100,
+            mutation_rate=0.02,
+            crossover_rate=0.8,
+            elite_ratio=0.1,
+            time_windows=time_windows,
+            patience=50,
+            time_limit=time_limit,
+            warm_start_routes=warm_start_routes
+        )
     
     # 求解
     routes = solver.solve_vrp()
@@ -649,7 +1359,12 @@ def solve_solomon_vrp(file_content: str) -> VRPResult:
     
     solve_time = time.time() - start_time
     
-    return VRPResult(routes, total_distance, customers, solve_time)
+    return VRPResult(routes, total_distance, customers, solve_time,
+                     vehicle_capacity=float(params['vehicle_capacity']),
+                     num_vehicles=params['num_vehicles'],
+                     time_windows=time_windows,
+                     distance_matrix=distance_matrix,
+                     stop_reason=solver.stop_reason)
 
 
 def main():
@@ -0,0 +1,157 @@
+"""Seeded random streams for the solvers, with NumPy blocks for vectorized consumers.
+
+``RandomStream`` is a ``random.Random`` whose scalar draws (``random``,
+``choice``, ``randint``, ``sample``, ``shuffle``...) stay on the C-level
+Mersenne Twister, the cheapest way to get one number at a time in Python.
+Loops that consume many numbers at once get them from a NumPy ``Generator``
+in one vectorized call instead: ``uniforms``, ``exponentials`` and
+``pairs`` return arrays, and ``pair`` hands out distinct integer pairs
+(e.g. the positions of a swap move) from a pre-drawn block, which is
+cheaper than ``random.sample(range(n), 2)``.
+
+Streams are seeded with a ``numpy.random.SeedSequence``: ``spawn`` and
+``substream`` derive independent, reproducible streams for parallel workers
+from one seed. The NumPy generator of a stream is only created when a block
+is first drawn, so short-lived substreams cost little more than a seeding.
+"""
+
+import hashlib
+import math
+import random
+from typing import Any, Optional
+
+import numpy as np
+
+# Pairs drawn per refill of a pair block
+DEFAULT_BLOCK_SIZE = 4096
+
+# Block size of substreams, which usually serve a few dozen pairs each
+SUBSTREAM_BLOCK_SIZE = 64
+
+# Pair blocks kept at once (one per distinct range)
+_MAX_PAIR_RANGES = 16
+
+# Largest value exponential() and exponentials() return: -ln of the smallest 53-bit uniform
+MAX_EXPONENTIAL = 53 * math.log(2)
+
+
+def _seed_sequence(seed: Any) -> np.random.SeedSequence:
+    """SeedSequence of an int, str/bytes (hashed), existing SeedSequence or None (fresh entropy)."""
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    if isinstance(seed, str):
+        seed = seed.encode('utf-8')
+    if isinstance(seed, (bytes, bytearray)):
+        seed = int.from_bytes(hashlib.sha256(seed).digest(), 'little')
+    if seed is not None:
+        seed = int(seed) % 2 ** 128  # SeedSequence only takes non-negative entropy
+    return np.random.SeedSequence(seed)
+
+
+class RandomStream(random.Random):
+    """Seeded ``random.Random`` with vectorized NumPy draws and pre-drawn integer pairs."""
+
+    def __init__(self, seed: Any = None, block_size: int = DEFAULT_BLOCK_SIZE):
+        """Create the stream.
+
+        Args:
+            seed: Int, str, ``SeedSequence`` or None for fresh OS entropy
+            block_size: Pairs drawn from the generator per refill
+        """
+        self.block_size = block_size
+        super().__init__(seed)
+
+    def seed(self, a: Any = None, version: int = 2) -> None:
+        """Reseed the stream, both the Mersenne Twister and the NumPy generator."""
+        self.seed_sequence = _seed_sequence(a)
+        first, second = self.seed_sequence.generate_state(2, np.uint64).tolist()
+        super().seed(first << 64 | second)
+        self._generator: Optional[np.random.Generator] = None
+        self._pairs: dict[tuple[int, int], list[tuple[int, int]]] = {}
+
+    @property
+    def generator(self) -> np.random.Generator:
+        """NumPy generator of the vectorized draws, created on first use."""
+        if self._generator is None:
+            self._generator = np.random.Generator(np.random.PCG64(self.seed_sequence))
+        return self._generator
+
+    def pair(self, low: int, high: int) -> tuple[int, int]:
+        """Two distinct uniform integers in [low, high), e.g. the positions of a swap move.
+
+        Pairs are drawn in vectorized blocks per range.
+
+        Raises:
+            ValueError: If the range holds fewer than two integers
+        """
+        block = self._pairs.get((low, high))
+        if not block:
+            first, second = self.pairs(low, high, self.block_size)
+            if len(self._pairs) >= _MAX_PAIR_RANGES:
+                self._pairs.clear()
+            block = self._pairs[(low, high)] = list(zip(first.tolist(), second.tolist()))
+        return block.pop()
+
+    def pairs(self, low: int, high: int, count: int) -> tuple[np.ndarray, np.ndarray]:
+        """Arrays of count pairs of distinct uniform integers in [low, high).
+
+        Raises:
+            ValueError: If the range holds fewer than two integers
+        """
+        if high - low < 2:
+            raise ValueError(f"Range [{low}, {high}) holds fewer than two integers")
+        first = self.generator.integers(low, high, count)
+        second = self.generator.integers(low, high - 1, count)
+        second += second >= first  # Skip the first value, keeping the second uniform
+        return first, second
+
+    def uniforms(self, count: int) -> np.ndarray:
+        """Array of count uniform floats in [0, 1)."""
+        return self.generator.random(count)
+
+    def exponential(self) -> float:
+        """Standard exponential value -ln(u), u uniform in (0, 1]; never above MAX_EXPONENTIAL."""
+        return -math.log(1.0 - self.random())
+
+    def exponentials(self, count: int) -> np.ndarray:
+        """Array of count standard exponential values -ln(u), u uniform in (0, 1].
+
+        Computed from 53-bit uniforms, so no value exceeds MAX_EXPONENTIAL.
+        """
+        return -np.log1p(-self.generator.random(count))
+
+    def spawn(self, count: int) -> list['RandomStream']:
+        """Independent child streams, e.g. one per worker."""
+        return [RandomStream(child, self.block_size) for child in self.seed_sequence.spawn(count)]
+
+    def getstate(self) -> tuple:
+        generator_state = None if self._generator is None else self._generator.bit_generator.state
+        return (super().getstate(), self.seed_sequence, generator_state,
+                {key: list(block) for key, block in self._pairs.items()})
+
+    def setstate(self, state: tuple) -> None:
+        base_state, self.seed_sequence, generator_state, self._pairs = state
+        super().setstate(base_state)
+        self._generator = None
+        if generator_state is not None:
+            self.generator.bit_generator.state = generator_state
+
+    def __reduce__(self):
+        return (self.__class__, (None, self.block_size), self.getstate())
+
+    def __setstate__(self, state: tuple) -> None:
+        self.setstate(state)
+
+
+def substream(entropy: int, *spawn_key: int, block_size: int = SUBSTREAM_BLOCK_SIZE) -> RandomStream:
+    """Stream identified by a base seed and a path of indices (e.g. generation, chunk).
+
+    Equal arguments give the same stream in any process, different paths give
+    independent streams, without spawning them in order.
+
+    Args:
+        entropy: Base seed
+        spawn_key: Non-negative indices identifying the substream
+        block_size: Pairs drawn per refill
+    """
+    return RandomStream(np.random.SeedSequence(int(entropy) % 2 ** 128, spawn_key=spawn_key), block_size)
@@ -0,0 +1,66 @@
+"""Preallocated buffers shared by repeated TSP solves of varying size.
+
+A scale sweep solves instances of growing size with the same solver
+objects. Without an arena every ``update_distance_matrix`` allocates new
+pheromone and visibility arrays; with one, the buffers are allocated once
+for the declared maximum dimension and each solve works on views of their
+leading part.
+"""
+
+import numpy as np
+
+
+def packed_size(dimension: int) -> int:
+    """Number of entries of the packed upper triangle (diagonal included) of an n×n matrix."""
+    return dimension * (dimension + 1) // 2
+
+
+class SolverArena:
+    """Named, reusable NumPy buffers sized for a maximum instance dimension."""
+
+    def __init__(self, max_dimension: int):
+        """Create an empty arena.
+
+        Args:
+            max_dimension (int): Largest number of cities the arena serves.
+
+        Raises:
+            ValueError: If max_dimension is negative.
+        """
+        if max_dimension < 0:
+            raise ValueError(f"max_dimension must be non-negative, got {max_dimension}")
+        self.max_dimension = max_dimension
+        self.buffers: dict[str, np.ndarray] = {}
+        #: Number of buffer allocations, to check that repeated solves reuse them
+        self.allocations = 0
+
+    def check_dimension(self, dimension: int):
+        """Raise ValueError if an instance is larger than the arena."""
+        if dimension > self.max_dimension:
+            raise ValueError(f"Instance dimension {dimension} exceeds arena maximum {self.max_dimension}")
+
+    def array(self, name: str, size: int, capacity: int, dtype: np.dtype = np.float32) -> np.ndarray:
+        """View of the first size entries of a named buffer.
+
+        The buffer is allocated with capacity entries on first use and only
+        reallocated if a later request needs more room or another dtype.
+
+        Args:
+            name (str): Buffer name, unique per use.
+            size (int): Number of entries of the view.
+            capacity (int): Entries to allocate (at least size).
+            dtype (np.dtype): Element type.
+
+        Returns:
+            np.ndarray: One-dimensional view; its content is left as is.
+        """
+        buffer = self.buffers.get(name)
+        if buffer is None or len(buffer) < size or buffer.dtype != np.dtype(dtype):
+            buffer = np.empty(max(size, capacity), dtype=dtype)
+            self.buffers[name] = buffer
+            self.allocations += 1
+        return buffer[:size]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(buffer.nbytes for buffer in self.buffers.values())
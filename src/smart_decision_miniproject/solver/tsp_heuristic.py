@@ -0,0 +1,109 @@
+"""Cache of the ACO heuristic term visibility^beta, shared across solvers and runs.
+
+The heuristic factor η^β = (1/d)^β of an edge only depends on the distance
+matrix and on β, so it is computed once per (matrix fingerprint, β) and
+reused by every solver working on the same instance, e.g. a parameter sweep
+over α, evaporation or the number of ants. Candidate lists depend on the
+matrix only and are cached the same way.
+"""
+
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+from smart_decision_miniproject.TSP_datamodel import DistanceMatrix
+from smart_decision_miniproject.solver.tsp_pheromone import (
+    CandidateEdgeMatrix,
+    PackedSymmetricMatrix,
+    nearest_candidates,
+)
+
+
+def matrix_fingerprint(distance_matrix: DistanceMatrix) -> str:
+    """BLAKE2 hex digest of the distances (hashed row by row, so without an n×n copy).
+
+    Args:
+        distance_matrix (DistanceMatrix): Square distance matrix.
+
+    Returns:
+        str: Fingerprint identifying the matrix content.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(len(distance_matrix).to_bytes(8, 'little'))
+    for i in range(len(distance_matrix)):
+        digest.update(np.asarray(distance_matrix[i], dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+
+def heuristic_matrix(distance_matrix: DistanceMatrix, beta: float, candidates: np.ndarray | None = None,
+                     buffer: np.ndarray | None = None) -> PackedSymmetricMatrix | CandidateEdgeMatrix:
+    """Compute visibility^beta for every edge, or for the candidate edges only.
+
+    Args:
+        distance_matrix (DistanceMatrix): Symmetric distance matrix.
+        beta (float): Importance of heuristic information (β).
+        candidates (np.ndarray | None): (n, k) candidate cities, None for the dense packed store.
+        buffer (np.ndarray | None): float32 buffer of the store, None to allocate one.
+
+    Returns:
+        PackedSymmetricMatrix | CandidateEdgeMatrix: The store of η^β.
+    """
+    if candidates is not None:
+        store = CandidateEdgeMatrix.visibility(distance_matrix, candidates, values=buffer)
+        np.power(store.values, np.float32(beta), out=store.values)
+    else:
+        store = PackedSymmetricMatrix.visibility(distance_matrix, data=buffer)
+        np.power(store.data, np.float32(beta), out=store.data)
+    return store
+
+
+class HeuristicCache:
+    """Least-recently-used cache of heuristic stores and candidate lists."""
+
+    def __init__(self, max_entries: int = 8):
+        """Initialize the cache.
+
+        Args:
+            max_entries (int): Number of stores and candidate lists kept.
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, object] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, key: tuple, build):
+        value = self._entries.get(key)
+        if value is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return value
+        self.misses += 1
+        value = build()
+        self._entries[key] = value
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return value
+
+    def candidates(self, fingerprint: str, distance_matrix: DistanceMatrix, num_candidates: int) -> np.ndarray:
+        """Nearest candidates of every city (see ``nearest_candidates``); do not modify the result."""
+        return self._get(('candidates', fingerprint, num_candidates),
+                         lambda: nearest_candidates(distance_matrix, num_candidates))
+
+    def heuristic(self, fingerprint: str, distance_matrix: DistanceMatrix, beta: float,
+                  candidates: np.ndarray | None = None) -> PackedSymmetricMatrix | CandidateEdgeMatrix:
+        """Store of visibility^beta (see ``heuristic_matrix``); do not modify the result.
+
+        In candidate mode the candidates must come from ``candidates`` with the
+        same fingerprint, so that their count identifies them.
+        """
+        num_candidates = None if candidates is None else candidates.shape[1]
+        return self._get(('heuristic', fingerprint, float(beta), num_candidates),
+                         lambda: heuristic_matrix(distance_matrix, beta, candidates))
+
+    def clear(self):
+        self._entries.clear()
+
+
+# Cache shared by every ACO solver unless one is given explicitly
+default_heuristic_cache = HeuristicCache()
@@ -0,0 +1,202 @@
+"""Compact pheromone and visibility storage for the ACO TSP solver.
+
+Both matrices are symmetric, so the dense store keeps only the upper
+triangle (diagonal included) in one packed float32 array: n(n+1)/2 values
+instead of two triangles of boxed Python floats. For very large instances
+the candidate store keeps values only for the edges from each city to its
+k nearest neighbours (n·k values) and reports a shared default value for
+every other edge. Both stores can work on caller-provided buffers (e.g. from
+a ``SolverArena``) instead of allocating their own.
+"""
+
+import numpy as np
+
+from smart_decision_miniproject.TSP_datamodel import DistanceMatrix
+
+
+def _distance_row(distance_matrix: DistanceMatrix, city: int) -> np.ndarray:
+    return np.asarray(distance_matrix[city], dtype=np.float64)
+
+
+def _inverse(distances: np.ndarray) -> np.ndarray:
+    """1/d for positive distances, 0 elsewhere (diagonal and missing edges)."""
+    inverse = np.zeros(len(distances), dtype=np.float64)
+    np.divide(1.0, distances, out=inverse, where=distances > 0)
+    return inverse
+
+
+class PackedSymmetricMatrix:
+    """Symmetric n×n matrix stored as its packed upper triangle in float32."""
+
+    def __init__(self, dimension: int, fill_value: float = 0.0, data: np.ndarray | None = None):
+        """Create a matrix with every entry set to fill_value.
+
+        Args:
+            dimension (int): Number of rows and columns.
+            fill_value (float): Initial value of every entry.
+            data (np.ndarray | None): float32 buffer of n(n+1)/2 entries to use
+                (overwritten), None to allocate one.
+        """
+        self.dimension = dimension
+        rows = np.arange(dimension, dtype=np.int64)
+        # Position of entry (i, i) in the packed array; row i continues up to (i, n - 1)
+        self.offsets = rows * dimension - rows * (rows - 1) // 2
+        if data is None:
+            data = np.empty(dimension * (dimension + 1) // 2, dtype=np.float32)
+        data.fill(fill_value)
+        self.data = data
+
+    @classmethod
+    def visibility(cls, distance_matrix: DistanceMatrix, data: np.ndarray | None = None) -> 'PackedSymmetricMatrix':
+        """Visibility 1/d of every edge (0 on the diagonal and for zero distances).
+
+        Args:
+            distance_matrix (DistanceMatrix): Symmetric distance matrix.
+            data (np.ndarray | None): Buffer to use, as in the constructor.
+
+        Returns:
+            PackedSymmetricMatrix: The visibility matrix.
+        """
+        matrix = cls(len(distance_matrix), data=data)
+        for i in range(matrix.dimension):
+            start = matrix.offsets[i]
+            matrix.data[start:start + matrix.dimension - i] = _inverse(_distance_row(distance_matrix, i)[i:])
+        return matrix
+
+    def _index(self, rows: np.ndarray, columns: np.ndarray) -> np.ndarray:
+        low = np.minimum(rows, columns)
+        high = np.maximum(rows, columns)
+        return self.offsets[low] + high - low
+
+    def row_index(self, i: int, columns: np.ndarray) -> np.ndarray:
+        """Packed positions of the entries (i, columns); shared by matrices of the same dimension."""
+        return np.where(columns > i, self.offsets[i] + columns - i, self.offsets[columns] + i - columns)
+
+    def get(self, i: int, j: int) -> float:
+        """Value of entry (i, j)."""
+        low, high = min(i, j), max(i, j)
+        return float(self.data[self.offsets[low] + high - low])
+
+    def row(self, i: int) -> np.ndarray:
+        """Full row i as a new float32 array of length n."""
+        row = np.empty(self.dimension, dtype=np.float32)
+        before = np.arange(i, dtype=np.int64)
+        row[:i] = self.data[self.offsets[:i] + i - before]
+        start = self.offsets[i]
+        row[i:] = self.data[start:start + self.dimension - i]
+        return row
+
+    def scale(self, factor: float) -> None:
+        """Multiply every entry by factor (e.g. pheromone evaporation)."""
+        self.data *= np.float32(factor)
+
+    def deposit(self, tails: np.ndarray, heads: np.ndarray, amount: float) -> None:
+        """Add amount to the edges (tails[k], heads[k]); a single write per edge keeps it symmetric."""
+        np.add.at(self.data, self._index(np.asarray(tails), np.asarray(heads)), np.float32(amount))
+
+    @property
+    def nbytes(self) -> int:
+        return self.data.nbytes
+
+
+def candidate_count(dimension: int, num_candidates: int) -> int:
+    """Candidates per city actually used: num_candidates capped at n - 1."""
+    return max(0, min(num_candidates, dimension - 1))
+
+
+def nearest_candidates(distance_matrix: DistanceMatrix, num_candidates: int,
+                       out: np.ndarray | None = None) -> np.ndarray:
+    """Indices of the num_candidates nearest other cities of every city, nearest first.
+
+    Args:
+        distance_matrix (DistanceMatrix): Symmetric distance matrix.
+        num_candidates (int): Candidates per city (capped at n - 1).
+        out (np.ndarray | None): (n, k) int64 array to fill, None to allocate one.
+
+    Returns:
+        np.ndarray: (n, k) int array of candidate cities.
+    """
+    dimension = len(distance_matrix)
+    k = candidate_count(dimension, num_candidates)
+    candidates = np.empty((dimension, k), dtype=np.int64) if out is None else out
+    if k == 0:
+        return candidates
+    for i in range(dimension):
+        distances = _distance_row(distance_matrix, i)
+        distances[i] = np.inf
+        nearest = np.argpartition(distances, k - 1)[:k]
+        candidates[i] = nearest[np.argsort(distances[nearest], kind='stable')]
+    return candidates
+
+
+class CandidateEdgeMatrix:
+    """Symmetric matrix storing only the candidate edges of each city.
+
+    ``values[i, k]`` belongs to the edge (i, candidates[i, k]); every other
+    edge has the shared ``default`` value. An edge that is a candidate of
+    both its ends is stored twice and both copies are updated together.
+    """
+
+    def __init__(self, candidates: np.ndarray, fill_value: float = 0.0, default: float = 0.0,
+                 values: np.ndarray | None = None):
+        """Create the matrix.
+
+        Args:
+            candidates (np.ndarray): (n, k) candidate cities of every city.
+            fill_value (float): Initial value of the candidate edges.
+            default (float): Value of all other edges.
+            values (np.ndarray | None): (n, k) float32 buffer to use (overwritten),
+                None to allocate one.
+        """
+        self.candidates = candidates
+        self.dimension = len(candidates)
+        if values is None:
+            values = np.empty(candidates.shape, dtype=np.float32)
+        values.fill(fill_value)
+        self.values = values
+        self.default = default
+
+    @classmethod
+    def visibility(cls, distance_matrix: DistanceMatrix, candidates: np.ndarray,
+                   values: np.ndarray | None = None) -> 'CandidateEdgeMatrix':
+        """Visibility 1/d of the candidate edges (the default 0 elsewhere).
+
+        Args:
+            distance_matrix (DistanceMatrix): Symmetric distance matrix.
+            candidates (np.ndarray): (n, k) candidate cities of every city.
+            values (np.ndarray | None): Buffer to use, as in the constructor.
+
+        Returns:
+            CandidateEdgeMatrix: The visibility matrix.
+        """
+        matrix = cls(candidates, values=values)
+        for i in range(matrix.dimension):
+            matrix.values[i] = _inverse(_distance_row(distance_matrix, i)[candidates[i]])
+        return matrix
+
+    def get(self, i: int, j: int) -> float:
+        """Value of edge (i, j)."""
+        positions = np.flatnonzero(self.candidates[i] == j)
+        if len(positions):
+            return float(self.values[i, positions[0]])
+        positions = np.flatnonzero(self.candidates[j] == i)
+        return float(self.values[j, positions[0]]) if len(positions) else self.default
+
+    def scale(self, factor: float) -> None:
+        """Multiply every entry, the default included, by factor."""
+        self.values *= np.float32(factor)
+        self.default *= factor
+
+    def deposit(self, tails: np.ndarray, heads: np.ndarray, amount: float) -> None:
+        """Add amount to the candidate edges among (tails[k], heads[k]) in both directions.
+
+        Edges that are a candidate of neither end keep the default value.
+        """
+        tails, heads = np.asarray(tails), np.asarray(heads)
+        for sources, targets in ((tails, heads), (heads, tails)):
+            rows, positions = np.nonzero(self.candidates[sources] == targets[:, None])
+            np.add.at(self.values, (sources[rows], positions), np.float32(amount))
+
+    @property
+    def nbytes(self) -> int:
+        return self.values.nbytes + self.candidates.nbytes
@@ -0,0 +1,82 @@
+"""Roulette-wheel draws for the ACO city selection.
+
+``cumulative_choice`` builds the cumulative weights once and finds the drawn
+city by binary search. ``AliasTables`` keeps one Walker alias table per city
+over its candidate list, so a draw costs O(1); a table is rebuilt only when
+the weights it was built from (pheromone or heuristic) have changed.
+"""
+
+import numpy as np
+
+# Alias draws tried before falling back to a cumulative draw over the open candidates
+ALIAS_ATTEMPTS = 4
+
+
+def cumulative_choice(weights: np.ndarray, u: float) -> int:
+    """Index drawn with probability proportional to weights.
+
+    Args:
+        weights (np.ndarray): Non-negative weights.
+        u (float): Uniform random number in [0, 1).
+
+    Returns:
+        int: The drawn index, or -1 if every weight is zero.
+    """
+    cumulative = np.cumsum(weights)
+    total = cumulative[-1] if len(cumulative) else 0.0
+    if not total > 0:
+        return -1
+    # side='right' never lands on a zero weight; the bound guards against rounding at the top
+    return min(int(np.searchsorted(cumulative, u * total, side='right')), len(weights) - 1)
+
+
+class AliasTables:
+    """One alias table per row of a (rows × k) weight matrix, built on demand."""
+
+    def __init__(self, num_rows: int, row_length: int):
+        """Create empty tables.
+
+        Args:
+            num_rows (int): Number of tables (cities).
+            row_length (int): Entries per table (candidates per city).
+        """
+        self.row_length = row_length
+        self.probabilities = np.ones((num_rows, row_length), dtype=np.float64)
+        self.aliases = np.zeros((num_rows, row_length), dtype=np.int64)
+        # Weights version each table was built for (-1: never built)
+        self.versions = np.full(num_rows, -1, dtype=np.int64)
+
+    def is_current(self, row: int, version: int) -> bool:
+        return self.versions[row] == version
+
+    def build(self, row: int, weights: np.ndarray, version: int):
+        """Build the table of a row with Vose's method (uniform if every weight is zero).
+
+        Args:
+            row (int): Table to build.
+            weights (np.ndarray): Non-negative weights of the row.
+            version (int): Version of the weights, checked with is_current.
+        """
+        k = self.row_length
+        total = float(weights.sum())
+        scaled = (weights * (k / total)).tolist() if total > 0 else [1.0] * k
+        probabilities = [1.0] * k
+        aliases = list(range(k))
+        small = [i for i, value in enumerate(scaled) if value < 1.0]
+        large = [i for i, value in enumerate(scaled) if value >= 1.0]
+        while small and large:
+            low, high = small.pop(), large.pop()
+            probabilities[low] = scaled[low]
+            aliases[low] = high
+            scaled[high] += scaled[low] - 1.0
+            (small if scaled[high] < 1.0 else large).append(high)
+        # Entries left over only differ from 1 by rounding
+        self.probabilities[row] = probabilities
+        self.aliases[row] = aliases
+        self.versions[row] = version
+
+    def draw(self, row: int, u: float) -> int:
+        """Column drawn from a row's table with a single uniform number u in [0, 1)."""
+        scaled = u * self.row_length
+        column = int(scaled)
+        return column if scaled - column < self.probabilities[row, column] else int(self.aliases[row, column])
@@ -0,0 +1,455 @@
+"""Adaptive Large Neighbourhood Search for the (time-windowed) VRP.
+
+Every iteration removes a number of customers with a destroy operator and
+reinserts them with a repair operator. Operators are drawn by roulette wheel
+with weights adapted to how often they produced new best, improving or
+accepted solutions. Candidates are accepted by simulated annealing whose
+temperature decays with the elapsed share of the wall-clock budget.
+"""
+
+import heapq
+import math
+import random
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from smart_decision_miniproject.solver.VRP import BaseVRPSolver
+from smart_decision_miniproject.solver.vrp_construction import clarke_wright_savings
+from smart_decision_miniproject.solver.vrp_insertion import best_insertion, new_route_cost
+from smart_decision_miniproject.solver.vrp_local_search import GranularLocalSearch
+from smart_decision_miniproject.solver.vrp_time_windows import RouteSchedule, TimeWindows
+from smart_decision_miniproject.solver.vrp_warm_start import repair_solution
+
+# Minimum gain for a candidate to count as an improvement
+EPSILON = 1e-9
+
+# Scores for a new global best, an improvement of the current solution and an accepted worse solution
+SCORE_BEST = 33.0
+SCORE_BETTER = 9.0
+SCORE_ACCEPTED = 13.0
+
+# Randomization exponents of the worst and Shaw removals (higher is more deterministic)
+WORST_REMOVAL_EXPONENT = 3
+SHAW_REMOVAL_EXPONENT = 6
+
+
+class ALNSVRPSolver(BaseVRPSolver):
+    """VRP solver using Adaptive Large Neighbourhood Search."""
+
+    def __init__(
+        self,
+        distance_matrix: List[List[float]],
+        demands: List[float],
+        vehicle_capacity: float,
+        num_vehicles: int,
+        depot_index: int = 0,
+        time_windows: Optional[TimeWindows] = None,
+        time_limit: Optional[float] = 10.0,
+        max_iterations: Optional[int] = None,
+        min_removal_ratio: float = 0.1,
+        max_removal_ratio: float = 0.4,
+        max_removal: int = 60,
+        regret_k: int = 3,
+        reaction_factor: float = 0.1,
+        segment_length: int = 100,
+        start_worsening: float = 0.05,
+        final_temperature_ratio: float = 0.002,
+        polish: bool = True,
+        patience: Optional[int] = None,
+        warm_start_routes: Optional[List[List[int]]] = None,
+        seed: Optional[int] = None
+    ):
+        """Initialize the ALNS solver.
+
+        Args:
+            distance_matrix: Square matrix of distances between locations
+            demands: Demand for each customer
+            vehicle_capacity: Maximum capacity for each vehicle
+            num_vehicles: Number of available vehicles; raised to the size of
+                the initial savings solution if that needs more
+            depot_index: Index of the depot
+            time_windows: Time windows and service times for VRPTW instances
+            time_limit: Wall-clock budget in seconds, None for no time limit
+            max_iterations: Optional iteration budget, None to run until the time limit
+            min_removal_ratio: Smallest share of customers removed per iteration
+            max_removal_ratio: Largest share of customers removed per iteration
+            max_removal: Upper bound on the number of removed customers
+            regret_k: Largest k of the regret-k repair operators (greedy is regret-1)
+            reaction_factor: How fast operator weights follow their recent scores
+            segment_length: Iterations between two weight updates
+            start_worsening: A solution this much worse than the initial one is
+                accepted with probability 0.5 at the start
+            final_temperature_ratio: Temperature at the end of the budget
+                relative to the start temperature
+            polish: Improve the initial solution and every new best solution
+                with granular local search
+            patience: Stop after this many iterations without a new best
+                solution (None: run until the budget is used)
+            warm_start_routes: Previous solution (e.g. for other parameters),
+                repaired and used as the initial solution instead of the
+                savings construction
+            seed: Seed of the random number generator, None for a random run
+        """
+        super().__init__(distance_matrix, demands, vehicle_capacity, num_vehicles, depot_index, time_windows)
+        if not 0.0 < min_removal_ratio <= max_removal_ratio <= 1.0:
+            raise ValueError("Removal ratios must satisfy 0 < min_removal_ratio <= max_removal_ratio <= 1")
+        if time_limit is None and max_iterations is None:
+            raise ValueError("At least one of time_limit and max_iterations must be set")
+        if regret_k < 2:
+            raise ValueError(f"regret_k must be at least 2, got {regret_k}")
+        self.time_limit = time_limit
+        self.max_iterations = max_iterations
+        self.min_removal_ratio = min_removal_ratio
+        self.max_removal_ratio = max_removal_ratio
+        self.max_removal = max_removal
+        self.reaction_factor = reaction_factor
+        self.segment_length = segment_length
+        self.start_worsening = start_worsening
+        self.final_temperature_ratio = final_temperature_ratio
+        self.patience = patience
+        self.warm_start_routes = warm_start_routes
+        self.rng = random.Random(seed)
+
+        self.destroy_operators: List[Tuple[str, Callable]] = [
+            ('random', self.random_removal),
+            ('worst', self.worst_removal),
+            ('shaw', self.shaw_removal),
+            ('route', self.route_removal),
+        ]
+        self.repair_operators: List[Tuple[str, int]] = [('greedy', 1)]
+        self.repair_operators += [(f'regret_{k}', k) for k in range(2, regret_k + 1)]
+
+        self.local_search = None
+        if polish:
+            self.local_search = GranularLocalSearch(
+                distance_matrix, demands, vehicle_capacity, depot_index, time_windows
+            )
+
+        # Normalizers of the Shaw relatedness measure
+        self._max_distance = max((max(row) for row in distance_matrix), default=0.0) or 1.0
+        self._max_demand = max(demands, default=0.0) or 1.0
+        self._max_time = 1.0
+        if time_windows is not None:
+            self._max_time = (max(time_windows.ready_times) - min(time_windows.ready_times)) or 1.0
+        # Cost of leaving a customer out: more than serving it on a dedicated route
+        self.unassigned_penalty = 2.0 * self._max_distance + 1.0
+
+        self.fleet_limit = num_vehicles
+        self.last_statistics: Optional[Dict[str, object]] = None
+
+    # ------------------------------------------------------------------
+    # Objective
+    # ------------------------------------------------------------------
+
+    def objective(self, routes: List[List[int]], unassigned: Sequence[int]) -> float:
+        """Total distance plus a penalty for every customer left out."""
+        return self.calculate_solution_fitness(routes) + self.unassigned_penalty * len(unassigned)
+
+    # ------------------------------------------------------------------
+    # Destroy operators: return the partial routes and the removed customers
+    # ------------------------------------------------------------------
+
+    def _remove(self, routes: List[List[int]], removed: Sequence[int]) -> List[List[int]]:
+        """Copy of ``routes`` without the given customers and without empty routes."""
+        removed_set = set(removed)
+        partial = [[c for c in route if c not in removed_set] for route in routes]
+        return [route for route in partial if route]
+
+    def random_removal(self, routes: List[List[int]], count: int) -> Tuple[List[List[int]], List[int]]:
+        """Remove ``count`` customers chosen uniformly at random."""
+        customers = [c for route in routes for c in route]
+        removed = self.rng.sample(customers, min(count, len(customers)))
+        return self._remove(routes, removed), removed
+
+    def worst_removal(self, routes: List[List[int]], count: int) -> Tuple[List[List[int]], List[int]]:
+        """Remove customers whose removal saves the most distance (randomized)."""
+        d = self.distance_matrix
+        depot = self.depot_index
+        partial = [route[:] for route in routes]
+        removed = []
+        for _ in range(min(count, sum(len(route) for route in routes))):
+            savings = []
+            for route_idx, route in enumerate(partial):
+                for pos, customer in enumerate(route):
+                    prev = route[pos - 1] if pos > 0 else depot
+                    nxt = route[pos + 1] if pos + 1 < len(route) else depot
+                    savings.append((d[prev][customer] + d[customer][nxt] - d[prev][nxt], route_idx, pos))
+            savings.sort(reverse=True)
+            _, route_idx, pos = savings[int(self.rng.random() ** WORST_REMOVAL_EXPONENT * len(savings))]
+            removed.append(partial[route_idx].pop(pos))
+        return [route for route in partial if route], removed
+
+    def _relatedness(self, i: int, j: int) -> float:
+        """Shaw relatedness of two customers (lower is more related)."""
+        value = self.distance_matrix[i][j] / self._max_distance
+        value += abs(self.demands[i] - self.demands[j]) / self._max_demand
+        if self.time_windows is not None:
+            ready_times = self.time_windows.ready_times
+            value += abs(ready_times[i] - ready_times[j]) / self._max_time
+        return value
+
+    def shaw_removal(self, routes: List[List[int]], count: int) -> Tuple[List[List[int]], List[int]]:
+        """Remove customers related in location, demand and time to a random seed customer."""
+        remaining = [c for route in routes for c in route]
+        if not remaining:
+            return [], []
+        removed = [remaining.pop(self.rng.randrange(len(remaining)))]
+        while len(removed) < count and remaining:
+            reference = self.rng.choice(removed)
+            remaining.sort(key=lambda c: self._relatedness(reference, c))
+            removed.append(remaining.pop(int(self.rng.random() ** SHAW_REMOVAL_EXPONENT * len(remaining))))
+        return self._remove(routes, removed), removed
+
+    def route_removal(self, routes: List[List[int]], count: int) -> Tuple[List[List[int]], List[int]]:
+        """Remove whole random routes until at least ``count`` customers are out."""
+        order = list(range(len(routes)))
+        self.rng.shuffle(order)
+        removed: List[int] = []
+        dropped = set()
+        for route_idx in order:
+            if len(removed) >= count:
+                break
+            removed.extend(routes[route_idx])
+            dropped.add(route_idx)
+        partial = [route[:] for idx, route in enumerate(routes) if idx not in dropped]
+        return partial, removed
+
+    # ------------------------------------------------------------------
+    # Repair: regret-k insertion with cached insertion costs
+    # ------------------------------------------------------------------
+
+    def _best_insertion(
+        self,
+        customer: int,
+        route: List[int],
+        load: float,
+        schedule: Optional[RouteSchedule],
+    ) -> Optional[Tuple[float, int]]:
+        """Cheapest feasible (cost increase, position) of a customer in a route."""
+        return best_insertion(
+            customer, route, load, schedule, self.distance_matrix, self.demands,
+            self.vehicle_capacity, self.depot_index, self.time_windows
+        )
+
+    def _new_route_cost(self, customer: int) -> Optional[float]:
+        """Cost of serving a customer on a route of its own, None if infeasible."""
+        return new_route_cost(
+            customer, self.distance_matrix, self.demands, self.vehicle_capacity,
+            self.depot_index, self.time_windows
+        )
+
+    def regret_insertion(
+        self,
+        routes: List[List[int]],
+        removed: Sequence[int],
+        k: int,
+    ) -> Tuple[List[List[int]], List[int]]:
+        """Insert customers by decreasing regret-k value (k=1 is greedy insertion).
+
+        The best insertion of every pending customer into every route is
+        cached, together with its k cheapest options. After an insertion only
+        the column of the modified route is recomputed, and a customer's
+        options only when that column touches them.
+
+        Args:
+            routes: Partial solution (modified in place)
+            removed: Customers to insert
+            k: Number of routes compared by the regret value
+
+        Returns:
+            Tuple of (routes, customers that could not be inserted)
+        """
+        loads = [sum(self.demands[c] for c in route) for route in routes]
+        schedules: List[Optional[RouteSchedule]] = [None] * len(routes)
+        if self.time_windows is not None:
+            schedules = [self.time_windows.schedule(route) for route in routes]
+        new_route_costs = {c: self._new_route_cost(c) for c in removed}
+        cache = {
+            c: [self._best_insertion(c, route, load, schedule) for route, load, schedule in zip(routes, loads, schedules)]
+            for c in removed
+        }
+
+        def top_options(customer: int) -> List[Tuple[float, int, int]]:
+            """The k cheapest (cost, route index, position) options of a customer."""
+            options = [(entry[0], route_idx, entry[1]) for route_idx, entry in enumerate(cache[customer]) if entry]
+            if len(routes) < self.fleet_limit and new_route_costs[customer] is not None:
+                options.append((new_route_costs[customer], len(routes), 0))
+            return heapq.nsmallest(k, options)
+
+        pending = list(removed)
+        tops = {c: top_options(c) for c in pending}
+
+        while pending:
+            choice = None
+            best_key = None
+            for customer in pending:
+                top = tops[customer]
+                if not top:
+                    continue
+                # Customers with fewer than k options are the most urgent
+                key = (k - len(top), sum(option[0] - top[0][0] for option in top), -top[0][0])
+                if best_key is None or key > best_key:
+                    best_key, choice = key, (customer, top[0])
+            if choice is None:
+                break
+
+            customer, (_, route_idx, pos) = choice
+            pending.remove(customer)
+            if route_idx == len(routes):
+                routes.append([customer])
+                loads.append(self.demands[customer])
+                schedules.append(self.time_windows.schedule(routes[-1]) if self.time_windows is not None else None)
+                for other in pending:
+                    cache[other].append(self._best_insertion(other, routes[-1], loads[-1], schedules[-1]))
+                    tops[other] = top_options(other)
+                continue
+
+            routes[route_idx].insert(pos, customer)
+            loads[route_idx] += self.demands[customer]
+            if self.time_windows is not None:
+                schedules[route_idx] = self.time_windows.schedule(routes[route_idx])
+            for other in pending:
+                entry = self._best_insertion(other, routes[route_idx], loads[route_idx], schedules[route_idx])
+                cache[other][route_idx] = entry
+                top = tops[other]
+                if (any(option[1] == route_idx for option in top) or
+                        entry is not None and (len(top) < k or entry[0] < top[-1][0])):
+                    tops[other] = top_options(other)
+
+        return routes, pending
+
+    # ------------------------------------------------------------------
+    # Search
+    # ------------------------------------------------------------------
+
+    def _roulette(self, weights: List[float]) -> int:
+        """Index drawn with probability proportional to its weight."""
+        threshold = self.rng.random() * sum(weights)
+        cumulative = 0.0
+        for index, weight in enumerate(weights):
+            cumulative += weight
+            if threshold < cumulative:
+                return index
+        return len(weights) - 1
+
+    def _polish(self, routes: List[List[int]]) -> List[List[int]]:
+        if self.local_search is None:
+            return routes
+        return self.local_search.improve(routes, self.rng)
+
+    def initial_solution(self) -> List[List[int]]:
+        """Repaired warm start, or else the Clarke-Wright savings solution, polished by local search.
+
+        Warm-start customers that do not fit within the fleet get routes of
+        their own, so the initial solution always serves every customer.
+        """
+        if self.warm_start_routes is not None:
+            routes, unassigned = repair_solution(
+                self.warm_start_routes, self.distance_matrix, self.demands, self.vehicle_capacity,
+                self.num_vehicles, self.depot_index, self.time_windows
+            )
+            routes += [[customer] for customer in unassigned]
+        else:
+            routes = clarke_wright_savings(
+                self.distance_matrix, self.demands, self.vehicle_capacity,
+                self.depot_index, time_windows=self.time_windows
+            )
+        return self._polish(routes)
+
+    def solve_vrp(self) -> List[List[int]]:
+        """Solve VRP with ALNS until the time (or iteration) budget runs out.
+
+        Returns:
+            Best solution found as list of routes
+        """
+        if self.num_locations <= 1:
+            return []
+
+        print("Starting ALNS for VRP...")
+        start_time = time.time()
+        current = self.initial_solution()
+        self.fleet_limit = max(self.num_vehicles, len(current))
+        current_cost = self.objective(current, [])
+        # Customers the current solution leaves unserved (it may be an accepted partial solution)
+        current_unassigned: List[int] = []
+        best, best_cost = current, current_cost
+        best_iteration = 0
+
+        num_customers = sum(len(route) for route in current)
+        min_removal = max(1, int(self.min_removal_ratio * num_customers))
+        max_removal = max(min_removal, min(self.max_removal, int(self.max_removal_ratio * num_customers)))
+        start_temperature = self.start_worsening * current_cost / math.log(2) if current_cost > 0 else 1.0
+
+        destroy_weights = [1.0] * len(self.destroy_operators)
+        repair_weights = [1.0] * len(self.repair_operators)
+        destroy_scores = [0.0] * len(self.destroy_operators)
+        repair_scores = [0.0] * len(self.repair_operators)
+        destroy_uses = [0] * len(self.destroy_operators)
+        repair_uses = [0] * len(self.repair_operators)
+
+        iteration = 0
+        while True:
+            progress = (time.time() - start_time) / self.time_limit if self.time_limit else 0.0
+            if self.max_iterations is not None:
+                progress = max(progress, iteration / self.max_iterations)
+            if progress >= 1.0:
+                reached_iterations = self.max_iterations is not None and iteration >= self.max_iterations
+                self.stop_reason = 'max_iterations' if reached_iterations else 'time_limit'
+                break
+            if self.patience is not None and iteration - best_iteration >= self.patience:
+                self.stop_reason = 'converged'
+                break
+            temperature = start_temperature * self.final_temperature_ratio ** progress
+
+            destroy_idx = self._roulette(destroy_weights)
+            repair_idx = self._roulette(repair_weights)
+            count = self.rng.randint(min_removal, max_removal)
+            partial, removed = self.destroy_operators[destroy_idx][1](current, count)
+            candidate, unassigned = self.regret_insertion(
+                partial, removed + current_unassigned, self.repair_operators[repair_idx][1]
+            )
+            candidate_cost = self.objective(candidate, unassigned)
+
+            score = 0.0
+            if not unassigned and candidate_cost < best_cost - EPSILON:
+                candidate = self._polish(candidate)
+                candidate_cost = self.objective(candidate, [])
+                best, best_cost = candidate, candidate_cost
+                current, current_cost, current_unassigned = candidate, candidate_cost, []
+                best_iteration = iteration + 1
+                score = SCORE_BEST
+            elif candidate_cost < current_cost - EPSILON:
+                current, current_cost, current_unassigned = candidate, candidate_cost, unassigned
+                score = SCORE_BETTER
+            elif self.rng.random() < math.exp(-(candidate_cost - current_cost) / temperature):
+                current, current_cost, current_unassigned = candidate, candidate_cost, unassigned
+                score = SCORE_ACCEPTED
+
+            destroy_scores[destroy_idx] += score
+            repair_scores[repair_idx] += score
+            destroy_uses[destroy_idx] += 1
+            repair_uses[repair_idx] += 1
+            iteration += 1
+
+            if iteration % self.segment_length == 0:
+                for weights, scores, uses in ((destroy_weights, destroy_scores, destroy_uses),
+                                              (repair_weights, repair_scores, repair_uses)):
+                    for i in range(len(weights)):
+                        if uses[i]:
+                            weights[i] = ((1 - self.reaction_factor) * weights[i] +
+                                          self.reaction_factor * scores[i] / uses[i])
+                        weights[i] = max(weights[i], 0.01)  # Keep every operator selectable
+                        scores[i] = 0.0
+                        uses[i] = 0
+
+            if iteration % 1000 == 0:
+                print(f"Iteration {iteration}: Best fitness = {best_cost:.2f}")
+
+        self.last_statistics = {
+            'iterations': iteration,
+            'best_fitness': best_cost,
+            'destroy_weights': {name: w for (name, _), w in zip(self.destroy_operators, destroy_weights)},
+            'repair_weights': {name: w for (name, _), w in zip(self.repair_operators, repair_weights)},
+        }
+        print(f"Final best fitness: {best_cost:.2f} after {iteration} iterations")
+        return [route[:] for route in best]
@@ -0,0 +1,230 @@
+"""Batch solving of Solomon-format instance suites on a process pool.
+
+Instances are read from a directory or a zip/tar archive and solved with
+``solve_solomon_vrp`` in worker processes, largest first so that the long
+jobs do not end up last. Each result is written as soon as it finishes, as a
+CSV row or a JSON line, with the gap to a best-known-solution (BKS) table
+when one is given.
+
+Command line::
+
+    python -m smart_decision_miniproject.solver.vrp_batch instances/ -o results.csv --bks bks.csv
+"""
+
+import argparse
+import contextlib
+import csv
+import io
+import json
+import os
+import sys
+import tarfile
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+from smart_decision_miniproject.solver.VRP import solve_solomon_vrp
+
+# Extensions of instance files inside directories and archives
+INSTANCE_EXTENSIONS = ('.txt', '.vrp')
+
+# Columns of the result records, in output order
+RESULT_FIELDS = ('instance', 'customers', 'vehicles', 'distance', 'time', 'stop_reason', 'bks', 'gap', 'error')
+
+
+def _instance_name(path: str) -> str:
+    return os.path.splitext(os.path.basename(path))[0]
+
+
+def _is_instance(path: str) -> bool:
+    return path.lower().endswith(INSTANCE_EXTENSIONS)
+
+
+def read_instances(source: str) -> List[Tuple[str, str]]:
+    """Read every instance file of a directory or archive.
+
+    Args:
+        source: Directory (searched recursively), zip archive or tar archive
+            (optionally compressed), or a single instance file
+
+    Returns:
+        List of (instance name, file content), sorted by name
+
+    Raises:
+        ValueError: If the source is neither a directory nor a supported file
+    """
+    instances = []
+    if os.path.isdir(source):
+        for root, _, files in os.walk(source):
+            for file_name in files:
+                if _is_instance(file_name):
+                    with open(os.path.join(root, file_name), encoding='utf-8') as f:
+                        instances.append((_instance_name(file_name), f.read()))
+    elif zipfile.is_zipfile(source):
+        with zipfile.ZipFile(source) as archive:
+            for member in archive.namelist():
+                if _is_instance(member):
+                    instances.append((_instance_name(member), archive.read(member).decode('utf-8')))
+    elif os.path.isfile(source) and tarfile.is_tarfile(source):
+        with tarfile.open(source) as archive:
+            for member in archive.getmembers():
+                if member.isfile() and _is_instance(member.name):
+                    instances.append((_instance_name(member.name), archive.extractfile(member).read().decode('utf-8')))
+    elif os.path.isfile(source):
+        with open(source, encoding='utf-8') as f:
+            instances.append((_instance_name(source), f.read()))
+    else:
+        raise ValueError(f"Instance source not found: {source}")
+    return sorted(instances)
+
+
+def load_bks(path: str) -> Dict[str, float]:
+    """Read a best-known-solution table.
+
+    The CSV file needs an ``instance`` column and a ``distance`` column;
+    other columns (e.g. ``vehicles``) are ignored. Instance names are
+    compared case-insensitively.
+
+    Raises:
+        ValueError: If a required column is missing
+    """
+    with open(path, newline='', encoding='utf-8') as f:
+        reader = csv.DictReader(f)
+        if reader.fieldnames is None or not {'instance', 'distance'} <= set(reader.fieldnames):
+            raise ValueError(f"BKS table {path} needs 'instance' and 'distance' columns")
+        return {row['instance'].strip().lower(): float(row['distance']) for row in reader if row['distance']}
+
+
+def _solve_instance(name: str, content: str, solver_type: str, use_time_windows: bool,
+                    time_limit: float) -> Dict[str, object]:
+    """Solve one instance in a worker process, keeping its progress output quiet."""
+    record: Dict[str, object] = {'instance': name}
+    start_time = time.time()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = solve_solomon_vrp(content, use_time_windows=use_time_windows,
+                                       solver_type=solver_type, time_limit=time_limit)
+        record.update({
+            'customers': len(result.customers) - 1,
+            'vehicles': result.num_vehicles_used,
+            'distance': round(result.total_distance, 2),
+            'stop_reason': result.stop_reason,
+        })
+    except Exception as e:  # A broken instance must not stop the batch
+        record['error'] = f"{type(e).__name__}: {e}"
+    record['time'] = round(time.time() - start_time, 3)
+    return record
+
+
+class ResultWriter:
+    """Writes result records to CSV or JSON Lines as they arrive."""
+
+    def __init__(self, stream: TextIO, output_format: str):
+        """Initialize the writer.
+
+        Args:
+            stream: Open text stream
+            output_format: 'csv' or 'json' (one JSON object per line)
+
+        Raises:
+            ValueError: If the format is unknown
+        """
+        if output_format not in ('csv', 'json'):
+            raise ValueError(f"Unknown output format: {output_format}")
+        self.stream = stream
+        self.output_format = output_format
+        self._csv = None
+        if output_format == 'csv':
+            self._csv = csv.DictWriter(stream, fieldnames=RESULT_FIELDS, extrasaction='ignore')
+            self._csv.writeheader()
+
+    def write(self, record: Dict[str, object]) -> None:
+        if self._csv is not None:
+            self._csv.writerow(record)
+        else:
+            self.stream.write(json.dumps(record) + '\n')
+        self.stream.flush()
+
+
+def solve_batch(
+    instances: Sequence[Tuple[str, str]],
+    solver_type: str = 'alns',
+    use_time_windows: Optional[bool] = None,
+    time_limit: float = 10.0,
+    workers: Optional[int] = None,
+    bks: Optional[Dict[str, float]] = None,
+) -> Iterator[Dict[str, object]]:
+    """Solve instances on a process pool, yielding each result as it finishes.
+
+    Args:
+        instances: List of (instance name, Solomon file content)
+        solver_type: Solver passed to ``solve_solomon_vrp``
+        use_time_windows: Whether time windows are enforced; None enforces them
+            for the solvers that support them, i.e. all but 'hgs' (capacity only)
+        time_limit: Time limit of each instance in seconds
+        workers: Number of worker processes, None for the number of CPUs
+        bks: Best-known distances by lower-case instance name, to report gaps
+
+    Yields:
+        Records with the fields of ``RESULT_FIELDS`` (missing ones are absent);
+        ``gap`` is the distance excess over the BKS in percent
+
+    Raises:
+        ValueError: If time windows are requested for the 'hgs' solver
+    """
+    if use_time_windows is None:
+        use_time_windows = solver_type != 'hgs'
+    elif use_time_windows and solver_type == 'hgs':
+        raise ValueError("The HGS solver does not support time windows")
+    # Largest first, by file size: it grows with the customer count and needs no parse here
+    order = sorted(instances, key=lambda item: len(item[1]), reverse=True)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_solve_instance, name, content, solver_type, use_time_windows, time_limit)
+            for name, content in order
+        ]
+        for future in as_completed(futures):
+            record = future.result()
+            best_known = (bks or {}).get(str(record['instance']).lower())
+            if best_known is not None:
+                record['bks'] = best_known
+                if 'distance' in record and best_known > 0:
+                    record['gap'] = round(100.0 * (record['distance'] - best_known) / best_known, 2)
+            yield record
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command-line entry point; returns 1 if an instance failed, else 0."""
+    parser = argparse.ArgumentParser(description="Solve a suite of Solomon-format VRP instances.")
+    parser.add_argument('source', help="directory, zip or tar archive of instance files")
+    parser.add_argument('-o', '--output', help="output file (.csv or .json/.jsonl), default: CSV on stdout")
+    parser.add_argument('--format', choices=('csv', 'json'), help="output format, default: from the file extension")
+    parser.add_argument('--solver', choices=('ga', 'alns', 'hgs'), default='alns', help="solver (default: alns)")
+    parser.add_argument('--time-limit', type=float, default=10.0, help="seconds per instance (default: 10)")
+    parser.add_argument('--workers', type=int, help="worker processes (default: number of CPUs)")
+    parser.add_argument('--bks', help="CSV table of best-known distances (columns: instance, distance)")
+    parser.add_argument('--no-time-windows', action='store_true',
+                        help="ignore time windows (capacity only; always the case with --solver hgs)")
+    args = parser.parse_args(argv)
+
+    output_format = args.format
+    if output_format is None:
+        output_format = 'json' if args.output and args.output.lower().endswith(('.json', '.jsonl')) else 'csv'
+    instances = read_instances(args.source)
+    bks = load_bks(args.bks) if args.bks else None
+    print(f"Solving {len(instances)} instances with {args.solver}...", file=sys.stderr)
+
+    failures = 0
+    with open(args.output, 'w', newline='', encoding='utf-8') if args.output else contextlib.nullcontext(sys.stdout) as stream:
+        writer = ResultWriter(stream, output_format)
+        for record in solve_batch(instances, args.solver, False if args.no_time_windows else None, args.time_limit,
+                                  args.workers, bks):
+            writer.write(record)
+            failures += 'error' in record
+            print(f"{record['instance']}: {record.get('distance', record.get('error'))}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,142 @@
+"""Construction heuristics producing good initial VRP solutions."""
+
+import heapq
+import random
+from typing import List, Optional, Sequence
+
+from smart_decision_miniproject.solver.vrp_time_windows import TimeWindows
+
+# Tolerance used when comparing floating point loads
+EPSILON = 1e-9
+
+
+def clarke_wright_savings(
+    distance_matrix: Sequence[Sequence[float]],
+    demands: Sequence[float],
+    vehicle_capacity: float,
+    depot_index: int = 0,
+    shape_parameter: float = 1.0,
+    noise: float = 0.0,
+    rng: Optional[random.Random] = None,
+    time_windows: Optional[TimeWindows] = None,
+) -> List[List[int]]:
+    """Build routes with the parallel Clarke-Wright savings algorithm.
+
+    All positive savings ``s(i, j) = d(0, i) + d(0, j) - shape_parameter * d(i, j)``
+    go into a binary heap and are popped in decreasing order. Each pop merges the
+    two routes ending in i and j if capacity (and time windows) allow it, so the
+    whole construction runs in O(n^2 log n).
+
+    Args:
+        distance_matrix: Square matrix of distances between locations
+        demands: Demand for each location
+        vehicle_capacity: Maximum capacity for each vehicle
+        depot_index: Index of the depot
+        shape_parameter: Weight of the i-j distance in the savings (the
+            classic lambda); values other than 1 favour rounder or longer routes
+        noise: Relative random perturbation of each saving, 0 for the
+            deterministic algorithm
+        rng: Random generator for the perturbation (defaults to the random module)
+        time_windows: Time-window data; routes are then only joined end to
+            start, without reversal, and only if the joined route is on time
+
+    Returns:
+        List of capacity-feasible routes
+    """
+    rng = rng or random
+    num_locations = len(distance_matrix)
+    customers = [i for i in range(num_locations) if i != depot_index]
+    depot_row = distance_matrix[depot_index]
+
+    heap = []
+    for index, i in enumerate(customers):
+        row = distance_matrix[i]
+        from_depot_i = depot_row[i]
+        for j in customers[index + 1:]:
+            saving = from_depot_i + depot_row[j] - shape_parameter * row[j]
+            if noise:
+                saving *= 1.0 + noise * (2.0 * rng.random() - 1.0)
+            if saving > 0:
+                heap.append((-saving, i, j))
+    heapq.heapify(heap)
+
+    # Every customer starts on its own route, identified by the customer index
+    routes = {c: [c] for c in customers}
+    loads = {c: demands[c] for c in customers}
+    route_of = list(range(num_locations))
+    schedules = {c: time_windows.schedule([c]) for c in customers} if time_windows is not None else None
+
+    while heap:
+        _, i, j = heapq.heappop(heap)
+        route_i, route_j = route_of[i], route_of[j]
+        if route_i == route_j or loads[route_i] + loads[route_j] > vehicle_capacity + EPSILON:
+            continue
+        first, second = routes[route_i], routes[route_j]
+
+        if time_windows is not None:
+            # Without reversal: the route ending in one customer must precede the one starting with the other
+            if first[-1] == i and second[0] == j:
+                head_id, tail_id = route_i, route_j
+            elif second[-1] == j and first[0] == i:
+                head_id, tail_id = route_j, route_i
+            else:
+                continue
+            head, tail = routes[head_id], routes[tail_id]
+            if not time_windows.can_join(head, schedules[head_id], len(head), tail, schedules[tail_id], 0):
+                continue
+            merged = head + tail
+        else:
+            if first[-1] != i and first[0] != i or second[-1] != j and second[0] != j:
+                continue  # i or j is an interior customer
+            if first[-1] != i:
+                first = first[::-1]
+            if second[0] != j:
+                second = second[::-1]
+            merged = first + second
+
+        routes[route_i] = merged
+        loads[route_i] += loads.pop(route_j)
+        del routes[route_j]
+        for customer in merged:
+            route_of[customer] = route_i
+        if schedules is not None:
+            schedules[route_i] = time_windows.schedule(merged)
+            del schedules[route_j]
+
+    return list(routes.values())
+
+
+def randomized_clarke_wright_savings(
+    distance_matrix: Sequence[Sequence[float]],
+    demands: Sequence[float],
+    vehicle_capacity: float,
+    depot_index: int = 0,
+    rng: Optional[random.Random] = None,
+    time_windows: Optional[TimeWindows] = None,
+) -> List[List[int]]:
+    """Savings construction with a random shape parameter and noisy savings.
+
+    Used to obtain diverse yet good solutions, e.g. to seed a GA population.
+
+    Args:
+        distance_matrix: Square matrix of distances between locations
+        demands: Demand for each location
+        vehicle_capacity: Maximum capacity for each vehicle
+        depot_index: Index of the depot
+        rng: Random generator (defaults to the random module)
+        time_windows: Time-window data for VRPTW instances
+
+    Returns:
+        List of capacity-feasible routes
+    """
+    rng = rng or random
+    return clarke_wright_savings(
+        distance_matrix,
+        demands,
+        vehicle_capacity,
+        depot_index,
+        shape_parameter=rng.uniform(0.6, 1.6),
+        noise=rng.uniform(0.0, 0.2),
+        rng=rng,
+        time_windows=time_windows,
+    )
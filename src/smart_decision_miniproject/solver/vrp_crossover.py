@@ -0,0 +1,234 @@
+"""Permutation crossover operators working on reusable buffers.
+
+All operators run in linear time: membership tests use a flag array indexed
+by location instead of ``in`` checks against lists, and every scratch
+structure is allocated once per operator object and reused for each child.
+"""
+
+import random
+from typing import List, Optional, Sequence
+
+
+class PermutationCrossover:
+    """Order (OX), partially mapped (PMX) and edge recombination (ERX) crossover.
+
+    Parents are permutations of location indices smaller than
+    ``num_locations``. Each method writes the child into ``out`` when given,
+    so callers that keep their own buffers do not allocate at all.
+    """
+
+    # Each location has at most four distinct neighbours in two parents
+    MAX_NEIGHBOURS = 4
+
+    def __init__(self, num_locations: int):
+        """Initialize the scratch buffers.
+
+        Args:
+            num_locations: Number of locations, an upper bound on customer indices
+        """
+        self.num_locations = num_locations
+        # Position + 1 of a gene inside the copied segment, 0 if absent
+        self._segment_index = [0] * num_locations
+        # ERX adjacency table: MAX_NEIGHBOURS slots per location plus a degree count
+        self._neighbours = [0] * (num_locations * self.MAX_NEIGHBOURS)
+        self._degree = [0] * num_locations
+        # ERX pool of unvisited genes with O(1) removal
+        self._unvisited = [0] * num_locations
+        self._unvisited_index = [0] * num_locations
+
+    @staticmethod
+    def _output(out: Optional[List[int]], n: int) -> List[int]:
+        return out if out is not None else [0] * n
+
+    def order_crossover(
+        self,
+        segment_parent: Sequence[int],
+        fill_parent: Sequence[int],
+        point1: int,
+        point2: int,
+        out: Optional[List[int]] = None,
+    ) -> List[int]:
+        """Order crossover (OX) in O(n).
+
+        The child keeps ``segment_parent[point1:point2]`` in place; the other
+        positions are filled from left to right with the remaining genes in
+        the order they appear in ``fill_parent``.
+
+        Args:
+            segment_parent: Parent providing the copied segment
+            fill_parent: Parent providing the order of the remaining genes
+            point1: Start of the segment (inclusive)
+            point2: End of the segment (exclusive)
+            out: Optional buffer of length n receiving the child
+
+        Returns:
+            The child permutation
+        """
+        n = len(segment_parent)
+        child = self._output(out, n)
+        in_segment = self._segment_index
+
+        for i in range(point1, point2):
+            gene = segment_parent[i]
+            child[i] = gene
+            in_segment[gene] = 1
+
+        position = 0 if point1 > 0 else point2
+        for gene in fill_parent:
+            if not in_segment[gene]:
+                child[position] = gene
+                position += 1
+                if position == point1:
+                    position = point2
+
+        for i in range(point1, point2):
+            in_segment[segment_parent[i]] = 0
+        return child
+
+    def partially_mapped_crossover(
+        self,
+        segment_parent: Sequence[int],
+        fill_parent: Sequence[int],
+        point1: int,
+        point2: int,
+        out: Optional[List[int]] = None,
+    ) -> List[int]:
+        """Partially mapped crossover (PMX).
+
+        The child keeps ``segment_parent[point1:point2]``; every other
+        position takes the gene of ``fill_parent``, following the segment
+        mapping whenever that gene already appears in the segment.
+
+        Args:
+            segment_parent: Parent providing the copied segment
+            fill_parent: Parent providing the genes outside the segment
+            point1: Start of the segment (inclusive)
+            point2: End of the segment (exclusive)
+            out: Optional buffer of length n receiving the child
+
+        Returns:
+            The child permutation
+        """
+        n = len(segment_parent)
+        child = self._output(out, n)
+        segment_index = self._segment_index
+
+        for i in range(point1, point2):
+            gene = segment_parent[i]
+            child[i] = gene
+            segment_index[gene] = i + 1
+
+        for i in range(n):
+            if point1 <= i < point2:
+                continue
+            gene = fill_parent[i]
+            while segment_index[gene]:
+                gene = fill_parent[segment_index[gene] - 1]
+            child[i] = gene
+
+        for i in range(point1, point2):
+            segment_index[segment_parent[i]] = 0
+        return child
+
+    def _add_edge(self, a: int, b: int) -> None:
+        """Record b as a neighbour of a unless it is already present."""
+        base = a * self.MAX_NEIGHBOURS
+        degree = self._degree[a]
+        for slot in range(base, base + degree):
+            if self._neighbours[slot] == b:
+                return
+        self._neighbours[base + degree] = b
+        self._degree[a] = degree + 1
+
+    def _remove_edge(self, a: int, b: int) -> None:
+        """Remove b from the neighbour list of a."""
+        base = a * self.MAX_NEIGHBOURS
+        last = base + self._degree[a] - 1
+        for slot in range(base, last + 1):
+            if self._neighbours[slot] == b:
+                self._neighbours[slot] = self._neighbours[last]
+                self._degree[a] -= 1
+                return
+
+    def edge_recombination(
+        self,
+        parent1: Sequence[int],
+        parent2: Sequence[int],
+        out: Optional[List[int]] = None,
+        rng: Optional[random.Random] = None,
+    ) -> List[int]:
+        """Edge recombination crossover (ERX) in O(n).
+
+        Builds the union of both parents' adjacencies, then walks from the
+        first gene of ``parent1``, always moving to the neighbour with the
+        fewest remaining neighbours, so the child inherits mostly parental edges.
+
+        Args:
+            parent1: First parent
+            parent2: Second parent
+            out: Optional buffer of length n receiving the child
+            rng: Random generator for tie breaking (defaults to the random module)
+
+        Returns:
+            The child permutation
+        """
+        rng = rng or random
+        n = len(parent1)
+        child = self._output(out, n)
+        if n == 0:
+            return child
+
+        max_neighbours = self.MAX_NEIGHBOURS
+        neighbours = self._neighbours
+        degree = self._degree
+        unvisited = self._unvisited
+        unvisited_index = self._unvisited_index
+
+        for i, gene in enumerate(parent1):
+            degree[gene] = 0
+            unvisited[i] = gene
+            unvisited_index[gene] = i
+        for parent in (parent1, parent2):
+            previous = parent[-1]
+            for gene in parent:
+                self._add_edge(previous, gene)
+                self._add_edge(gene, previous)
+                previous = gene
+
+        remaining = n
+        current = parent1[0]
+        for position in range(n):
+            child[position] = current
+
+            # Drop current from the unvisited pool (swap with the last entry)
+            remaining -= 1
+            index = unvisited_index[current]
+            last_gene = unvisited[remaining]
+            unvisited[index] = last_gene
+            unvisited_index[last_gene] = index
+
+            base = current * max_neighbours
+            current_degree = degree[current]
+            for slot in range(base, base + current_degree):
+                self._remove_edge(neighbours[slot], current)
+
+            if remaining == 0:
+                break
+
+            best_gene = -1
+            best_degree = max_neighbours + 1
+            ties = 0
+            for slot in range(base, base + current_degree):
+                candidate = neighbours[slot]
+                candidate_degree = degree[candidate]
+                if candidate_degree < best_degree:
+                    best_gene, best_degree, ties = candidate, candidate_degree, 1
+                elif candidate_degree == best_degree:
+                    ties += 1
+                    if rng.random() * ties < 1.0:
+                        best_gene = candidate
+            degree[current] = 0
+
+            current = best_gene if best_gene >= 0 else unvisited[int(rng.random() * remaining)]
+
+        return child
@@ -0,0 +1,124 @@
+"""Customer records and their columnar (struct-of-arrays) storage."""
+
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Sequence
+
+import numpy as np
+
+
+@dataclass
+class Customer:
+    """客户点信息"""
+    id: int
+    x: float
+    y: float
+    demand: int
+    ready_time: int
+    due_time: int
+    service_time: int
+
+
+# Attributes of a customer, in Solomon column order
+CUSTOMER_FIELDS = ('id', 'x', 'y', 'demand', 'ready_time', 'due_time', 'service_time')
+
+# Coordinates are floats, every other attribute an integer
+_FIELD_DTYPES = {name: np.float64 if name in ('x', 'y') else np.int64 for name in CUSTOMER_FIELDS}
+
+
+class CustomerTable:
+    """Customers stored as one NumPy array per attribute (row 0 is the depot).
+
+    Indexing with an integer returns a ``Customer`` built from the row and
+    iterating yields every row as a ``Customer``, so code written for a list
+    of customers keeps working. Vectorized code reads the columns directly,
+    e.g. ``table.x[route]``.
+    """
+
+    def __init__(self, columns: Dict[str, np.ndarray]):
+        """Wrap existing columns.
+
+        Args:
+            columns: Array of every name in ``CUSTOMER_FIELDS``, all of the same length
+
+        Raises:
+            ValueError: If a column is missing or the lengths differ
+        """
+        missing = [name for name in CUSTOMER_FIELDS if name not in columns]
+        if missing:
+            raise ValueError(f"Missing customer columns: {missing}")
+        self.columns = {name: np.asarray(columns[name], dtype=_FIELD_DTYPES[name]) for name in CUSTOMER_FIELDS}
+        lengths = {len(column) for column in self.columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Customer columns have different lengths: {sorted(lengths)}")
+
+    @classmethod
+    def from_customers(cls, customers: Sequence[Customer]) -> 'CustomerTable':
+        """Build a table from customer records."""
+        return cls({name: [getattr(c, name) for c in customers] for name in CUSTOMER_FIELDS})
+
+    @property
+    def id(self) -> np.ndarray:
+        return self.columns['id']
+
+    @property
+    def x(self) -> np.ndarray:
+        return self.columns['x']
+
+    @property
+    def y(self) -> np.ndarray:
+        return self.columns['y']
+
+    @property
+    def demand(self) -> np.ndarray:
+        return self.columns['demand']
+
+    @property
+    def ready_time(self) -> np.ndarray:
+        return self.columns['ready_time']
+
+    @property
+    def due_time(self) -> np.ndarray:
+        return self.columns['due_time']
+
+    @property
+    def service_time(self) -> np.ndarray:
+        return self.columns['service_time']
+
+    def __len__(self) -> int:
+        return len(self.columns['id'])
+
+    def __getitem__(self, index: int) -> Customer:
+        return Customer(*(self.columns[name][index].item() for name in CUSTOMER_FIELDS))
+
+    def __iter__(self) -> Iterator[Customer]:
+        rows = zip(*(self.columns[name].tolist() for name in CUSTOMER_FIELDS))
+        return (Customer(*row) for row in rows)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CustomerTable):
+            return all(np.array_equal(self.columns[name], other.columns[name]) for name in CUSTOMER_FIELDS)
+        if isinstance(other, (list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def to_list(self) -> List[Customer]:
+        """All rows as customer records."""
+        return list(self)
+
+    def append(self, customer: Customer) -> None:
+        """Add a customer at the end of the table (copies the columns)."""
+        for name in CUSTOMER_FIELDS:
+            self.columns[name] = np.append(self.columns[name], getattr(customer, name)).astype(_FIELD_DTYPES[name])
+
+    def distance_matrix(self) -> np.ndarray:
+        """Euclidean distances between all customers."""
+        dx = self.x[:, None] - self.x[None, :]
+        dy = self.y[:, None] - self.y[None, :]
+        return np.sqrt(dx * dx + dy * dy)
+
+    def route_distance(self, route: Sequence[int], depot_index: int = 0) -> float:
+        """Euclidean length of a route starting and ending at the depot."""
+        if len(route) == 0:
+            return 0.0
+        stops = np.concatenate(([depot_index], route, [depot_index]))
+        return float(np.hypot(np.diff(self.x[stops]), np.diff(self.y[stops])).sum())
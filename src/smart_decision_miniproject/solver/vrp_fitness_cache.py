@@ -0,0 +1,82 @@
+"""Canonical solution keys and a bounded fitness cache for the VRP GA.
+
+Keys are 16-byte BLAKE2b digests rather than the tours themselves, so a
+full cache stays a few megabytes even with thousands of customers.
+"""
+
+import hashlib
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Sequence
+
+# Bytes per key digest; collisions are negligible at 128 bits
+KEY_DIGEST_SIZE = 16
+
+
+def tour_key(tour: Sequence[int]) -> bytes:
+    """Digest of a sequence of customer indices, e.g. a giant tour."""
+    return hashlib.blake2b(array('i', tour).tobytes(), digest_size=KEY_DIGEST_SIZE).digest()
+
+
+def canonical_solution_key(routes: List[List[int]]) -> bytes:
+    """Key identifying a solution independently of the order of its routes.
+
+    Empty routes are ignored; the direction of each route is kept, since it
+    matters once time windows apply. The routes are sorted and joined with a
+    -1 separator before being digested.
+    """
+    joined = []
+    for route in sorted(tuple(route) for route in routes if route):
+        joined.extend(route)
+        joined.append(-1)
+    return tour_key(joined)
+
+
+class FitnessCache:
+    """Least-recently-used map from solution keys to fitness values.
+
+    The giant-tour GA stores (fitness, canonical key) pairs under the tour key.
+    """
+
+    def __init__(self, max_size: int = 10000):
+        """Initialize an empty cache.
+
+        Args:
+            max_size: Maximum number of stored entries; 0 disables caching
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Cached fitness of ``key``, or None; counts a hit or a miss."""
+        fitness = self._entries.get(key)
+        if fitness is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return fitness
+
+    def put(self, key: Hashable, fitness: Any) -> None:
+        """Store a fitness value, evicting the least recently used entry if full."""
+        if self.max_size <= 0:
+            return
+        self._entries[key] = fitness
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def statistics(self) -> Dict[str, float]:
+        """Hit and miss counters, current size and hit rate."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size': len(self._entries),
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+        }
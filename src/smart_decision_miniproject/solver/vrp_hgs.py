@@ -0,0 +1,407 @@
+"""Hybrid Genetic Search (HGS) for the capacitated VRP.
+
+Chromosomes are giant tours decoded by Split. Every offspring is educated
+by granular local search, which may leave it overloaded: capacity is a soft
+constraint priced by a penalty that is adapted to keep a target share of
+feasible offspring. Feasible and infeasible individuals live in separate
+subpopulations ranked by a biased fitness that combines cost with the
+diversity contribution, measured by the broken-pairs distance to the closest
+individuals. Survivor selection removes clones first.
+
+Population sizes and the granular neighbourhood default to smaller values
+than in the original HGS (25 + 40 individuals, 20 neighbours): education in
+pure Python is slow enough that a short budget is better spent on more
+generations of a small population.
+
+The fleet size is not limited: the solver minimizes distance with as many
+vehicles as it needs. Time windows are not supported.
+"""
+
+import math
+import random
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from smart_decision_miniproject.solver.VRP import BaseVRPSolver
+from smart_decision_miniproject.solver.vrp_construction import randomized_clarke_wright_savings
+from smart_decision_miniproject.solver.vrp_crossover import PermutationCrossover
+from smart_decision_miniproject.solver.vrp_local_search import GranularLocalSearch
+from smart_decision_miniproject.solver.vrp_split import routes_to_giant_tour, split_penalized
+from smart_decision_miniproject.solver.vrp_warm_start import perturb_solution, repair_solution
+
+# Tolerance used when comparing loads and costs
+EPSILON = 1e-9
+
+# Bounds of the capacity penalty and its adaptation factors
+MIN_PENALTY = 0.1
+MAX_PENALTY = 100000.0
+PENALTY_INCREASE = 1.2
+PENALTY_DECREASE = 0.85
+
+
+class Individual:
+    """An educated solution with its giant tour and cached evaluation."""
+
+    __slots__ = ('giant_tour', 'routes', 'distance', 'excess', 'successors', 'predecessors', 'biased_fitness')
+
+    def __init__(self, routes: List[List[int]], distance: float, excess: float, num_locations: int, depot_index: int):
+        """Wrap a solution.
+
+        Args:
+            routes: List of non-empty routes
+            distance: Total distance of the routes
+            excess: Total load above capacity over all routes
+            num_locations: Number of locations including the depot
+            depot_index: Index of the depot
+        """
+        self.routes = routes
+        self.giant_tour = routes_to_giant_tour(routes)
+        self.distance = distance
+        self.excess = excess
+        self.biased_fitness = 0.0
+        # Neighbours of every customer in the solution, for the broken-pairs distance
+        self.successors = np.full(num_locations, depot_index, dtype=np.int32)
+        self.predecessors = np.full(num_locations, depot_index, dtype=np.int32)
+        for route in routes:
+            self.successors[route[:-1]] = route[1:]
+            self.predecessors[route[1:]] = route[:-1]
+
+    @property
+    def is_feasible(self) -> bool:
+        return self.excess <= EPSILON
+
+    def penalized_cost(self, capacity_penalty: float) -> float:
+        """Distance plus the penalty on excess load."""
+        return self.distance + capacity_penalty * self.excess
+
+
+class HGSVRPSolver(BaseVRPSolver):
+    """CVRP solver using Hybrid Genetic Search with feasible and infeasible subpopulations."""
+
+    def __init__(
+        self,
+        distance_matrix: List[List[float]],
+        demands: List[float],
+        vehicle_capacity: float,
+        num_vehicles: int,
+        depot_index: int = 0,
+        time_limit: Optional[float] = 10.0,
+        max_iterations: Optional[int] = None,
+        min_population: int = 10,
+        initial_population: int = 10,
+        savings_ratio: float = 0.2,
+        generation_size: int = 20,
+        num_elite: int = 4,
+        num_close: int = 5,
+        target_feasible_ratio: float = 0.2,
+        penalty_interval: int = 100,
+        repair_probability: float = 0.5,
+        max_iterations_without_improvement: int = 5000,
+        num_neighbours: int = 10,
+        warm_start_routes: Optional[List[List[int]]] = None,
+        warm_start_ratio: float = 0.2,
+        seed: Optional[int] = None
+    ):
+        """Initialize the HGS solver.
+
+        Args:
+            distance_matrix: Square matrix of distances between locations
+            demands: Demand for each customer
+            vehicle_capacity: Maximum capacity for each vehicle
+            num_vehicles: Nominal number of vehicles; not enforced, HGS uses
+                as many routes as the best solution needs
+            depot_index: Index of the depot
+            time_limit: Wall-clock budget in seconds, None for no time limit
+            max_iterations: Optional iteration budget, None to run until the time limit
+            min_population: Size of each subpopulation after survivor selection
+            initial_population: Number of educated individuals created at the
+                start and at each restart (the original HGS uses four times
+                ``min_population``; fewer leave more of a short budget to crossover)
+            savings_ratio: Share of the initial individuals built from randomized
+                Clarke-Wright solutions instead of random giant tours
+            generation_size: Offspring added to a subpopulation before survivor selection
+            num_elite: Number of best individuals protected by the biased fitness
+            num_close: Number of closest individuals defining the diversity contribution
+            target_feasible_ratio: Desired share of feasible offspring after education
+            penalty_interval: Iterations between two capacity penalty adaptations
+            repair_probability: Probability to repair an infeasible offspring
+                with a ten times higher penalty
+            max_iterations_without_improvement: Iterations without a new best
+                solution before the population is restarted
+            num_neighbours: Size of the granular neighbourhood of the local search
+            warm_start_routes: Previous solution (e.g. for other parameters),
+                repaired and injected into the first initial population
+            warm_start_ratio: Share of the first initial population made of the
+                repaired warm start and its perturbations
+            seed: Seed of the random number generator, None for a random run
+
+        Raises:
+            ValueError: If no budget is given or a customer exceeds the capacity
+        """
+        super().__init__(distance_matrix, demands, vehicle_capacity, num_vehicles, depot_index)
+        if time_limit is None and max_iterations is None:
+            raise ValueError("At least one of time_limit and max_iterations must be set")
+        if any(demand > vehicle_capacity + EPSILON for demand in demands):
+            raise ValueError(f"A customer demand exceeds vehicle capacity {vehicle_capacity}")
+        self.time_limit = time_limit
+        self.max_iterations = max_iterations
+        self.min_population = min_population
+        self.initial_population = initial_population
+        self.savings_ratio = savings_ratio
+        self.generation_size = generation_size
+        self.num_elite = num_elite
+        self.num_close = num_close
+        self.target_feasible_ratio = target_feasible_ratio
+        self.penalty_interval = penalty_interval
+        self.repair_probability = repair_probability
+        self.max_iterations_without_improvement = max_iterations_without_improvement
+        self.warm_start_routes = warm_start_routes
+        self.warm_start_ratio = warm_start_ratio
+        self.rng = random.Random(seed)
+
+        self.customers = [i for i in range(self.num_locations) if i != depot_index]
+        self.crossover = PermutationCrossover(self.num_locations)
+        self.local_search = GranularLocalSearch(
+            distance_matrix, demands, vehicle_capacity, depot_index, num_neighbours=num_neighbours
+        )
+        max_distance = max((max(row) for row in distance_matrix), default=0.0)
+        max_demand = max(demands, default=0.0) or 1.0
+        self.initial_penalty = min(MAX_PENALTY, max(MIN_PENALTY, max_distance / max_demand))
+        self.capacity_penalty = self.initial_penalty
+
+        self.feasible: List[Individual] = []
+        self.infeasible: List[Individual] = []
+        self.last_statistics: Optional[Dict[str, object]] = None
+
+    # ------------------------------------------------------------------
+    # Education
+    # ------------------------------------------------------------------
+
+    def _make_individual(self, routes: List[List[int]]) -> Individual:
+        excess = sum(max(0.0, sum(self.demands[c] for c in route) - self.vehicle_capacity) for route in routes)
+        return Individual(routes, self.calculate_solution_fitness(routes), excess,
+                          self.num_locations, self.depot_index)
+
+    def educate(self, giant_tour: List[int], capacity_penalty: float) -> Individual:
+        """Split a giant tour and improve it by penalized local search."""
+        _, routes = split_penalized(
+            giant_tour, self.distance_matrix, self.demands, self.vehicle_capacity,
+            capacity_penalty, self.depot_index
+        )
+        routes = self.local_search.improve(routes, self.rng, capacity_penalty)
+        return self._make_individual(routes)
+
+    # ------------------------------------------------------------------
+    # Population management
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def broken_pairs_distance(a: Individual, b: Individual) -> float:
+        """Share of customers whose neighbours in ``a`` are not neighbours in ``b``."""
+        broken = (a.successors != b.successors) & (a.successors != b.predecessors)
+        return float(broken[1:].mean()) if len(broken) > 1 else 0.0
+
+    def _distance_matrix(self, subpopulation: List[Individual]) -> np.ndarray:
+        """Pairwise broken-pairs distances of a subpopulation."""
+        successors = np.stack([ind.successors for ind in subpopulation])
+        predecessors = np.stack([ind.predecessors for ind in subpopulation])
+        broken = ((successors[:, None, :] != successors[None, :, :]) &
+                  (successors[:, None, :] != predecessors[None, :, :]))
+        broken[:, :, self.depot_index] = False
+        return broken.sum(axis=2) / max(1, len(self.customers))
+
+    def _update_biased_fitness(self, subpopulation: List[Individual]) -> Optional[np.ndarray]:
+        """Rank individuals by cost and diversity contribution; returns the distance matrix."""
+        size = len(subpopulation)
+        if size == 0:
+            return None
+        if size == 1:
+            subpopulation[0].biased_fitness = 0.0
+            return np.zeros((1, 1))
+        distances = self._distance_matrix(subpopulation)
+        close = min(self.num_close, size - 1)
+        others = distances.copy()
+        np.fill_diagonal(others, np.inf)
+        diversity = np.sort(others, axis=1)[:, :close].mean(axis=1)
+
+        costs = np.array([ind.penalized_cost(self.capacity_penalty) for ind in subpopulation])
+        fitness_rank = np.empty(size)
+        fitness_rank[np.argsort(costs, kind='stable')] = np.arange(size) / (size - 1)
+        diversity_rank = np.empty(size)
+        diversity_rank[np.argsort(-diversity, kind='stable')] = np.arange(size) / (size - 1)
+
+        biased = fitness_rank + (1.0 - min(self.num_elite, size) / size) * diversity_rank
+        for ind, value in zip(subpopulation, biased):
+            ind.biased_fitness = float(value)
+        return distances
+
+    def _select_survivors(self, subpopulation: List[Individual]) -> None:
+        """Remove clones, then the worst biased fitness, down to ``min_population``."""
+        while len(subpopulation) > self.min_population:
+            distances = self._update_biased_fitness(subpopulation)
+            clone = (distances + np.eye(len(subpopulation))).min(axis=1) <= EPSILON
+            worst = max(range(len(subpopulation)),
+                        key=lambda i: (clone[i], subpopulation[i].biased_fitness))
+            subpopulation.pop(worst)
+
+    def _insert(self, individual: Individual) -> None:
+        subpopulation = self.feasible if individual.is_feasible else self.infeasible
+        subpopulation.append(individual)
+        if len(subpopulation) >= self.min_population + self.generation_size:
+            self._select_survivors(subpopulation)
+
+    def _binary_tournament(self) -> Individual:
+        candidates = self.feasible + self.infeasible
+        first = self.rng.choice(candidates)
+        second = self.rng.choice(candidates)
+        return first if first.biased_fitness <= second.biased_fitness else second
+
+    def _adapt_penalty(self, feasible_ratio: float) -> None:
+        """Move the capacity penalty towards the target share of feasible offspring."""
+        if feasible_ratio < self.target_feasible_ratio - 0.05:
+            self.capacity_penalty = min(MAX_PENALTY, self.capacity_penalty * PENALTY_INCREASE)
+        elif feasible_ratio > self.target_feasible_ratio + 0.05:
+            self.capacity_penalty = max(MIN_PENALTY, self.capacity_penalty * PENALTY_DECREASE)
+
+    # ------------------------------------------------------------------
+    # Main loop
+    # ------------------------------------------------------------------
+
+    def _out_of_budget(self, start_time: float, iteration: int) -> bool:
+        if self.max_iterations is not None and iteration >= self.max_iterations:
+            self.stop_reason = 'max_iterations'
+            return True
+        if self.time_limit is not None and time.time() - start_time >= self.time_limit:
+            self.stop_reason = 'time_limit'
+            return True
+        return False
+
+    def _initialize_population(self, start_time: float, iteration: int) -> None:
+        """Fill both subpopulations with educated savings solutions and random giant tours.
+
+        The first population also receives the repaired warm start and its
+        perturbations; restarts do not, so that they explore elsewhere.
+        """
+        self.feasible, self.infeasible = [], []
+        warm_tours = self._warm_start_tours() if iteration == 0 else []
+        num_savings = int(round(self.savings_ratio * self.initial_population))
+        for index in range(self.initial_population):
+            if self._out_of_budget(start_time, iteration):
+                break
+            if index < len(warm_tours):
+                giant_tour = warm_tours[index]
+            elif index - len(warm_tours) < num_savings:
+                giant_tour = routes_to_giant_tour(randomized_clarke_wright_savings(
+                    self.distance_matrix, self.demands, self.vehicle_capacity, self.depot_index, self.rng
+                ))
+            else:
+                giant_tour = self.customers[:]
+                self.rng.shuffle(giant_tour)
+            self._handle_offspring(self.educate(giant_tour, self.capacity_penalty))
+
+    def _warm_start_tours(self) -> List[List[int]]:
+        """Giant tours of the repaired warm start and of perturbed copies of it."""
+        if self.warm_start_routes is None:
+            return []
+        # No fleet limit: HGS does not enforce the number of vehicles either
+        routes, unassigned = repair_solution(
+            self.warm_start_routes, self.distance_matrix, self.demands, self.vehicle_capacity,
+            depot_index=self.depot_index
+        )
+        routes += [[customer] for customer in unassigned]
+        count = min(self.initial_population, max(1, round(self.warm_start_ratio * self.initial_population)))
+        tours = [routes_to_giant_tour(routes)]
+        while len(tours) < count:
+            tours.append(routes_to_giant_tour(perturb_solution(
+                routes, self.distance_matrix, self.demands, self.vehicle_capacity, self.rng,
+                depot_index=self.depot_index
+            )))
+        return tours
+
+    def _handle_offspring(self, individual: Individual) -> List[Individual]:
+        """Insert an offspring (and its repaired version); returns the feasible ones."""
+        self._insert(individual)
+        if individual.is_feasible:
+            return [individual]
+        if self.rng.random() < self.repair_probability:
+            repaired = self.educate(individual.giant_tour, 10.0 * self.capacity_penalty)
+            if repaired.is_feasible:
+                self._insert(repaired)
+                return [repaired]
+        return []
+
+    def solve_vrp(self) -> List[List[int]]:
+        """Solve CVRP with HGS until the time (or iteration) budget runs out.
+
+        Returns:
+            Best feasible solution found as list of routes
+        """
+        if not self.customers:
+            return []
+
+        print("Starting Hybrid Genetic Search for VRP...")
+        start_time = time.time()
+        self.capacity_penalty = self.initial_penalty
+        best: Optional[Individual] = None
+        iteration = 0
+        restarts = 0
+        no_improvement = 0
+        recent_feasible: List[bool] = []
+
+        self._initialize_population(start_time, iteration)
+        for individual in self.feasible:
+            if best is None or individual.distance < best.distance - EPSILON:
+                best = individual
+
+        while not self._out_of_budget(start_time, iteration):
+            for subpopulation in (self.feasible, self.infeasible):
+                self._update_biased_fitness(subpopulation)
+            parent1 = self._binary_tournament()
+            parent2 = self._binary_tournament()
+            n = len(self.customers)
+            point1, point2 = sorted(self.rng.sample(range(n + 1), 2)) if n > 1 else (0, n)
+            giant_tour = self.crossover.order_crossover(parent1.giant_tour, parent2.giant_tour, point1, point2)
+
+            child = self.educate(giant_tour, self.capacity_penalty)
+            recent_feasible.append(child.is_feasible)
+            improved = False
+            for individual in self._handle_offspring(child):
+                if best is None or individual.distance < best.distance - EPSILON:
+                    best = individual
+                    improved = True
+            no_improvement = 0 if improved else no_improvement + 1
+            iteration += 1
+
+            if iteration % self.penalty_interval == 0:
+                self._adapt_penalty(sum(recent_feasible) / len(recent_feasible))
+                recent_feasible = []
+            if no_improvement >= self.max_iterations_without_improvement:
+                self._initialize_population(start_time, iteration)
+                if best is not None:
+                    self._insert(best)
+                no_improvement = 0
+                restarts += 1
+            if iteration % 1000 == 0 and best is not None:
+                print(f"Iteration {iteration}: Best fitness = {best.distance:.2f}")
+
+        if best is None:
+            # No feasible individual yet: split the best tour under a prohibitive penalty
+            candidates = self.feasible + self.infeasible
+            tour = (min(candidates, key=lambda ind: ind.excess).giant_tour if candidates else self.customers)
+            best = self._make_individual(split_penalized(
+                tour, self.distance_matrix, self.demands, self.vehicle_capacity, math.inf,
+                self.depot_index, max_load_factor=1.0
+            )[1])
+
+        self.last_statistics = {
+            'iterations': iteration,
+            'restarts': restarts,
+            'best_fitness': best.distance,
+            'capacity_penalty': self.capacity_penalty,
+            'feasible_population': len(self.feasible),
+            'infeasible_population': len(self.infeasible),
+        }
+        print(f"Final best fitness: {best.distance:.2f} after {iteration} iterations")
+        return [route[:] for route in best.routes]
@@ -0,0 +1,234 @@
+"""Cheapest-insertion helpers and a cache for incremental VRP updates."""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from smart_decision_miniproject.solver.vrp_time_windows import RouteSchedule, TimeWindows
+
+# Tolerance used when comparing floating point loads
+EPSILON = 1e-9
+
+
+def best_insertion(
+    customer: int,
+    route: Sequence[int],
+    load: float,
+    schedule: Optional[RouteSchedule],
+    distance_matrix: Sequence[Sequence[float]],
+    demands: Sequence[float],
+    vehicle_capacity: float,
+    depot_index: int = 0,
+    time_windows: Optional[TimeWindows] = None,
+) -> Optional[Tuple[float, int]]:
+    """Cheapest feasible insertion of a customer into a route.
+
+    Args:
+        customer: Customer to insert
+        route: Route without the depot
+        load: Current load of the route
+        schedule: Schedule of the route (only used with time windows)
+        distance_matrix: Square matrix of distances between locations
+        demands: Demand for each location
+        vehicle_capacity: Maximum capacity for each vehicle
+        depot_index: Index of the depot
+        time_windows: Time-window data for VRPTW instances
+
+    Returns:
+        Tuple of (cost increase, position), or None if no position is feasible
+    """
+    if load + demands[customer] > vehicle_capacity + EPSILON:
+        return None
+    d = distance_matrix
+    best = None
+    prev = depot_index
+    for pos in range(len(route) + 1):
+        nxt = route[pos] if pos < len(route) else depot_index
+        delta = d[prev][customer] + d[customer][nxt] - d[prev][nxt]
+        if (best is None or delta < best[0]) and (
+                time_windows is None or time_windows.can_insert(route, schedule, pos, customer)):
+            best = (delta, pos)
+        prev = nxt
+    return best
+
+
+def new_route_cost(
+    customer: int,
+    distance_matrix: Sequence[Sequence[float]],
+    demands: Sequence[float],
+    vehicle_capacity: float,
+    depot_index: int = 0,
+    time_windows: Optional[TimeWindows] = None,
+) -> Optional[float]:
+    """Cost of serving a customer on a route of its own, None if infeasible."""
+    if demands[customer] > vehicle_capacity + EPSILON:
+        return None
+    if time_windows is not None and not time_windows.is_route_feasible([customer]):
+        return None
+    return distance_matrix[depot_index][customer] + distance_matrix[customer][depot_index]
+
+
+class InsertionCache:
+    """Best insertion positions of unrouted customers into a changing set of routes.
+
+    For every pending customer the cache keeps its cheapest insertion into
+    each route. When routes change, only the columns of the changed routes
+    are recomputed, so routing a new order costs one pass over the routes and
+    each later update one pass over the modified route per pending customer.
+    The routes list is modified in place.
+    """
+
+    def __init__(
+        self,
+        routes: List[List[int]],
+        distance_matrix: Sequence[Sequence[float]],
+        demands: Sequence[float],
+        vehicle_capacity: float,
+        num_vehicles: Optional[int] = None,
+        depot_index: int = 0,
+        time_windows: Optional[TimeWindows] = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            routes: Current routes, updated in place by ``insert`` and ``remove``
+            distance_matrix: Square matrix of distances; may grow as customers
+                are added, as long as it covers every cached customer
+            demands: Demand for each location (may grow likewise)
+            vehicle_capacity: Maximum capacity for each vehicle
+            num_vehicles: Maximum number of routes, None for no limit
+            depot_index: Index of the depot
+            time_windows: Time-window data for VRPTW instances
+        """
+        self.routes = routes
+        self.distance_matrix = distance_matrix
+        self.demands = demands
+        self.vehicle_capacity = vehicle_capacity
+        self.num_vehicles = num_vehicles
+        self.depot_index = depot_index
+        self.time_windows = time_windows
+        self._entries: Dict[int, List[Optional[Tuple[float, int]]]] = {}
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Recompute loads, schedules and every cache entry, e.g. after routes were replaced."""
+        self.loads = [sum(self.demands[c] for c in route) for route in self.routes]
+        self.schedules: List[Optional[RouteSchedule]] = [None] * len(self.routes)
+        if self.time_windows is not None:
+            self.schedules = [self.time_windows.schedule(route) for route in self.routes]
+        for customer in self._entries:
+            self._entries[customer] = [self._evaluate(customer, i) for i in range(len(self.routes))]
+
+    @property
+    def pending(self) -> List[int]:
+        """Customers waiting to be routed."""
+        return list(self._entries)
+
+    def _evaluate(self, customer: int, route_idx: int) -> Optional[Tuple[float, int]]:
+        return best_insertion(
+            customer, self.routes[route_idx], self.loads[route_idx], self.schedules[route_idx],
+            self.distance_matrix, self.demands, self.vehicle_capacity, self.depot_index, self.time_windows
+        )
+
+    def _route_changed(self, route_idx: int) -> None:
+        """Update the data of one modified route and its cache column."""
+        route = self.routes[route_idx]
+        self.loads[route_idx] = sum(self.demands[c] for c in route)
+        if self.time_windows is not None:
+            self.schedules[route_idx] = self.time_windows.schedule(route)
+        for customer, entries in self._entries.items():
+            entries[route_idx] = self._evaluate(customer, route_idx)
+
+    def add(self, customer: int) -> None:
+        """Start tracking an unrouted customer."""
+        self._entries[customer] = [self._evaluate(customer, i) for i in range(len(self.routes))]
+
+    def discard(self, customer: int) -> None:
+        """Stop tracking a customer (e.g. a cancelled order that was never routed)."""
+        self._entries.pop(customer, None)
+
+    def best(self, customer: int) -> Optional[Tuple[float, int, int]]:
+        """Cheapest (cost increase, route index, position) of a pending customer.
+
+        A route index equal to ``len(routes)`` stands for opening a new route.
+        """
+        options = [(entry[0], route_idx, entry[1]) for route_idx, entry in enumerate(self._entries[customer]) if entry]
+        if self.num_vehicles is None or len(self.routes) < self.num_vehicles:
+            cost = new_route_cost(
+                customer, self.distance_matrix, self.demands, self.vehicle_capacity,
+                self.depot_index, self.time_windows
+            )
+            if cost is not None:
+                options.append((cost, len(self.routes), 0))
+        return min(options, default=None)
+
+    def insert(self, customer: int) -> Optional[float]:
+        """Insert a pending customer at its cheapest position.
+
+        Returns:
+            The distance increase, or None if the customer fits nowhere (it
+            then stays pending)
+        """
+        option = self.best(customer)
+        if option is None:
+            return None
+        cost, route_idx, pos = option
+        del self._entries[customer]
+        if route_idx == len(self.routes):
+            self.routes.append([customer])
+            self.loads.append(0.0)
+            self.schedules.append(None)
+            for entries in self._entries.values():
+                entries.append(None)
+        else:
+            self.routes[route_idx].insert(pos, customer)
+        self._route_changed(route_idx)
+        return cost
+
+    def insert_pending(self) -> float:
+        """Insert pending customers, cheapest first, until none fits anywhere.
+
+        Returns:
+            The total distance increase
+        """
+        total = 0.0
+        while self._entries:
+            options = []
+            for customer in self._entries:
+                option = self.best(customer)
+                if option is not None:
+                    options.append((option, customer))
+            if not options:
+                break
+            _, customer = min(options)
+            total += self.insert(customer)
+        return total
+
+    def remove(self, customer: int) -> float:
+        """Take a routed customer out of its route; empty routes are dropped.
+
+        Returns:
+            The distance decrease
+
+        Raises:
+            ValueError: If the customer is not routed
+        """
+        d = self.distance_matrix
+        for route_idx, route in enumerate(self.routes):
+            if customer in route:
+                break
+        else:
+            raise ValueError(f"Customer {customer} is not routed")
+
+        pos = route.index(customer)
+        prev = route[pos - 1] if pos > 0 else self.depot_index
+        nxt = route[pos + 1] if pos + 1 < len(route) else self.depot_index
+        saving = d[prev][customer] + d[customer][nxt] - d[prev][nxt]
+        route.pop(pos)
+        if route:
+            self._route_changed(route_idx)
+        else:
+            del self.routes[route_idx]
+            del self.loads[route_idx]
+            del self.schedules[route_idx]
+            for entries in self._entries.values():
+                del entries[route_idx]
+        return saving
@@ -0,0 +1,250 @@
+"""Island-model driver for the giant-tour VRP genetic algorithm.
+
+Each island is a separate process that evolves its own population. Every
+``migration_interval`` generations an island sends copies of its best
+individuals to the next island on a ring and takes in the migrants that have
+arrived from the previous one. Migration is asynchronous, so a slow island
+never blocks the others. All islands stop at a shared wall-clock deadline,
+or earlier on their own stopping criteria (patience, target fitness).
+"""
+
+import multiprocessing
+import queue
+import time
+import traceback
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from smart_decision_miniproject.solver.VRP import BaseVRPSolver, GeneticAlgorithmVRPSolver
+from smart_decision_miniproject.solver.vrp_parallel import SharedDistanceMatrix, build_solver, solver_config
+from smart_decision_miniproject.solver.vrp_time_windows import TimeWindows
+
+# Seconds past the deadline to wait for the islands to report their results
+RESULT_GRACE_PERIOD = 30.0
+
+# Seconds between two checks of the island processes while waiting for results
+_POLL_INTERVAL = 0.5
+
+
+@dataclass
+class IslandModelResult:
+    """Outcome of an island-model run."""
+    routes: List[List[int]]
+    best_fitness: float
+    best_island: int
+    # Per island: (seconds since start, best fitness) after each generation
+    convergence_traces: List[List[Tuple[float, float]]] = field(default_factory=list)
+    generations: List[int] = field(default_factory=list)
+    stop_reasons: List[str] = field(default_factory=list)
+
+
+def _run_island(
+    index: int,
+    memory_name: str,
+    shape: Tuple[int, int],
+    config: Dict[str, Any],
+    inbox,
+    outbox,
+    results,
+    start_time: float,
+    deadline: float,
+    migration_interval: int,
+    num_migrants: int,
+) -> None:
+    """Process entry point of one island.
+
+    Puts ``(index, best tour, best fitness, trace, generations, stop reason,
+    error)`` on ``results``; if the island fails, the error is the formatted
+    traceback and the other fields are empty.
+    """
+    # Do not wait for undelivered migrants when this island exits
+    outbox.cancel_join_thread()
+    memory = None
+    try:
+        memory, distance_matrix = SharedDistanceMatrix.attach(memory_name, shape)
+        seed = config['seed']
+        solver = build_solver(distance_matrix, config, seed=None if seed is None else seed + index)
+        solver._start_run()
+        solver.initialize_population()
+        trace = []
+
+        while solver.generation < solver.num_generations:
+            if time.time() >= deadline:
+                solver.stop_reason = 'time_limit'
+                break
+            if solver._should_stop(solver.best_fitness):
+                break
+            solver.evolve_generation()
+            trace.append((time.time() - start_time, solver.best_fitness))
+
+            if solver.generation % migration_interval == 0:
+                outbox.put(solver.best_individuals(num_migrants))
+            while True:
+                try:
+                    migrants = inbox.get_nowait()
+                except queue.Empty:
+                    break
+                solver.replace_worst(migrants)
+
+        results.put((index, solver.best_tour, solver.best_fitness, trace, solver.generation, solver.stop_reason, None))
+    except Exception:
+        results.put((index, None, float('inf'), [], 0, None, traceback.format_exc()))
+    finally:
+        if memory is not None:
+            memory.close()
+
+
+class IslandModelVRPSolver(BaseVRPSolver):
+    """VRP solver running several GA populations in parallel with ring migration."""
+
+    def __init__(
+        self,
+        distance_matrix: List[List[float]],
+        demands: List[float],
+        vehicle_capacity: float,
+        num_vehicles: int,
+        depot_index: int = 0,
+        num_islands: int = 4,
+        migration_interval: int = 25,
+        num_migrants: int = 2,
+        time_limit: float = 60.0,
+        time_windows: Optional[TimeWindows] = None,
+        seed: Optional[int] = None,
+        **ga_params
+    ):
+        """Initialize the island-model solver.
+
+        Args:
+            distance_matrix: Square matrix of distances between locations
+            demands: Demand for each customer
+            vehicle_capacity: Maximum capacity for each vehicle
+            num_vehicles: Number of available vehicles
+            depot_index: Index of the depot
+            num_islands: Number of populations, one process each
+            migration_interval: Generations between two migrations
+            num_migrants: Number of elite individuals sent per migration
+            time_limit: Shared wall-clock budget in seconds
+            time_windows: Time windows and service times for VRPTW instances
+            seed: Base seed; island i uses seed + i
+            **ga_params: Further GeneticAlgorithmVRPSolver parameters used on
+                every island (population_size, num_generations, mutation_rate,
+                patience, target_fitness, ...)
+
+        Raises:
+            ValueError: If ga_params ask for the route-list encoding or for
+                worker processes, which islands do not support
+        """
+        if ga_params.get('encoding', 'giant_tour') != 'giant_tour':
+            raise ValueError("Islands evolve giant tours; the 'routes' encoding is not supported")
+        if ga_params.get('num_workers', 1) != 1:
+            raise ValueError("Islands already run in separate processes; num_workers must be 1")
+        super().__init__(distance_matrix, demands, vehicle_capacity, num_vehicles, depot_index, time_windows)
+        self.num_islands = num_islands
+        self.migration_interval = max(1, migration_interval)
+        self.num_migrants = num_migrants
+        self.time_limit = time_limit
+        ga_params.setdefault('num_generations', 10 ** 9)  # Islands normally stop on the time limit
+        self.island_template = GeneticAlgorithmVRPSolver(
+            distance_matrix, demands, vehicle_capacity, num_vehicles, depot_index,
+            time_windows=time_windows, seed=seed, **ga_params
+        )
+        self.last_result: Optional[IslandModelResult] = None
+
+    def run(self) -> IslandModelResult:
+        """Run all islands until the time limit and collect their results.
+
+        Returns:
+            Global best solution and per-island convergence traces
+
+        Raises:
+            RuntimeError: If an island fails, exits without reporting, or has
+                not reported ``RESULT_GRACE_PERIOD`` seconds after the deadline
+        """
+        if self.num_locations <= 1:
+            return IslandModelResult([], 0.0, 0)
+
+        print(f"Starting island-model GA with {self.num_islands} islands...")
+        context = multiprocessing.get_context()
+        matrix = SharedDistanceMatrix(self.distance_matrix)
+        config = solver_config(self.island_template)
+        inboxes = [context.Queue() for _ in range(self.num_islands)]
+        results = context.Queue()
+        start_time = time.time()
+        deadline = start_time + self.time_limit
+
+        processes = [
+            context.Process(
+                target=_run_island,
+                args=(i, matrix.name, matrix.shape, config,
+                      inboxes[i], inboxes[(i + 1) % self.num_islands], results,
+                      start_time, deadline, self.migration_interval, self.num_migrants),
+                daemon=True,
+            )
+            for i in range(self.num_islands)
+        ]
+        try:
+            for process in processes:
+                process.start()
+            island_results = self._collect_results(results, processes, deadline)
+            for process in processes:
+                process.join()
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+            matrix.close()
+
+        best_island, best_tour, best_fitness, _, _, stop_reason, _ = min(island_results, key=lambda r: r[2])
+        routes = self.island_template.decode_giant_tour(best_tour)[1]
+        self.stop_reason = stop_reason
+        self.last_result = IslandModelResult(
+            routes=routes,
+            best_fitness=best_fitness,
+            best_island=best_island,
+            convergence_traces=[r[3] for r in island_results],
+            generations=[r[4] for r in island_results],
+            stop_reasons=[r[5] for r in island_results],
+        )
+        print(f"Final best fitness: {best_fitness:.2f} (island {best_island})")
+        return self.last_result
+
+    @staticmethod
+    def _collect_results(results, processes: List[Any], deadline: float) -> List[Tuple]:
+        """Wait for one result per island, sorted by island index.
+
+        Raises:
+            RuntimeError: As described in ``run``
+        """
+        island_results = {}
+        while len(island_results) < len(processes):
+            try:
+                record = results.get(timeout=_POLL_INTERVAL)
+            except queue.Empty:
+                silent = [i for i, process in enumerate(processes)
+                          if process.exitcode is not None and i not in island_results]
+                if not silent and time.time() < deadline + RESULT_GRACE_PERIOD:
+                    continue
+                try:
+                    # The result of an island that has just exited may still be in the pipe
+                    record = results.get(timeout=_POLL_INTERVAL)
+                except queue.Empty:
+                    if silent:
+                        codes = {i: processes[i].exitcode for i in silent}
+                        raise RuntimeError(f"Island processes exited without a result (exit codes {codes})")
+                    raise RuntimeError(
+                        f"Islands {[i for i in range(len(processes)) if i not in island_results]} did not report "
+                        f"within {RESULT_GRACE_PERIOD:.0f}s of the time limit"
+                    )
+            index, error = record[0], record[-1]
+            if error is not None:
+                raise RuntimeError(f"Island {index} failed:\n{error}")
+            island_results[index] = record
+        return [island_results[i] for i in sorted(island_results)]
+
+    def solve_vrp(self) -> List[List[int]]:
+        """Solve VRP with the island model.
+
+        Returns:
+            Best solution found as list of routes
+        """
+        return self.run().routes
@@ -0,0 +1,383 @@
+"""Granular local search for VRP solutions.
+
+Each customer is only combined with its k nearest neighbours, and every move
+is built so that it creates an edge between the two. The neighbourhoods are
+relocate, swap, 2-opt (inside a route), 2-opt* (tails of two routes) and
+CROSS exchange (two short segments). Moves are scored in O(1) by their
+distance delta and capacity, using prefix loads; only improving ones are
+checked against time windows, using the route schedules of ``TimeWindows``. The
+reversal in 2-opt assumes a symmetric distance matrix.
+
+With a capacity penalty, capacity becomes a soft constraint: moves are
+scored by distance plus the penalty on the change of excess load, which lets
+the search start from (and move through) overloaded solutions.
+"""
+
+import random
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from smart_decision_miniproject.solver.vrp_time_windows import TimeWindows
+
+# Minimum gain for a move to count as an improvement
+EPSILON = 1e-9
+
+
+class GranularLocalSearch:
+    """First-improvement local search restricted to k-nearest-neighbour moves."""
+
+    def __init__(
+        self,
+        distance_matrix: Sequence[Sequence[float]],
+        demands: Sequence[float],
+        vehicle_capacity: float,
+        depot_index: int = 0,
+        time_windows: Optional[TimeWindows] = None,
+        num_neighbours: int = 20,
+        max_segment_length: int = 2,
+    ):
+        """Initialize the local search and its neighbour lists.
+
+        Args:
+            distance_matrix: Square matrix of distances between locations
+            demands: Demand for each location
+            vehicle_capacity: Maximum capacity for each vehicle
+            depot_index: Index of the depot
+            time_windows: Time-window data for VRPTW instances, None for CVRP
+            num_neighbours: Number of nearest customers each customer is combined with
+            max_segment_length: Longest segment moved by a CROSS exchange
+        """
+        if isinstance(distance_matrix, np.ndarray):
+            distance_matrix = distance_matrix.tolist()  # Scalar access on lists is much faster
+        self.distance_matrix = distance_matrix
+        self.demands = demands
+        self.vehicle_capacity = vehicle_capacity
+        self.depot_index = depot_index
+        self.time_windows = time_windows
+        self.max_segment_length = max_segment_length
+        self.num_locations = len(distance_matrix)
+        self.neighbours = self._nearest_neighbours(num_neighbours)
+
+    def _nearest_neighbours(self, num_neighbours: int) -> List[List[int]]:
+        """For every customer, the closest other customers in increasing distance."""
+        neighbours: List[List[int]] = [[] for _ in range(self.num_locations)]
+        customers = np.array([i for i in range(self.num_locations) if i != self.depot_index], dtype=np.intp)
+        count = min(num_neighbours, len(customers) - 1)
+        if count <= 0:
+            return neighbours
+
+        distances = np.asarray(self.distance_matrix, dtype=np.float64)[np.ix_(customers, customers)]
+        np.fill_diagonal(distances, np.inf)
+        nearest = np.argsort(distances, axis=1, kind='stable')[:, :count]
+        for row, customer in enumerate(customers.tolist()):
+            neighbours[customer] = customers[nearest[row]].tolist()
+        return neighbours
+
+    def solution_cost(self, routes: List[List[int]]) -> float:
+        """Total distance of a solution including depot legs."""
+        d = self.distance_matrix
+        depot = self.depot_index
+        total = 0.0
+        for route in routes:
+            if route:
+                total += d[depot][route[0]] + d[route[-1]][depot]
+                total += sum(d[a][b] for a, b in zip(route, route[1:]))
+        return total
+
+    def improve(
+        self,
+        routes: List[List[int]],
+        rng: Optional[random.Random] = None,
+        capacity_penalty: Optional[float] = None,
+    ) -> List[List[int]]:
+        """Apply improving moves until no neighbour move improves the solution.
+
+        Args:
+            routes: Solution as list of routes (not modified); it must be
+                feasible unless a capacity penalty is given
+            rng: Random generator shuffling the scan order (defaults to the random module)
+            capacity_penalty: Cost per unit of excess load, None to enforce
+                the capacity strictly
+
+        Returns:
+            A local optimum, without empty routes
+        """
+        rng = rng or random
+        self.capacity_penalty = capacity_penalty
+        self.routes = [list(route) for route in routes]
+        self.route_of = [-1] * self.num_locations
+        self.position = [0] * self.num_locations
+        self.prefix_loads: List[List[float]] = [[] for _ in self.routes]
+        self.excess = [0.0] * len(self.routes)
+        self.schedules = [None] * len(self.routes)
+        # Moves counter and, per route, its value at the route's last change
+        self.num_changes = 0
+        self.last_changed = [0] * len(self.routes)
+        for route_idx in range(len(self.routes)):
+            self._refresh(route_idx)
+
+        customers = [c for route in self.routes for c in route]
+        # Counter value when each customer's neighbourhood was last scanned
+        last_scanned = [-1] * self.num_locations
+        improved = True
+        while improved:
+            improved = False
+            rng.shuffle(customers)
+            for u in customers:
+                scanned = last_scanned[u]
+                last_scanned[u] = self.num_changes
+                for v in self.neighbours[u]:
+                    # Skip pairs whose two routes are unchanged since u was last scanned
+                    route_v = self.route_of[v]
+                    if route_v < 0 or max(self.last_changed[self.route_of[u]], self.last_changed[route_v]) <= scanned:
+                        continue
+                    if self._improve_pair(u, v):
+                        improved = True
+
+        return [route for route in self.routes if route]
+
+    def _refresh(self, route_idx: int) -> None:
+        """Recompute positions, prefix loads and schedule of a modified route."""
+        route = self.routes[route_idx]
+        prefix = [0.0]
+        for pos, customer in enumerate(route):
+            self.route_of[customer] = route_idx
+            self.position[customer] = pos
+            prefix.append(prefix[-1] + self.demands[customer])
+        self.prefix_loads[route_idx] = prefix
+        self.excess[route_idx] = self._excess(prefix[-1])
+        self.num_changes += 1
+        self.last_changed[route_idx] = self.num_changes
+        if self.time_windows is not None:
+            self.schedules[route_idx] = self.time_windows.schedule(route)
+
+    def _load(self, route_idx: int) -> float:
+        return self.prefix_loads[route_idx][-1]
+
+    def _fits(self, load: float) -> bool:
+        return load <= self.vehicle_capacity + EPSILON
+
+    def _excess(self, load: float) -> float:
+        excess = load - self.vehicle_capacity
+        return excess if excess > EPSILON else 0.0
+
+    def _max_capacity_gain(self, route1: int, route2: int) -> float:
+        """Largest penalty decrease a move between two routes can bring (0 when both fit)."""
+        if self.capacity_penalty is None:
+            return 0.0
+        return self.capacity_penalty * (self.excess[route1] + self.excess[route2])
+
+    def _capacity_delta(self, route1: int, load1: float, route2: int, load2: float) -> Optional[float]:
+        """Cost change of giving two routes new loads, None if the move breaks a hard capacity."""
+        if self.capacity_penalty is None:
+            return 0.0 if self._fits(load1) and self._fits(load2) else None
+        change = self._excess(load1) + self._excess(load2) - self.excess[route1] - self.excess[route2]
+        return self.capacity_penalty * change
+
+    def _pred(self, route: List[int], pos: int) -> int:
+        return route[pos - 1] if pos > 0 else self.depot_index
+
+    def _succ(self, route: List[int], pos: int) -> int:
+        return route[pos + 1] if pos + 1 < len(route) else self.depot_index
+
+    def _improve_pair(self, u: int, v: int) -> bool:
+        """Try the moves creating an edge between u and v; apply the first improving one."""
+        if self._relocate(u, v, after=True) or self._relocate(u, v, after=False) or self._swap(u, v):
+            return True
+        if self.route_of[u] == self.route_of[v]:
+            return self._two_opt(u, v)
+        return self._two_opt_star(u, v) or self._cross_exchange(u, v)
+
+    def _relocate(self, u: int, v: int, after: bool) -> bool:
+        """Move u right after (or before) v."""
+        d = self.distance_matrix
+        route_u_idx, pos_u = self.route_of[u], self.position[u]
+        route_v_idx, pos_v = self.route_of[v], self.position[v]
+        route_u, route_v = self.routes[route_u_idx], self.routes[route_v_idx]
+        prev_u, next_u = self._pred(route_u, pos_u), self._succ(route_u, pos_u)
+        if after:
+            x, y, insert_pos = v, self._succ(route_v, pos_v), pos_v + 1
+        else:
+            x, y, insert_pos = self._pred(route_v, pos_v), v, pos_v
+        if x == u or y == u:
+            return False  # u is already there
+
+        delta = d[prev_u][next_u] - d[prev_u][u] - d[u][next_u] + d[x][u] + d[u][y] - d[x][y]
+        if route_u_idx != route_v_idx:
+            if delta - self._max_capacity_gain(route_u_idx, route_v_idx) > -EPSILON:
+                return False
+            demand = self.demands[u]
+            capacity_delta = self._capacity_delta(route_u_idx, self._load(route_u_idx) - demand,
+                                                  route_v_idx, self._load(route_v_idx) + demand)
+            if capacity_delta is None:
+                return False
+            delta += capacity_delta
+        if delta > -EPSILON:
+            return False
+
+        if route_u_idx != route_v_idx:
+            if self.time_windows is not None and not (
+                    self.time_windows.can_remove(route_u, self.schedules[route_u_idx], pos_u) and
+                    self.time_windows.can_insert(route_v, self.schedules[route_v_idx], insert_pos, u)):
+                return False
+            route_u.pop(pos_u)
+            route_v.insert(insert_pos, u)
+            self._refresh(route_u_idx)
+            self._refresh(route_v_idx)
+            return True
+
+        # Insertion position once u has been taken out of the same route
+        if pos_u < insert_pos:
+            insert_pos -= 1
+        route = route_u[:]
+        route.insert(insert_pos, route.pop(pos_u))
+        if self.time_windows is not None and not self.time_windows.is_route_feasible(route):
+            return False
+        self.routes[route_u_idx] = route
+        self._refresh(route_u_idx)
+        return True
+
+    def _swap(self, u: int, v: int) -> bool:
+        """Exchange the positions of u and v."""
+        d = self.distance_matrix
+        route_u_idx, pos_u = self.route_of[u], self.position[u]
+        route_v_idx, pos_v = self.route_of[v], self.position[v]
+        if route_u_idx == route_v_idx and abs(pos_u - pos_v) == 1:
+            return False  # Covered by relocate
+        route_u, route_v = self.routes[route_u_idx], self.routes[route_v_idx]
+        prev_u, next_u = self._pred(route_u, pos_u), self._succ(route_u, pos_u)
+        prev_v, next_v = self._pred(route_v, pos_v), self._succ(route_v, pos_v)
+
+        delta = (d[prev_u][v] + d[v][next_u] + d[prev_v][u] + d[u][next_v]
+                 - d[prev_u][u] - d[u][next_u] - d[prev_v][v] - d[v][next_v])
+        if route_u_idx != route_v_idx:
+            if delta - self._max_capacity_gain(route_u_idx, route_v_idx) > -EPSILON:
+                return False
+            shift = self.demands[v] - self.demands[u]
+            capacity_delta = self._capacity_delta(route_u_idx, self._load(route_u_idx) + shift,
+                                                  route_v_idx, self._load(route_v_idx) - shift)
+            if capacity_delta is None:
+                return False
+            delta += capacity_delta
+        if delta > -EPSILON:
+            return False
+
+        if route_u_idx != route_v_idx:
+            if self.time_windows is not None and not (
+                    self.time_windows.can_replace(route_u, self.schedules[route_u_idx], pos_u, v) and
+                    self.time_windows.can_replace(route_v, self.schedules[route_v_idx], pos_v, u)):
+                return False
+            route_u[pos_u], route_v[pos_v] = v, u
+            self._refresh(route_u_idx)
+            self._refresh(route_v_idx)
+            return True
+
+        route = route_u[:]
+        route[pos_u], route[pos_v] = v, u
+        if self.time_windows is not None and not self.time_windows.is_route_feasible(route):
+            return False
+        self.routes[route_u_idx] = route
+        self._refresh(route_u_idx)
+        return True
+
+    def _two_opt(self, u: int, v: int) -> bool:
+        """Reverse the path between u and v inside their route so that they become adjacent."""
+        d = self.distance_matrix
+        route_idx = self.route_of[u]
+        route = self.routes[route_idx]
+        i, j = sorted((self.position[u], self.position[v]))
+        if j == i + 1:
+            return False
+        a, b = route[i], route[j]
+        first, after = route[i + 1], self._succ(route, j)
+
+        delta = d[a][b] + d[first][after] - d[a][first] - d[b][after]
+        if delta > -EPSILON:
+            return False
+
+        new_route = route[:i + 1] + route[j:i:-1] + route[j + 1:]
+        if self.time_windows is not None and not self.time_windows.is_route_feasible(new_route):
+            return False
+        self.routes[route_idx] = new_route
+        self._refresh(route_idx)
+        return True
+
+    def _two_opt_star(self, u: int, v: int) -> bool:
+        """Exchange route tails so that v and its tail follow u."""
+        d = self.distance_matrix
+        route_u_idx, pos_u = self.route_of[u], self.position[u]
+        route_v_idx, pos_v = self.route_of[v], self.position[v]
+        route_u, route_v = self.routes[route_u_idx], self.routes[route_v_idx]
+        next_u, prev_v = self._succ(route_u, pos_u), self._pred(route_v, pos_v)
+
+        delta = d[u][v] + d[prev_v][next_u] - d[u][next_u] - d[prev_v][v]
+        if delta - self._max_capacity_gain(route_u_idx, route_v_idx) > -EPSILON:
+            return False
+        head_u = self.prefix_loads[route_u_idx][pos_u + 1]
+        head_v = self.prefix_loads[route_v_idx][pos_v]
+        capacity_delta = self._capacity_delta(route_u_idx, head_u + self._load(route_v_idx) - head_v,
+                                              route_v_idx, head_v + self._load(route_u_idx) - head_u)
+        if capacity_delta is None or delta + capacity_delta > -EPSILON:
+            return False
+        if self.time_windows is not None:
+            schedule_u, schedule_v = self.schedules[route_u_idx], self.schedules[route_v_idx]
+            if not (self.time_windows.can_join(route_u, schedule_u, pos_u + 1, route_v, schedule_v, pos_v) and
+                    self.time_windows.can_join(route_v, schedule_v, pos_v, route_u, schedule_u, pos_u + 1)):
+                return False
+
+        self.routes[route_u_idx] = route_u[:pos_u + 1] + route_v[pos_v:]
+        self.routes[route_v_idx] = route_v[:pos_v] + route_u[pos_u + 1:]
+        self._refresh(route_u_idx)
+        self._refresh(route_v_idx)
+        return True
+
+    def _cross_exchange(self, u: int, v: int) -> bool:
+        """Exchange the segment following u with a segment starting at v."""
+        d = self.distance_matrix
+        route_u_idx, pos_u = self.route_of[u], self.position[u]
+        route_v_idx, pos_v = self.route_of[v], self.position[v]
+        route_u, route_v = self.routes[route_u_idx], self.routes[route_v_idx]
+        prefix_u, prefix_v = self.prefix_loads[route_u_idx], self.prefix_loads[route_v_idx]
+        prev_v = self._pred(route_v, pos_v)
+        start_u = pos_u + 1
+        max_gain = self._max_capacity_gain(route_u_idx, route_v_idx)
+
+        for length_v in range(1, min(self.max_segment_length, len(route_v) - pos_v) + 1):
+            end_v = pos_v + length_v
+            after_v = route_v[end_v] if end_v < len(route_v) else self.depot_index
+            last_v = route_v[end_v - 1]
+            load_v = prefix_v[end_v] - prefix_v[pos_v]
+
+            for length_u in range(0, min(self.max_segment_length, len(route_u) - start_u) + 1):
+                end_u = start_u + length_u
+                after_u = route_u[end_u] if end_u < len(route_u) else self.depot_index
+                if length_u:
+                    first_u, last_u = route_u[start_u], route_u[end_u - 1]
+                    old_u = d[u][first_u] + d[last_u][after_u]
+                    new_v = d[prev_v][first_u] + d[last_u][after_v]
+                else:
+                    old_u = d[u][after_u]
+                    new_v = d[prev_v][after_v]
+                new_u = d[u][v] + d[last_v][after_u]
+                old_v = d[prev_v][v] + d[last_v][after_v]
+                if new_u + new_v - old_u - old_v - max_gain > -EPSILON:
+                    continue
+                load_u = prefix_u[end_u] - prefix_u[start_u]
+                capacity_delta = self._capacity_delta(route_u_idx, self._load(route_u_idx) - load_u + load_v,
+                                                      route_v_idx, self._load(route_v_idx) - load_v + load_u)
+                if capacity_delta is None or new_u + new_v - old_u - old_v + capacity_delta > -EPSILON:
+                    continue
+                new_route_u = route_u[:start_u] + route_v[pos_v:end_v] + route_u[end_u:]
+                new_route_v = route_v[:pos_v] + route_u[start_u:end_u] + route_v[end_v:]
+                if self.time_windows is not None and not (
+                        self.time_windows.is_route_feasible(new_route_u) and
+                        self.time_windows.is_route_feasible(new_route_v)):
+                    continue
+
+                self.routes[route_u_idx] = new_route_u
+                self.routes[route_v_idx] = new_route_v
+                self._refresh(route_u_idx)
+                self._refresh(route_v_idx)
+                return True
+        return False
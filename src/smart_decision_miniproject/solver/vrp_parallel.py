@@ -0,0 +1,175 @@
+"""Process-pool breeding for the giant-tour VRP genetic algorithm.
+
+The distance matrix is copied once into shared memory; workers attach to it
+when they start instead of receiving it with every task. Each task carries a
+chunk of parent pairs and a stream key (base seed, generation, chunk index).
+The key identifies the independent RNG substream used for that chunk's
+crossover and mutation, so the offspring depend only on the seed and
+the chunk, not on the number of workers or the scheduling order.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+class SharedDistanceMatrix:
+    """A float64 distance matrix stored in a shared memory block."""
+
+    def __init__(self, distance_matrix):
+        """Copy the matrix into a new shared memory block.
+
+        Args:
+            distance_matrix: Square matrix of distances (nested lists or ndarray)
+        """
+        matrix = np.asarray(distance_matrix, dtype=np.float64)
+        self.shape = matrix.shape
+        self._memory = shared_memory.SharedMemory(create=True, size=max(matrix.nbytes, 1))
+        self.name = self._memory.name
+        shared_matrix = np.ndarray(self.shape, dtype=np.float64, buffer=self._memory.buf)
+        shared_matrix[:] = matrix
+
+    @staticmethod
+    def attach(name: str, shape: Tuple[int, int]) -> Tuple[shared_memory.SharedMemory, np.ndarray]:
+        """Attach to an existing block from another process.
+
+        Returns:
+            The shared memory handle (keep it alive) and the matrix view
+        """
+        memory = shared_memory.SharedMemory(name=name, track=False)
+        return memory, np.ndarray(shape, dtype=np.float64, buffer=memory.buf)
+
+    def close(self) -> None:
+        """Release and destroy the shared memory block."""
+        self._memory.close()
+        self._memory.unlink()
+
+
+def solver_config(solver) -> Dict[str, Any]:
+    """Collect the picklable settings needed to rebuild a GA solver elsewhere."""
+    time_windows = None
+    if solver.time_windows is not None:
+        time_windows = (
+            list(solver.time_windows.ready_times),
+            list(solver.time_windows.due_times),
+            list(solver.time_windows.service_times),
+        )
+    return {
+        'demands': list(solver.demands),
+        'vehicle_capacity': solver.vehicle_capacity,
+        'num_vehicles': solver.num_vehicles,
+        'depot_index': solver.depot_index,
+        'population_size': solver.population_size,
+        'num_generations': solver.num_generations,
+        'mutation_rate': solver.mutation_rate,
+        'crossover_rate': solver.crossover_rate,
+        'elite_ratio': solver.elite_ratio,
+        'encoding': solver.encoding,
+        'crossover_operator': solver.crossover_operator,
+        'chunk_size': solver.chunk_size,
+        'savings_ratio': solver.savings_ratio,
+        'local_search_rate': solver.local_search_rate,
+        'fitness_cache_size': solver.fitness_cache.max_size,
+        'deduplicate': solver.deduplicate,
+        'patience': solver.patience,
+        'convergence_threshold': solver.convergence_threshold,
+        'time_limit': solver.time_limit,
+        'target_fitness': solver.target_fitness,
+        'warm_start_routes': solver.warm_start_routes,
+        'warm_start_ratio': solver.warm_start_ratio,
+        'seed': solver.seed,
+        'time_windows': time_windows,
+    }
+
+
+def build_solver(distance_matrix: np.ndarray, config: Dict[str, Any], **overrides):
+    """Rebuild a GA solver from ``solver_config`` output around a matrix view.
+
+    The scalar paths (split, time windows, local search) index the matrix one
+    element at a time, which is much faster on nested lists, so they share a
+    list copy built once here. The vectorized paths keep reading the array.
+    """
+    # Imported here: VRP imports this module at load time
+    from smart_decision_miniproject.solver.VRP import GeneticAlgorithmVRPSolver
+    from smart_decision_miniproject.solver.vrp_time_windows import TimeWindows
+
+    matrix_rows = distance_matrix.tolist() if isinstance(distance_matrix, np.ndarray) else distance_matrix
+    settings = dict(config, **overrides)
+    time_windows = None
+    if settings['time_windows'] is not None:
+        ready_times, due_times, service_times = settings['time_windows']
+        time_windows = TimeWindows(ready_times, due_times, service_times, matrix_rows, settings['depot_index'])
+    settings['time_windows'] = time_windows
+    solver = GeneticAlgorithmVRPSolver(distance_matrix=matrix_rows, **settings)
+    if isinstance(distance_matrix, np.ndarray):
+        solver._distance_array = np.asarray(distance_matrix, dtype=np.float64)  # No copy of a float64 view
+    return solver
+
+
+# Per-process state of pool workers
+_worker_solver = None
+_worker_memory: Optional[shared_memory.SharedMemory] = None
+
+
+def _init_worker(memory_name: str, shape: Tuple[int, int], config: Dict[str, Any]) -> None:
+    """Attach to the shared distance matrix and build the worker's solver."""
+    global _worker_solver, _worker_memory
+    _worker_memory, distance_matrix = SharedDistanceMatrix.attach(memory_name, shape)
+    _worker_solver = build_solver(distance_matrix, config)
+
+
+def _breed_chunk(stream_key: Tuple[int, ...], parent_pairs: Sequence[Tuple[List[int], List[int]]]) -> List[Tuple[List[int], float, bytes]]:
+    """Worker entry point: breed and score one chunk of parent pairs."""
+    return _worker_solver.breed_chunk(stream_key, parent_pairs)
+
+
+class ParallelBreeder:
+    """Process pool producing and scoring offspring for a GeneticAlgorithmVRPSolver.
+
+    Use as a context manager so the pool and the shared memory block are
+    released when the run ends.
+    """
+
+    def __init__(self, solver, num_workers: int):
+        """Start the pool.
+
+        Args:
+            solver: GeneticAlgorithmVRPSolver whose problem data and operator
+                settings the workers replicate
+            num_workers: Number of worker processes
+        """
+        self._matrix = SharedDistanceMatrix(solver.distance_matrix)
+        self._executor = ProcessPoolExecutor(
+            max_workers=num_workers,
+            initializer=_init_worker,
+            initargs=(self._matrix.name, self._matrix.shape, solver_config(solver)),
+        )
+
+    def breed(
+        self,
+        stream_keys: Sequence[Tuple[int, ...]],
+        parent_chunks: Sequence[Sequence[Tuple[List[int], List[int]]]],
+    ) -> List[List[Tuple[List[int], float, bytes]]]:
+        """Breed all chunks in parallel.
+
+        Args:
+            stream_keys: RNG substream key of each chunk
+            parent_chunks: Parent pairs of each chunk
+
+        Returns:
+            For each chunk, the (offspring tour, fitness, canonical key) triples in order
+        """
+        return list(self._executor.map(_breed_chunk, stream_keys, parent_chunks))
+
+    def close(self) -> None:
+        """Shut the pool down and free the shared memory."""
+        self._executor.shutdown()
+        self._matrix.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
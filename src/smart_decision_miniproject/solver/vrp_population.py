@@ -0,0 +1,140 @@
+"""Array storage and vectorized evaluation of a population of VRP solutions.
+
+Every solution visits all customers, so a population fits into a
+(population size x number of customers) int32 array holding each
+solution's routes concatenated (its giant tour), together with a boolean
+array of the same shape marking the positions where a new route starts.
+Distances and loads of the whole population are then obtained with a few
+gathers and sums over the NumPy distance matrix.
+"""
+
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+
+class RoutePopulation:
+    """A population of route-list solutions stored as giant tours plus route breaks."""
+
+    def __init__(self, tours: np.ndarray, route_starts: np.ndarray):
+        """Wrap existing arrays.
+
+        Args:
+            tours: (population size, number of customers) int32 array of giant tours
+            route_starts: Boolean array of the same shape, True where a route begins
+                (always True in the first column)
+        """
+        self.tours = tours
+        self.route_starts = route_starts
+
+    @classmethod
+    def empty(cls, size: int, num_customers: int) -> 'RoutePopulation':
+        """Allocate storage for ``size`` individuals, to be filled with ``set_solution``."""
+        return cls(np.zeros((size, num_customers), dtype=np.int32), np.zeros((size, num_customers), dtype=bool))
+
+    @classmethod
+    def from_solutions(cls, solutions: Sequence[List[List[int]]], num_customers: int) -> 'RoutePopulation':
+        """Encode solutions given as lists of routes.
+
+        Args:
+            solutions: Solutions, each visiting all ``num_customers`` customers
+            num_customers: Number of customers (excluding the depot)
+
+        Raises:
+            ValueError: If a solution does not visit exactly ``num_customers`` customers
+        """
+        population = cls.empty(len(solutions), num_customers)
+        for row, routes in enumerate(solutions):
+            population.set_solution(row, routes)
+        return population
+
+    def set_solution(self, row: int, routes: List[List[int]]) -> None:
+        """Overwrite one individual in place with a solution given as a list of routes.
+
+        Raises:
+            ValueError: If the solution does not visit exactly as many customers as a row holds
+        """
+        num_customers = self.tours.shape[1]
+        tour = self.tours[row]
+        route_starts = self.route_starts[row]
+        route_starts[:] = False
+        position = 0
+        for route in routes:
+            if not route:
+                continue
+            end = position + len(route)
+            if end > num_customers:
+                raise ValueError(f"Solution {row} visits more than {num_customers} customers")
+            tour[position:end] = route
+            route_starts[position] = True
+            position = end
+        if position != num_customers:
+            raise ValueError(f"Solution {row} visits {position} customers instead of {num_customers}")
+
+    def subset(self, rows: Sequence[int]) -> 'RoutePopulation':
+        """Copy of the given individuals, e.g. the ones that still need scoring."""
+        return RoutePopulation(self.tours[rows], self.route_starts[rows])
+
+    def head(self, count: int) -> 'RoutePopulation':
+        """View (not a copy) of the first ``count`` individuals."""
+        return RoutePopulation(self.tours[:count], self.route_starts[:count])
+
+    def __len__(self) -> int:
+        return self.tours.shape[0]
+
+    def solution(self, index: int) -> List[List[int]]:
+        """Decode one individual back into a list of routes."""
+        tour = self.tours[index].tolist()
+        starts = np.flatnonzero(self.route_starts[index]).tolist()
+        ends = starts[1:] + [len(tour)]
+        return [tour[start:end] for start, end in zip(starts, ends)]
+
+    def route_ends(self) -> np.ndarray:
+        """Boolean array, True at the last customer of each route."""
+        ends = np.ones_like(self.route_starts)
+        ends[:, :-1] = self.route_starts[:, 1:]
+        return ends
+
+    def distances(self, distance_matrix: np.ndarray, depot_index: int = 0) -> np.ndarray:
+        """Total distance of every individual, depot legs included.
+
+        Args:
+            distance_matrix: Square NumPy distance matrix
+            depot_index: Index of the depot
+
+        Returns:
+            Array of shape (population size,)
+        """
+        if self.tours.shape[1] == 0:
+            return np.zeros(len(self))
+        previous = np.empty_like(self.tours)
+        previous[:, 1:] = self.tours[:, :-1]
+        previous[self.route_starts] = depot_index  # Routes start at the depot (column 0 included)
+
+        inbound = distance_matrix[previous, self.tours].sum(axis=1)
+        to_depot = distance_matrix[self.tours, depot_index]
+        return inbound + np.where(self.route_ends(), to_depot, 0.0).sum(axis=1)
+
+    def loads(self, demands: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Load of every route of every individual.
+
+        Args:
+            demands: Demand of each location
+
+        Returns:
+            Tuple of (loads, route ids): ``loads[i, r]`` is the load of route r of
+            individual i (0 past its last route); ``route ids`` gives, for every
+            tour position, the route it belongs to
+        """
+        size, num_customers = self.tours.shape
+        route_ids = np.cumsum(self.route_starts, axis=1) - 1
+        flat_ids = (route_ids + np.arange(size)[:, None] * num_customers).ravel()
+        loads = np.bincount(flat_ids, weights=demands[self.tours].ravel(), minlength=size * num_customers)
+        return loads.reshape(size, num_customers), route_ids
+
+    def capacity_excess(self, demands: np.ndarray, vehicle_capacity: float) -> np.ndarray:
+        """Total load above capacity over all routes of every individual."""
+        if self.tours.shape[1] == 0:
+            return np.zeros(len(self))
+        loads, _ = self.loads(demands)
+        return np.clip(loads - vehicle_capacity, 0.0, None).sum(axis=1)
@@ -0,0 +1,90 @@
+"""Per-route metrics of a VRP solution computed in one vectorized pass.
+
+Routes are padded with the depot into a (routes x longest route + 2) index
+array, so distances and loads are single gathers and sums over the NumPy
+distance matrix, and the time-window schedule advances all routes together,
+one position at a time.
+"""
+
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from smart_decision_miniproject.solver.vrp_time_windows import TimeWindows
+
+
+class RouteMetrics:
+    """Distance, load, duration and time-window slack of every route."""
+
+    def __init__(
+        self,
+        routes: Sequence[Sequence[int]],
+        distance_matrix: np.ndarray,
+        demands: np.ndarray,
+        service_times: Optional[np.ndarray] = None,
+        time_windows: Optional[TimeWindows] = None,
+        depot_index: int = 0,
+    ):
+        """Compute the metrics.
+
+        Args:
+            routes: Non-empty routes without the depot
+            distance_matrix: Square NumPy distance matrix (also the travel times)
+            demands: Demand of each location
+            service_times: Service duration of each location, used for the
+                duration when there are no time windows (None for zero)
+            time_windows: Time-window data; gives waiting times and slack
+            depot_index: Index of the depot
+        """
+        num_routes = len(routes)
+        longest = max((len(route) for route in routes), default=0)
+        stops = np.full((num_routes, longest + 2), depot_index, dtype=np.int64)
+        visits = np.zeros((num_routes, longest + 2), dtype=bool)
+        for row, route in enumerate(routes):
+            stops[row, 1:len(route) + 1] = route
+            visits[row, 1:len(route) + 1] = True
+
+        legs = np.where(visits[:, 1:] | visits[:, :-1], distance_matrix[stops[:, :-1], stops[:, 1:]], 0.0)
+        #: Length of each route, depot legs included
+        self.distances: np.ndarray = legs.sum(axis=1)
+        #: Total demand served by each route
+        self.loads: np.ndarray = np.where(visits, demands[stops], 0.0).sum(axis=1)
+
+        #: Time between leaving and returning to the depot, waiting included
+        self.durations: np.ndarray
+        #: Smallest margin to a due time along each route (None without time windows)
+        self.slacks: Optional[np.ndarray] = None
+        if time_windows is None:
+            service = np.zeros(len(demands)) if service_times is None else service_times
+            self.durations = self.distances + np.where(visits, service[stops], 0.0).sum(axis=1)
+            return
+
+        ready = np.asarray(time_windows.ready_times, dtype=float)
+        due = np.asarray(time_windows.due_times, dtype=float)
+        service = np.asarray(time_windows.service_times, dtype=float)
+        time = np.full(num_routes, float(time_windows.depot_departure))
+        slack = np.full(num_routes, np.inf)
+        for position in range(1, longest + 1):
+            active = visits[:, position]
+            customer = stops[:, position]
+            start = np.maximum(ready[customer], time + legs[:, position - 1])
+            slack = np.where(active, np.minimum(slack, due[customer] - start), slack)
+            time = np.where(active, start + service[customer], time)
+        # The return leg of a route is the leg after its last customer
+        lengths = visits.sum(axis=1)
+        returned = time + legs[np.arange(num_routes), lengths]
+        self.slacks = np.minimum(slack, time_windows.depot_deadline - returned)
+        self.durations = returned - time_windows.depot_departure
+
+    def __len__(self) -> int:
+        return len(self.distances)
+
+    def as_records(self) -> List[dict]:
+        """Metrics of each route as a dictionary."""
+        slacks = self.slacks.tolist() if self.slacks is not None else [None] * len(self)
+        return [
+            {'distance': distance, 'load': load, 'duration': duration, 'slack': slack}
+            for distance, load, duration, slack in zip(
+                self.distances.tolist(), self.loads.tolist(), self.durations.tolist(), slacks
+            )
+        ]
@@ -0,0 +1,190 @@
+"""Vectorized Solomon instance parsing with a binary cache keyed by content hash.
+
+The parser locates the vehicle and column headers with two regular
+expressions and converts the whole customer block in a single NumPy parse
+into one array per column. Parsed instances are kept in memory and, when a
+cache directory is set (``SMART_DECISION_CACHE_DIR`` for the default cache),
+saved as ``.npz`` files named after the SHA-256 of the cache version and the
+file content, so re-uploading a file or re-running a benchmark loads the
+arrays instead of parsing the text again.
+"""
+
+import hashlib
+import os
+import re
+import zipfile
+from collections import OrderedDict
+from typing import Dict, Optional
+
+import numpy as np
+
+# Columns of the customer block, in file order
+SOLOMON_COLUMNS = ('id', 'x', 'y', 'demand', 'ready_time', 'due_time', 'service_time')
+
+# On-disk cache location of the default cache; unset keeps it in memory only
+DEFAULT_CACHE_DIR = os.environ.get('SMART_DECISION_CACHE_DIR') or None
+
+# Part of every cache key: bump it when the parser or the .npz layout changes
+CACHE_VERSION = 2
+
+# Vehicle section, either "NUMBER CAPACITY" followed by a line of values or "NUMBER 25 CAPACITY 200"
+_VEHICLES_TWO_LINES = re.compile(r'NUMBER\s+CAPACITY\s*\n\s*(\d+)\s+(\d+)', re.IGNORECASE)
+_VEHICLES_ONE_LINE = re.compile(r'NUMBER\s+(\d+)\s+CAPACITY\s+(\d+)', re.IGNORECASE)
+# Last header line before the customer rows: the column titles, else the CUSTOMER section title
+_COLUMN_HEADER = re.compile(r'^[^\n]*XCOORD[^\n]*$', re.IGNORECASE | re.MULTILINE)
+_SECTION_HEADER = re.compile(r'^\s*CUST[^\n]*$', re.IGNORECASE | re.MULTILINE)
+
+
+class SolomonInstance:
+    """A Solomon instance stored as one NumPy array per column."""
+
+    def __init__(self, columns: Dict[str, np.ndarray], num_vehicles: int, vehicle_capacity: int):
+        """Wrap parsed columns.
+
+        Args:
+            columns: Array of every name in ``SOLOMON_COLUMNS``, all of the same length
+            num_vehicles: Number of vehicles
+            vehicle_capacity: Capacity of each vehicle
+        """
+        self.columns = columns
+        self.num_vehicles = num_vehicles
+        self.vehicle_capacity = vehicle_capacity
+
+    def __len__(self) -> int:
+        return len(self.columns['id'])
+
+    @property
+    def params(self) -> Dict[str, int]:
+        """Parameters in the format returned by ``SolomonDataParser``."""
+        return {'num_vehicles': self.num_vehicles, 'vehicle_capacity': self.vehicle_capacity}
+
+    def save(self, path: str) -> None:
+        """Write the instance to an ``.npz`` file, atomically replacing any previous one."""
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, 'wb') as f:
+            np.savez(f, params=np.array([self.num_vehicles, self.vehicle_capacity], dtype=np.int64),
+                     **self.columns)
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'SolomonInstance':
+        """Read an instance written by ``save``."""
+        with np.load(path) as data:
+            columns = {name: data[name] for name in SOLOMON_COLUMNS}
+            num_vehicles, vehicle_capacity = (int(value) for value in data['params'])
+        return cls(columns, num_vehicles, vehicle_capacity)
+
+
+def _parse_rows(block: str) -> np.ndarray:
+    """Parse customer rows into a (rows, 7) float array.
+
+    The block is converted in one pass when it holds only numeric rows of
+    seven fields; otherwise rows that do not start with a digit, have fewer
+    than seven fields or contain non-numeric values are dropped first.
+    """
+    width = len(SOLOMON_COLUMNS)
+    lines = [parts for parts in (line.split() for line in block.splitlines()) if parts]
+    if all(len(parts) == width for parts in lines):
+        try:
+            return np.array(lines, dtype=np.float64).reshape(-1, width)
+        except ValueError:
+            pass
+
+    rows = []
+    for parts in lines:
+        if len(parts) < width or not parts[0][0].isdigit():
+            continue
+        try:
+            rows.append([float(part) for part in parts[:width]])
+        except ValueError:
+            continue
+    return np.array(rows, dtype=np.float64).reshape(-1, width)
+
+
+def parse_solomon_columns(file_content: str) -> SolomonInstance:
+    """Parse a Solomon file into column arrays.
+
+    Missing vehicle information defaults to one vehicle per ten locations
+    and a capacity of 200, as in ``SolomonDataParser``.
+
+    Args:
+        file_content: Content of the Solomon file
+
+    Returns:
+        The parsed instance; it has no customers if no customer section is found
+    """
+    match = _VEHICLES_TWO_LINES.search(file_content) or _VEHICLES_ONE_LINE.search(file_content)
+
+    header = _COLUMN_HEADER.search(file_content) or _SECTION_HEADER.search(file_content)
+    table = _parse_rows(file_content[header.end():]) if header else np.empty((0, len(SOLOMON_COLUMNS)))
+    columns = {}
+    for index, name in enumerate(SOLOMON_COLUMNS):
+        column = table[:, index]
+        columns[name] = column if name in ('x', 'y') else column.astype(np.int64)
+
+    if match:
+        num_vehicles, vehicle_capacity = int(match.group(1)), int(match.group(2))
+    else:
+        num_vehicles, vehicle_capacity = max(1, len(table) // 10), 200
+    return SolomonInstance(columns, num_vehicles, vehicle_capacity)
+
+
+def content_key(file_content: str) -> str:
+    """SHA-256 hex digest identifying a file content as parsed by this cache version."""
+    return hashlib.sha256(f"solomon-v{CACHE_VERSION}\n{file_content}".encode('utf-8')).hexdigest()
+
+
+class SolomonInstanceCache:
+    """Parsed Solomon instances kept in memory and optionally on disk."""
+
+    def __init__(self, cache_dir: Optional[str] = DEFAULT_CACHE_DIR, max_entries: int = 32):
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory of the ``.npz`` files, None to cache in memory only
+                (the default unless ``SMART_DECISION_CACHE_DIR`` is set)
+            max_entries: Number of instances kept in memory
+        """
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, SolomonInstance]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Optional[str]:
+        return os.path.join(self.cache_dir, f"{key}.npz") if self.cache_dir else None
+
+    def load(self, file_content: str) -> SolomonInstance:
+        """Return the parsed instance, parsing the content only on a cache miss."""
+        key = content_key(file_content)
+        instance = self._entries.get(key)
+        if instance is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return instance
+
+        path = self._path(key)
+        if path is not None and os.path.exists(path):
+            try:
+                instance = SolomonInstance.load(path)
+                self.hits += 1
+            except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+                instance = None  # Unreadable entry: parse again and overwrite it
+        if instance is None:
+            self.misses += 1
+            instance = parse_solomon_columns(file_content)
+            if path is not None:
+                try:
+                    os.makedirs(self.cache_dir, exist_ok=True)
+                    instance.save(path)
+                except OSError:
+                    pass  # The cache is an optimization; a read-only location is not an error
+
+        self._entries[key] = instance
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return instance
+
+
+# Cache shared by SolomonDataParser and solve_solomon_vrp
+default_instance_cache = SolomonInstanceCache()
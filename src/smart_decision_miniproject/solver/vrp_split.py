@@ -0,0 +1,506 @@
+"""Giant-tour decoding for VRP chromosomes (Prins' Split procedure).
+
+A giant tour is a permutation of all customers without depot visits. Split
+finds the optimal way to cut it into consecutive routes, so genetic operators
+can work on flat permutations and leave the capacity handling to the decoder.
+"""
+
+import math
+from collections import deque
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from smart_decision_miniproject.solver.vrp_time_windows import TimeWindows
+
+# Tolerance used when comparing floating point loads and potentials
+EPSILON = 1e-9
+
+
+def routes_to_giant_tour(routes: Sequence[Sequence[int]]) -> List[int]:
+    """Concatenate routes into a single giant tour.
+
+    Args:
+        routes: List of routes, each a list of customer indices
+
+    Returns:
+        Flat list of customer indices in visiting order
+    """
+    giant_tour = []
+    for route in routes:
+        giant_tour.extend(route)
+    return giant_tour
+
+
+def _check_demands(giant_tour: Sequence[int], demands: Sequence[float], vehicle_capacity: float) -> None:
+    """Raise ValueError if a single customer cannot be served by any vehicle."""
+    for customer in giant_tour:
+        if demands[customer] > vehicle_capacity + EPSILON:
+            raise ValueError(
+                f"Customer {customer} demand {demands[customer]} exceeds vehicle capacity {vehicle_capacity}"
+            )
+
+
+def _prefix_sums(
+    giant_tour: Sequence[int],
+    distance_matrix: Sequence[Sequence[float]],
+    demands: Sequence[float],
+    depot_index: int,
+) -> Tuple[List[float], List[float], List[float], List[float]]:
+    """Precompute the 1-based prefix arrays used by the Split recurrences.
+
+    Returns:
+        Cumulative loads, cumulative distances along the tour, distances from
+        the depot and distances back to the depot, indexed by tour position.
+    """
+    if isinstance(distance_matrix, np.ndarray):
+        # Gather all legs at once when the matrix is a NumPy array
+        tour = np.asarray(giant_tour, dtype=np.intp)
+        cumulative_load = [0.0] + np.cumsum(np.asarray(demands, dtype=np.float64)[tour]).tolist()
+        cumulative_distance = [0.0, 0.0] + np.cumsum(distance_matrix[tour[:-1], tour[1:]]).tolist()
+        from_depot = [0.0] + distance_matrix[depot_index, tour].tolist()
+        to_depot = [0.0] + distance_matrix[tour, depot_index].tolist()
+        return cumulative_load, cumulative_distance, from_depot, to_depot
+
+    n = len(giant_tour)
+    cumulative_load = [0.0] * (n + 1)
+    cumulative_distance = [0.0] * (n + 1)
+    from_depot = [0.0] * (n + 1)
+    to_depot = [0.0] * (n + 1)
+    depot_row = distance_matrix[depot_index]
+
+    previous = depot_index
+    for position, customer in enumerate(giant_tour, start=1):
+        cumulative_load[position] = cumulative_load[position - 1] + demands[customer]
+        if position > 1:
+            cumulative_distance[position] = (
+                cumulative_distance[position - 1] + distance_matrix[previous][customer]
+            )
+        from_depot[position] = depot_row[customer]
+        to_depot[position] = distance_matrix[customer][depot_index]
+        previous = customer
+
+    return cumulative_load, cumulative_distance, from_depot, to_depot
+
+
+def _extract_routes(giant_tour: Sequence[int], predecessors: List[int]) -> List[List[int]]:
+    """Rebuild the routes from the Split predecessor labels."""
+    routes = []
+    end = len(giant_tour)
+    while end > 0:
+        start = predecessors[end]
+        routes.append(list(giant_tour[start:end]))
+        end = start
+    routes.reverse()
+    return routes
+
+
+def _route_arcs(
+    giant_tour: Sequence[int],
+    start: int,
+    distance_matrix: Sequence[Sequence[float]],
+    demands: Sequence[float],
+    vehicle_capacity: float,
+    depot_index: int,
+    time_windows: Optional[TimeWindows],
+) -> List[Tuple[int, float]]:
+    """Feasible routes serving the tour from position ``start`` on.
+
+    A route is extended until its load or a customer deadline is violated,
+    since every longer route would violate it as well.
+
+    Returns:
+        List of (end position, route distance) for the routes serving
+        ``giant_tour[start:end]``
+    """
+    arcs = []
+    load = 0.0
+    cost = 0.0
+    previous = depot_index
+    if time_windows is not None:
+        time = time_windows.depot_departure
+    for end in range(start + 1, len(giant_tour) + 1):
+        customer = giant_tour[end - 1]
+        load += demands[customer]
+        if load > vehicle_capacity + EPSILON:
+            break
+        if end == start + 1:
+            cost = distance_matrix[depot_index][customer]
+        else:
+            cost += distance_matrix[previous][customer]
+        returns_late = False
+        if time_windows is not None:
+            time = max(time_windows.ready_times[customer],
+                       time + time_windows.travel_times[previous][customer])
+            if time > time_windows.due_times[customer] + EPSILON:
+                break
+            time += time_windows.service_times[customer]
+            # Too late back at the depot: the route cannot end here
+            returns_late = (time + time_windows.travel_times[customer][depot_index] >
+                            time_windows.depot_deadline + EPSILON)
+        previous = customer
+        if not returns_late:
+            arcs.append((end, cost + distance_matrix[customer][depot_index]))
+    return arcs
+
+
+def split_bellman(
+    giant_tour: Sequence[int],
+    distance_matrix: Sequence[Sequence[float]],
+    demands: Sequence[float],
+    vehicle_capacity: float,
+    depot_index: int = 0,
+    time_windows: Optional[TimeWindows] = None,
+) -> Tuple[float, List[List[int]]]:
+    """Optimal split with Prins' original Bellman recurrence.
+
+    Runs in O(n * B) where B is the average number of customers per route.
+    It is the reference implementation and the variant used with time
+    windows: a route is extended until its load or a customer deadline is
+    violated, since every longer route would violate it as well.
+
+    Args:
+        giant_tour: Permutation of customer indices
+        distance_matrix: Square matrix of distances between locations
+        demands: Demand for each location
+        vehicle_capacity: Maximum capacity for each vehicle
+        depot_index: Index of the depot
+        time_windows: Time-window data for VRPTW instances, None for CVRP
+
+    Returns:
+        Tuple of (total distance, list of routes). The distance is ``inf`` and
+        the route list empty if some customer cannot be served on time at all.
+    """
+    n = len(giant_tour)
+    if n == 0:
+        return 0.0, []
+    _check_demands(giant_tour, demands, vehicle_capacity)
+
+    potential = [math.inf] * (n + 1)
+    potential[0] = 0.0
+    predecessors = [0] * (n + 1)
+
+    for start in range(n):
+        if potential[start] == math.inf:
+            continue
+        for end, cost in _route_arcs(giant_tour, start, distance_matrix, demands, vehicle_capacity,
+                                     depot_index, time_windows):
+            total = potential[start] + cost
+            if total < potential[end]:
+                potential[end] = total
+                predecessors[end] = start
+
+    if potential[n] == math.inf:
+        return math.inf, []
+    return potential[n], _extract_routes(giant_tour, predecessors)
+
+
+def split_bellman_limited_fleet(
+    giant_tour: Sequence[int],
+    distance_matrix: Sequence[Sequence[float]],
+    demands: Sequence[float],
+    vehicle_capacity: float,
+    max_vehicles: int,
+    depot_index: int = 0,
+    time_windows: Optional[TimeWindows] = None,
+) -> Tuple[float, List[List[int]]]:
+    """Optimal Bellman split with at most ``max_vehicles`` routes in O(m * n * B).
+
+    The feasible routes are enumerated once; one layer of the recurrence is
+    then run per vehicle count. This is the limited-fleet variant used with
+    time windows, where the linear split does not apply.
+
+    Args:
+        giant_tour: Permutation of customer indices
+        distance_matrix: Square matrix of distances between locations
+        demands: Demand for each location
+        vehicle_capacity: Maximum capacity for each vehicle
+        max_vehicles: Maximum number of routes
+        depot_index: Index of the depot
+        time_windows: Time-window data for VRPTW instances, None for CVRP
+
+    Returns:
+        Tuple of (total distance, list of routes). The distance is ``inf`` and
+        the route list empty if no split with ``max_vehicles`` routes exists.
+    """
+    n = len(giant_tour)
+    if n == 0:
+        return 0.0, []
+    _check_demands(giant_tour, demands, vehicle_capacity)
+
+    arcs = [_route_arcs(giant_tour, start, distance_matrix, demands, vehicle_capacity, depot_index, time_windows)
+            for start in range(n)]
+    num_layers = min(max_vehicles, n)
+    potential = [[math.inf] * (n + 1) for _ in range(num_layers + 1)]
+    potential[0][0] = 0.0
+    predecessors = [[0] * (n + 1) for _ in range(num_layers + 1)]
+
+    for k in range(num_layers):
+        previous_layer = potential[k]
+        current_layer = potential[k + 1]
+        current_predecessors = predecessors[k + 1]
+        for start in range(k, n):
+            if previous_layer[start] == math.inf:
+                continue
+            for end, cost in arcs[start]:
+                total = previous_layer[start] + cost
+                if total < current_layer[end]:
+                    current_layer[end] = total
+                    current_predecessors[end] = start
+
+    best_layer = min(range(1, num_layers + 1), key=lambda k: potential[k][n])
+    best_cost = potential[best_layer][n]
+    if best_cost == math.inf:
+        return math.inf, []
+
+    routes = []
+    end = n
+    for k in range(best_layer, 0, -1):
+        start = predecessors[k][end]
+        routes.append(list(giant_tour[start:end]))
+        end = start
+    routes.reverse()
+    return best_cost, routes
+
+
+def split_penalized(
+    giant_tour: Sequence[int],
+    distance_matrix: Sequence[Sequence[float]],
+    demands: Sequence[float],
+    vehicle_capacity: float,
+    capacity_penalty: float,
+    depot_index: int = 0,
+    max_load_factor: float = 1.5,
+) -> Tuple[float, List[List[int]]]:
+    """Split that allows overloaded routes at a cost per unit of excess load.
+
+    Used by search methods that also explore capacity-infeasible solutions.
+    Routes are limited to ``max_load_factor`` times the capacity (single
+    customer routes are always allowed), which keeps the recurrence O(n * B).
+
+    Args:
+        giant_tour: Permutation of customer indices
+        distance_matrix: Square matrix of distances between locations
+        demands: Demand for each location
+        vehicle_capacity: Maximum capacity for each vehicle
+        capacity_penalty: Cost per unit of load above capacity
+        depot_index: Index of the depot
+        max_load_factor: Largest route load considered, relative to the capacity
+
+    Returns:
+        Tuple of (distance plus capacity penalty, list of routes)
+    """
+    n = len(giant_tour)
+    if n == 0:
+        return 0.0, []
+    cumulative_load, cumulative_distance, from_depot, to_depot = _prefix_sums(
+        giant_tour, distance_matrix, demands, depot_index
+    )
+    load_limit = max_load_factor * vehicle_capacity
+
+    potential = [math.inf] * (n + 1)
+    potential[0] = 0.0
+    predecessors = [0] * (n + 1)
+    for start in range(n):
+        base = potential[start] + from_depot[start + 1] - cumulative_distance[start + 1]
+        for end in range(start + 1, n + 1):
+            load = cumulative_load[end] - cumulative_load[start]
+            if load > load_limit + EPSILON and end > start + 1:
+                break
+            total = base + cumulative_distance[end] + to_depot[end]
+            if load > vehicle_capacity + EPSILON:
+                total += capacity_penalty * (load - vehicle_capacity)
+            if total < potential[end]:
+                potential[end] = total
+                predecessors[end] = start
+
+    return potential[n], _extract_routes(giant_tour, predecessors)
+
+
+def split_linear(
+    giant_tour: Sequence[int],
+    distance_matrix: Sequence[Sequence[float]],
+    demands: Sequence[float],
+    vehicle_capacity: float,
+    depot_index: int = 0,
+) -> Tuple[float, List[List[int]]]:
+    """Optimal split in O(n) for capacity-only problems with an unlimited fleet.
+
+    Implements the monotone-queue algorithm of Vidal (2016): the candidate
+    predecessors are kept in a deque ordered by both position and potential,
+    so each position is pushed and popped at most once.
+
+    Args:
+        giant_tour: Permutation of customer indices
+        distance_matrix: Square matrix of distances between locations
+        demands: Demand for each location
+        vehicle_capacity: Maximum capacity for each vehicle
+        depot_index: Index of the depot
+
+    Returns:
+        Tuple of (total distance, list of routes)
+    """
+    n = len(giant_tour)
+    if n == 0:
+        return 0.0, []
+    _check_demands(giant_tour, demands, vehicle_capacity)
+
+    cumulative_load, cumulative_distance, from_depot, to_depot = _prefix_sums(
+        giant_tour, distance_matrix, demands, depot_index
+    )
+    potential = [math.inf] * (n + 1)
+    potential[0] = 0.0
+    predecessors = [0] * (n + 1)
+
+    # phi[i]: cost contribution of opening a route right after position i
+    phi = [math.inf] * (n + 1)
+    phi[0] = from_depot[1] - cumulative_distance[1]
+
+    queue = deque([0])
+    for t in range(1, n + 1):
+        front = queue[0]
+        potential[t] = phi[front] + cumulative_distance[t] + to_depot[t]
+        predecessors[t] = front
+
+        if t < n:
+            phi[t] = potential[t] + from_depot[t + 1] - cumulative_distance[t + 1]
+            back = queue[-1]
+            # back dominates t if it reaches as far and is not more expensive
+            if not (cumulative_load[back] == cumulative_load[t] and phi[t] > phi[back]):
+                while queue and phi[t] < phi[queue[-1]] + EPSILON:
+                    queue.pop()
+                queue.append(t)
+            while cumulative_load[t + 1] - cumulative_load[queue[0]] > vehicle_capacity + EPSILON:
+                queue.popleft()
+
+    return potential[n], _extract_routes(giant_tour, predecessors)
+
+
+def split_linear_limited_fleet(
+    giant_tour: Sequence[int],
+    distance_matrix: Sequence[Sequence[float]],
+    demands: Sequence[float],
+    vehicle_capacity: float,
+    max_vehicles: int,
+    depot_index: int = 0,
+) -> Tuple[float, List[List[int]]]:
+    """Optimal split with at most ``max_vehicles`` routes in O(m * n).
+
+    One layer of the linear split is run per vehicle count, each layer using
+    the potentials of the previous one.
+
+    Args:
+        giant_tour: Permutation of customer indices
+        distance_matrix: Square matrix of distances between locations
+        demands: Demand for each location
+        vehicle_capacity: Maximum capacity for each vehicle
+        max_vehicles: Maximum number of routes
+        depot_index: Index of the depot
+
+    Returns:
+        Tuple of (total distance, list of routes). The distance is ``inf`` and
+        the route list empty if no split with ``max_vehicles`` routes exists.
+    """
+    n = len(giant_tour)
+    if n == 0:
+        return 0.0, []
+    _check_demands(giant_tour, demands, vehicle_capacity)
+
+    cumulative_load, cumulative_distance, from_depot, to_depot = _prefix_sums(
+        giant_tour, distance_matrix, demands, depot_index
+    )
+    num_layers = min(max_vehicles, n)
+    potential = [[math.inf] * (n + 1) for _ in range(num_layers + 1)]
+    potential[0][0] = 0.0
+    predecessors = [[0] * (n + 1) for _ in range(num_layers + 1)]
+
+    for k in range(num_layers):
+        previous_layer = potential[k]
+        current_layer = potential[k + 1]
+        current_predecessors = predecessors[k + 1]
+        phi = [previous_layer[i] + from_depot[i + 1] - cumulative_distance[i + 1] for i in range(n)]
+
+        queue = deque([k])
+        for t in range(k + 1, n + 1):
+            front = queue[0]
+            current_layer[t] = phi[front] + cumulative_distance[t] + to_depot[t]
+            current_predecessors[t] = front
+
+            if t < n:
+                back = queue[-1]
+                if not (cumulative_load[back] == cumulative_load[t] and phi[t] > phi[back]):
+                    while queue and phi[t] < phi[queue[-1]] + EPSILON:
+                        queue.pop()
+                    queue.append(t)
+                while cumulative_load[t + 1] - cumulative_load[queue[0]] > vehicle_capacity + EPSILON:
+                    queue.popleft()
+
+    best_layer = min(range(1, num_layers + 1), key=lambda k: potential[k][n])
+    best_cost = potential[best_layer][n]
+    if best_cost == math.inf:
+        return math.inf, []
+
+    routes = []
+    end = n
+    for k in range(best_layer, 0, -1):
+        start = predecessors[k][end]
+        routes.append(list(giant_tour[start:end]))
+        end = start
+    routes.reverse()
+    return best_cost, routes
+
+
+def split_giant_tour(
+    giant_tour: Sequence[int],
+    distance_matrix: Sequence[Sequence[float]],
+    demands: Sequence[float],
+    vehicle_capacity: float,
+    depot_index: int = 0,
+    max_vehicles: Optional[int] = None,
+    time_windows: Optional[TimeWindows] = None,
+) -> Tuple[float, List[List[int]]]:
+    """Split a giant tour into routes, respecting the fleet size when possible.
+
+    The unlimited-fleet linear split is tried first; it is optimal whenever it
+    already uses no more than ``max_vehicles`` routes. Otherwise the
+    limited-fleet variant is used, falling back to the unlimited solution if
+    the fleet is too small to serve the tour at all. With time windows the
+    Bellman split and its limited-fleet variant are used the same way.
+
+    Args:
+        giant_tour: Permutation of customer indices
+        distance_matrix: Square matrix of distances between locations
+        demands: Demand for each location
+        vehicle_capacity: Maximum capacity for each vehicle
+        depot_index: Index of the depot
+        max_vehicles: Maximum number of routes, or None for no limit
+        time_windows: Time-window data for VRPTW instances, None for CVRP
+
+    Returns:
+        Tuple of (total distance, list of routes)
+
+    Raises:
+        ValueError: If some customer cannot be served on time even by a
+            vehicle of its own (the instance is infeasible)
+    """
+    if time_windows is not None:
+        cost, routes = split_bellman(giant_tour, distance_matrix, demands, vehicle_capacity, depot_index, time_windows)
+        if cost == math.inf:
+            late = [customer for customer in giant_tour if not time_windows.is_route_feasible([customer])]
+            raise ValueError(f"Infeasible instance: customers {late} cannot be served within their time windows")
+    else:
+        cost, routes = split_linear(giant_tour, distance_matrix, demands, vehicle_capacity, depot_index)
+    if max_vehicles is None or len(routes) <= max_vehicles:
+        return cost, routes
+
+    if time_windows is not None:
+        limited_cost, limited_routes = split_bellman_limited_fleet(
+            giant_tour, distance_matrix, demands, vehicle_capacity, max_vehicles, depot_index, time_windows
+        )
+    else:
+        limited_cost, limited_routes = split_linear_limited_fleet(
+            giant_tour, distance_matrix, demands, vehicle_capacity, max_vehicles, depot_index
+        )
+    if limited_routes:
+        return limited_cost, limited_routes
+    return cost, routes
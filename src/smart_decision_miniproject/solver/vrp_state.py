@@ -0,0 +1,203 @@
+"""Incrementally maintained route data for cheap VRP move feasibility checks."""
+
+from bisect import bisect_right
+from typing import List, Optional, Sequence, Tuple
+
+from smart_decision_miniproject.solver.vrp_time_windows import RouteSchedule, TimeWindows
+
+# Tolerance used when comparing floating point loads
+EPSILON = 1e-9
+
+
+class SolutionState:
+    """A VRP solution together with its per-route loads and schedules.
+
+    States are treated as immutable: ``apply_*`` methods return a new state
+    that shares every untouched route with the original, so a move only costs
+    a copy once it has been accepted. ``can_*`` methods check a move against
+    the capacity constraint in O(1) without building anything. With time
+    windows, route schedules are computed lazily and kept for untouched
+    routes, so moves between two routes are also checked in O(1); moves
+    inside a single route are checked by rescheduling that route.
+    """
+
+    def __init__(
+        self,
+        routes: List[List[int]],
+        demands: Sequence[float],
+        vehicle_capacity: float,
+        loads: Optional[List[float]] = None,
+        time_windows: Optional[TimeWindows] = None,
+    ):
+        """Initialize the state.
+
+        Args:
+            routes: List of routes, each a list of customer indices
+            demands: Demand for each location
+            vehicle_capacity: Maximum capacity for each vehicle
+            loads: Precomputed route loads, computed from ``routes`` if omitted
+            time_windows: Time-window data for VRPTW instances, None for CVRP
+        """
+        self.routes = routes
+        self.demands = demands
+        self.vehicle_capacity = vehicle_capacity
+        self.loads = loads if loads is not None else [sum(demands[c] for c in route) for route in routes]
+        self.time_windows = time_windows
+        self._offsets: Optional[List[int]] = None
+        self._schedules: List[Optional[RouteSchedule]] = [None] * len(routes)
+
+    def _derive(self, routes: List[List[int]], loads: List[float], touched: Tuple[int, ...]) -> 'SolutionState':
+        """Build a successor state, keeping the schedules of untouched routes."""
+        state = SolutionState(routes, self.demands, self.vehicle_capacity, loads, self.time_windows)
+        if self.time_windows is not None:
+            schedules = self._schedules[:]
+            for route_idx in touched:
+                schedules[route_idx] = None
+            state._schedules = schedules
+        return state
+
+    def schedule(self, route_idx: int) -> RouteSchedule:
+        """Forward/backward schedule of a route, computed on first use."""
+        schedule = self._schedules[route_idx]
+        if schedule is None:
+            schedule = self.time_windows.schedule(self.routes[route_idx])
+            self._schedules[route_idx] = schedule
+        return schedule
+
+    @property
+    def offsets(self) -> List[int]:
+        """Prefix sums of route lengths, used to address customers globally."""
+        if self._offsets is None:
+            offsets = [0]
+            for route in self.routes:
+                offsets.append(offsets[-1] + len(route))
+            self._offsets = offsets
+        return self._offsets
+
+    @property
+    def num_customers(self) -> int:
+        """Total number of routed customers."""
+        return self.offsets[-1]
+
+    def locate(self, index: int) -> Tuple[int, int]:
+        """Convert a global customer index into (route index, position)."""
+        route_idx = bisect_right(self.offsets, index) - 1
+        return route_idx, index - self.offsets[route_idx]
+
+    def is_feasible(self) -> bool:
+        """Check the capacity constraint (and time windows, if any) on every route."""
+        if not all(load <= self.vehicle_capacity + EPSILON for load in self.loads):
+            return False
+        if self.time_windows is not None:
+            return all(self.schedule(i).feasible for i in range(len(self.routes)))
+        return True
+
+    def can_swap(self, route1: int, pos1: int, route2: int, pos2: int) -> bool:
+        """Check whether exchanging two customers keeps the solution feasible.
+
+        O(1) for customers of different routes.
+        """
+        customer1 = self.routes[route1][pos1]
+        customer2 = self.routes[route2][pos2]
+        if route1 == route2:
+            if self.time_windows is None:
+                return True
+            route = self.routes[route1][:]
+            route[pos1], route[pos2] = customer2, customer1
+            return self.time_windows.is_route_feasible(route)
+
+        demand1 = self.demands[customer1]
+        demand2 = self.demands[customer2]
+        if (self.loads[route1] - demand1 + demand2 > self.vehicle_capacity + EPSILON or
+                self.loads[route2] - demand2 + demand1 > self.vehicle_capacity + EPSILON):
+            return False
+        if self.time_windows is None:
+            return True
+        return (self.time_windows.can_replace(self.routes[route1], self.schedule(route1), pos1, customer2) and
+                self.time_windows.can_replace(self.routes[route2], self.schedule(route2), pos2, customer1))
+
+    def can_relocate(self, from_route: int, from_pos: int, to_route: int, to_pos: Optional[int] = None) -> bool:
+        """Check whether moving a customer keeps the solution feasible.
+
+        O(1) for moves between different routes. ``to_pos`` is the insertion
+        position as in ``apply_relocate``; it is required with time windows.
+        """
+        if self.time_windows is not None and to_pos is None:
+            raise ValueError("to_pos is required to check a relocation with time windows")
+
+        customer = self.routes[from_route][from_pos]
+        if from_route == to_route:
+            if self.time_windows is None:
+                return True
+            route = self.routes[from_route][:]
+            route.insert(to_pos, route.pop(from_pos))
+            return self.time_windows.is_route_feasible(route)
+
+        if self.loads[to_route] + self.demands[customer] > self.vehicle_capacity + EPSILON:
+            return False
+        if self.time_windows is None:
+            return True
+        return (self.time_windows.can_remove(self.routes[from_route], self.schedule(from_route), from_pos) and
+                self.time_windows.can_insert(self.routes[to_route], self.schedule(to_route), to_pos, customer))
+
+    def can_invert(self, route_idx: int, pos1: int, pos2: int) -> bool:
+        """Check whether reversing a segment keeps the route feasible."""
+        if self.time_windows is None:
+            return True
+        route = self.routes[route_idx][:]
+        route[pos1:pos2 + 1] = route[pos1:pos2 + 1][::-1]
+        return self.time_windows.is_route_feasible(route)
+
+    def apply_swap(self, route1: int, pos1: int, route2: int, pos2: int) -> 'SolutionState':
+        """Return a new state with two customers exchanged."""
+        routes = self.routes[:]
+        loads = self.loads[:]
+        customer1 = self.routes[route1][pos1]
+        customer2 = self.routes[route2][pos2]
+
+        routes[route1] = self.routes[route1][:]
+        if route2 != route1:
+            routes[route2] = self.routes[route2][:]
+            delta = self.demands[customer2] - self.demands[customer1]
+            loads[route1] += delta
+            loads[route2] -= delta
+        routes[route1][pos1] = customer2
+        routes[route2][pos2] = customer1
+
+        state = self._derive(routes, loads, (route1, route2))
+        state._offsets = self._offsets  # Route lengths are unchanged
+        return state
+
+    def apply_relocate(self, from_route: int, from_pos: int, to_route: int, to_pos: int) -> 'SolutionState':
+        """Return a new state with a customer moved.
+
+        ``to_pos`` is the insertion position in the target route after the
+        customer has been removed from its original route.
+        """
+        routes = self.routes[:]
+        loads = self.loads[:]
+
+        routes[from_route] = self.routes[from_route][:]
+        customer = routes[from_route].pop(from_pos)
+        if to_route != from_route:
+            routes[to_route] = self.routes[to_route][:]
+            demand = self.demands[customer]
+            loads[from_route] -= demand
+            loads[to_route] += demand
+        routes[to_route].insert(to_pos, customer)
+
+        state = self._derive(routes, loads, (from_route, to_route))
+        if to_route == from_route:
+            state._offsets = self._offsets
+        return state
+
+    def apply_invert(self, route_idx: int, pos1: int, pos2: int) -> 'SolutionState':
+        """Return a new state with the segment ``pos1..pos2`` of a route reversed."""
+        routes = self.routes[:]
+        route = self.routes[route_idx][:]
+        route[pos1:pos2 + 1] = route[pos1:pos2 + 1][::-1]
+        routes[route_idx] = route
+
+        state = self._derive(routes, self.loads, (route_idx,))
+        state._offsets = self._offsets
+        return state
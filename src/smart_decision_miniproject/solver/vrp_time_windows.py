@@ -0,0 +1,176 @@
+"""Time-window data and route schedules for the VRPTW.
+
+Every route keeps two arrays: the earliest service start at each position
+(forward pass) and the latest service start that still lets the rest of the
+route, including the return to the depot, meet its deadlines (backward pass).
+With both arrays, inserting, removing or exchanging a customer, or joining
+two route fragments, can be checked in constant time.
+
+Travel times are taken equal to distances, as in the Solomon benchmarks.
+"""
+
+from typing import List, Sequence, Tuple
+
+# Tolerance used when comparing floating point times
+EPSILON = 1e-9
+
+
+class RouteSchedule:
+    """Forward start times and backward latest start times of one route."""
+
+    __slots__ = ('start', 'latest', 'feasible')
+
+    def __init__(self, start: List[float], latest: List[float], feasible: bool):
+        self.start = start
+        self.latest = latest
+        self.feasible = feasible
+
+
+class TimeWindows:
+    """Time windows, service times and travel times of a VRPTW instance."""
+
+    def __init__(
+        self,
+        ready_times: Sequence[float],
+        due_times: Sequence[float],
+        service_times: Sequence[float],
+        travel_times: Sequence[Sequence[float]],
+        depot_index: int = 0,
+    ):
+        """Initialize the time-window data.
+
+        Args:
+            ready_times: Earliest service start for each location
+            due_times: Latest service start for each location (for the depot,
+                the latest return time)
+            service_times: Service duration for each location
+            travel_times: Square matrix of travel times between locations
+            depot_index: Index of the depot
+        """
+        self.ready_times = ready_times
+        self.due_times = due_times
+        self.service_times = service_times
+        self.travel_times = travel_times
+        self.depot_index = depot_index
+        self.depot_departure = ready_times[depot_index] + service_times[depot_index]
+        self.depot_deadline = due_times[depot_index]
+
+    def is_route_feasible(self, route: Sequence[int]) -> bool:
+        """Check a route with a single forward pass, stopping at the first violation."""
+        time = self.depot_departure
+        previous = self.depot_index
+        for customer in route:
+            time = max(self.ready_times[customer], time + self.travel_times[previous][customer])
+            if time > self.due_times[customer] + EPSILON:
+                return False
+            time += self.service_times[customer]
+            previous = customer
+        return time + self.travel_times[previous][self.depot_index] <= self.depot_deadline + EPSILON
+
+    def route_duration(self, route: Sequence[int]) -> float:
+        """Time from leaving the depot to returning to it, waiting included."""
+        if not route:
+            return 0.0
+        time = self.depot_departure
+        previous = self.depot_index
+        for customer in route:
+            time = max(self.ready_times[customer], time + self.travel_times[previous][customer])
+            time += self.service_times[customer]
+            previous = customer
+        return time + self.travel_times[previous][self.depot_index] - self.depot_departure
+
+    def schedule(self, route: Sequence[int]) -> RouteSchedule:
+        """Compute the forward and backward schedule of a route in O(len(route))."""
+        n = len(route)
+        start = [0.0] * n
+        latest = [0.0] * n
+        feasible = True
+
+        time = self.depot_departure
+        previous = self.depot_index
+        for k, customer in enumerate(route):
+            time = max(self.ready_times[customer], time + self.travel_times[previous][customer])
+            if time > self.due_times[customer] + EPSILON:
+                feasible = False
+            start[k] = time
+            time += self.service_times[customer]
+            previous = customer
+        if time + self.travel_times[previous][self.depot_index] > self.depot_deadline + EPSILON:
+            feasible = False
+
+        next_latest = self.depot_deadline
+        following = self.depot_index
+        for k in range(n - 1, -1, -1):
+            customer = route[k]
+            next_latest = min(
+                self.due_times[customer],
+                next_latest - self.service_times[customer] - self.travel_times[customer][following],
+            )
+            latest[k] = next_latest
+            following = customer
+
+        return RouteSchedule(start, latest, feasible)
+
+    def _departure_before(self, route: Sequence[int], schedule: RouteSchedule, position: int) -> Tuple[int, float]:
+        """Node preceding ``position`` and the time the vehicle leaves it."""
+        if position == 0:
+            return self.depot_index, self.depot_departure
+        previous = route[position - 1]
+        return previous, schedule.start[position - 1] + self.service_times[previous]
+
+    def _latest_at(self, route: Sequence[int], schedule: RouteSchedule, position: int) -> Tuple[int, float]:
+        """Node at ``position`` (the depot past the end) and its latest start time."""
+        if position == len(route):
+            return self.depot_index, self.depot_deadline
+        return route[position], schedule.latest[position]
+
+    def _reaches_in_time(self, node: int, departure: float, target: int, latest: float) -> bool:
+        arrival = departure + self.travel_times[node][target]
+        if target != self.depot_index:
+            arrival = max(arrival, self.ready_times[target])
+        return arrival <= latest + EPSILON
+
+    def _visit(self, previous: int, departure: float, customer: int) -> float:
+        """Service start at ``customer`` when leaving ``previous`` at ``departure``."""
+        return max(self.ready_times[customer], departure + self.travel_times[previous][customer])
+
+    def can_insert(self, route: Sequence[int], schedule: RouteSchedule, position: int, customer: int) -> bool:
+        """Check in O(1) whether ``customer`` can be inserted before ``position``."""
+        previous, departure = self._departure_before(route, schedule, position)
+        start = self._visit(previous, departure, customer)
+        if start > self.due_times[customer] + EPSILON:
+            return False
+        following, latest = self._latest_at(route, schedule, position)
+        return self._reaches_in_time(customer, start + self.service_times[customer], following, latest)
+
+    def can_remove(self, route: Sequence[int], schedule: RouteSchedule, position: int) -> bool:
+        """Check in O(1) whether the customer at ``position`` can be removed."""
+        previous, departure = self._departure_before(route, schedule, position)
+        following, latest = self._latest_at(route, schedule, position + 1)
+        return self._reaches_in_time(previous, departure, following, latest)
+
+    def can_replace(self, route: Sequence[int], schedule: RouteSchedule, position: int, customer: int) -> bool:
+        """Check in O(1) whether the customer at ``position`` can be replaced by ``customer``."""
+        previous, departure = self._departure_before(route, schedule, position)
+        start = self._visit(previous, departure, customer)
+        if start > self.due_times[customer] + EPSILON:
+            return False
+        following, latest = self._latest_at(route, schedule, position + 1)
+        return self._reaches_in_time(customer, start + self.service_times[customer], following, latest)
+
+    def can_join(
+        self,
+        route1: Sequence[int],
+        schedule1: RouteSchedule,
+        position1: int,
+        route2: Sequence[int],
+        schedule2: RouteSchedule,
+        position2: int,
+    ) -> bool:
+        """Check in O(1) whether ``route1[:position1] + route2[position2:]`` is feasible.
+
+        Both input routes are assumed feasible.
+        """
+        previous, departure = self._departure_before(route1, schedule1, position1)
+        following, latest = self._latest_at(route2, schedule2, position2)
+        return self._reaches_in_time(previous, departure, following, latest)
@@ -0,0 +1,115 @@
+"""Repair and perturbation of a previous solution used to warm-start a solver.
+
+A solution computed for slightly different parameters (capacity, fleet
+size, a dropped or added customer) is turned into a feasible solution of
+the current instance: unknown and duplicate customers are dropped, every
+route keeps the longest prefix that still meets the capacity and time
+windows, and the evicted and missing customers are reinserted at their
+cheapest positions. Perturbations remove a random share of customers and
+reinsert them the same way, giving a diverse set of nearby solutions.
+"""
+
+import random
+from typing import List, Optional, Sequence, Tuple
+
+from smart_decision_miniproject.solver.vrp_insertion import EPSILON, InsertionCache
+from smart_decision_miniproject.solver.vrp_time_windows import TimeWindows
+
+
+def repair_solution(
+    routes: Sequence[Sequence[int]],
+    distance_matrix: Sequence[Sequence[float]],
+    demands: Sequence[float],
+    vehicle_capacity: float,
+    num_vehicles: Optional[int] = None,
+    depot_index: int = 0,
+    time_windows: Optional[TimeWindows] = None,
+) -> Tuple[List[List[int]], List[int]]:
+    """Make a previous solution feasible for the current instance.
+
+    Args:
+        routes: Previous routes; indices outside the instance are ignored
+        distance_matrix: Square matrix of distances between locations
+        demands: Demand for each location
+        vehicle_capacity: Maximum capacity for each vehicle
+        num_vehicles: Maximum number of routes, None for no limit; the
+            routes with the smallest loads are dissolved first
+        depot_index: Index of the depot
+        time_windows: Time-window data for VRPTW instances
+
+    Returns:
+        Tuple of (feasible routes, customers that could not be inserted)
+    """
+    num_locations = len(distance_matrix)
+    seen = set()
+    kept: List[List[int]] = []
+    evicted: List[int] = []
+    for route in routes:
+        new_route: List[int] = []
+        load = 0.0
+        for customer in route:
+            if not 0 <= customer < num_locations or customer == depot_index or customer in seen:
+                continue
+            seen.add(customer)
+            fits = load + demands[customer] <= vehicle_capacity + EPSILON
+            if fits and (time_windows is None or time_windows.is_route_feasible(new_route + [customer])):
+                new_route.append(customer)
+                load += demands[customer]
+            else:
+                evicted.append(customer)
+        if new_route:
+            kept.append(new_route)
+
+    if num_vehicles is not None and len(kept) > num_vehicles:
+        kept.sort(key=lambda route: sum(demands[c] for c in route), reverse=True)
+        for route in kept[num_vehicles:]:
+            evicted.extend(route)
+        kept = kept[:num_vehicles]
+
+    missing = [c for c in range(num_locations) if c != depot_index and c not in seen]
+    cache = InsertionCache(kept, distance_matrix, demands, vehicle_capacity, num_vehicles, depot_index, time_windows)
+    for customer in evicted + missing:
+        cache.add(customer)
+    cache.insert_pending()
+    return kept, cache.pending
+
+
+def perturb_solution(
+    routes: Sequence[Sequence[int]],
+    distance_matrix: Sequence[Sequence[float]],
+    demands: Sequence[float],
+    vehicle_capacity: float,
+    rng: random.Random,
+    removal_ratio: float = 0.15,
+    num_vehicles: Optional[int] = None,
+    depot_index: int = 0,
+    time_windows: Optional[TimeWindows] = None,
+) -> List[List[int]]:
+    """Remove a random share of customers and reinsert them at their cheapest positions.
+
+    Args:
+        routes: Feasible routes (not modified)
+        distance_matrix: Square matrix of distances between locations
+        demands: Demand for each location
+        vehicle_capacity: Maximum capacity for each vehicle
+        rng: Random generator choosing the removed customers
+        removal_ratio: Share of customers removed
+        num_vehicles: Maximum number of routes, None for no limit
+        depot_index: Index of the depot
+        time_windows: Time-window data for VRPTW instances
+
+    Returns:
+        Perturbed routes; customers that fit nowhere are served by new routes
+        (beyond ``num_vehicles`` if needed), so every customer stays routed
+    """
+    customers = [c for route in routes for c in route]
+    removed = set(rng.sample(customers, max(1, int(removal_ratio * len(customers))))) if customers else set()
+    partial = [[c for c in route if c not in removed] for route in routes]
+    partial = [route for route in partial if route]
+
+    cache = InsertionCache(partial, distance_matrix, demands, vehicle_capacity, num_vehicles, depot_index, time_windows)
+    for customer in removed:
+        cache.add(customer)
+    cache.insert_pending()
+    partial.extend([customer] for customer in cache.pending)
+    return partial
@@ -0,0 +1,123 @@
+import pickle
+import random
+import timeit
+
+from src.smart_decision_miniproject.TSP_datamodel.distance_matrix_factory import RandomDistanceMatrixFactory
+from src.smart_decision_miniproject.solver.TSP import AntColonyOptimizationTSPSolver, SimulatedAnnealingTSPSolver
+from src.smart_decision_miniproject.solver.rng import MAX_EXPONENTIAL, RandomStream, substream
+
+
+def test_reproducible_stream():
+    """相同种子产生相同序列（标量与向量化抽样均如此）"""
+    first, second = RandomStream(42, block_size=64), RandomStream(42, block_size=64)
+    assert [first.random() for _ in range(200)] == [second.random() for _ in range(200)]
+    assert (first.uniforms(100) == second.uniforms(100)).all()
+    assert (first.exponentials(100) == second.exponentials(100)).all()
+    assert RandomStream("instance-a").random() == RandomStream("instance-a").random()
+    assert RandomStream(1).random() != RandomStream(2).random()
+
+    values = [first.random() for _ in range(1000)]
+    assert all(0.0 <= value < 1.0 for value in values)
+    exponentials = first.exponentials(10000)
+    assert exponentials.min() >= 0.0 and exponentials.max() <= MAX_EXPONENTIAL
+    assert abs(exponentials.mean() - 1.0) < 0.05
+
+
+def test_pairs():
+    """整数对两两不同、位于区间内，且覆盖全部有序对"""
+    stream = RandomStream(3, block_size=128)
+    pairs = [stream.pair(2, 6) for _ in range(2000)]
+    assert all(a != b and 2 <= a < 6 and 2 <= b < 6 for a, b in pairs)
+    assert len(set(pairs)) == 12
+
+    first, second = stream.pairs(0, 3, 1000)
+    assert (first != second).all() and first.max() <= 2 and second.max() <= 2
+
+    try:
+        stream.pair(5, 6)
+        assert False, "区间内不足两个整数时应抛出 ValueError"
+    except ValueError:
+        pass
+
+
+def test_random_api():
+    """继承自 random.Random 的接口照常工作"""
+    stream = RandomStream(5)
+    items = list(range(10))
+    stream.shuffle(items)
+    assert sorted(items) == list(range(10))
+    assert stream.choice(items) in items
+    assert 3 <= stream.randint(3, 7) <= 7
+    assert len(set(stream.sample(range(20), 5))) == 5
+    assert isinstance(stream, random.Random)
+
+
+def test_substreams():
+    """子流可复现且彼此独立，与生成顺序无关"""
+    assert substream(9, 0, 1).random() == substream(9, 0, 1).random()
+    assert substream(9, 0, 1).random() != substream(9, 1, 0).random()
+
+    children = RandomStream(11).spawn(3)
+    again = RandomStream(11).spawn(3)
+    assert [child.random() for child in children] == [child.random() for child in again]
+    assert len({child.random() for child in children}) == 3
+
+    # 只做标量抽样的子流不创建 NumPy 生成器
+    stream = substream(9, 2, 0)
+    stream.shuffle(list(range(10)))
+    assert stream._generator is None
+    stream.pair(0, 10)
+    assert stream._generator is not None
+
+
+def test_pickle_round_trip():
+    """序列化后从同一位置继续产生相同的随机数"""
+    stream = RandomStream(13, block_size=32)
+    for _ in range(50):
+        stream.random()
+    assert pickle.loads(pickle.dumps(stream)).random() == stream.random()
+    stream.pair(0, 10)
+    copy = pickle.loads(pickle.dumps(stream))
+    assert [copy.random() for _ in range(100)] == [stream.random() for _ in range(100)]
+    assert [copy.pair(0, 10) for _ in range(20)] == [stream.pair(0, 10) for _ in range(20)]
+
+
+def test_seeded_tsp_solvers():
+    """给定种子时模拟退火与蚁群算法的结果可复现"""
+    random.seed(4)
+    distance_matrix = RandomDistanceMatrixFactory(dimension=20, min_distance=10, max_distance=100).create_distance_matrix()
+    tours = [SimulatedAnnealingTSPSolver(distance_matrix, seed=8).solveTSP() for _ in range(2)]
+    assert tours[0] == tours[1]
+    tours = [AntColonyOptimizationTSPSolver(distance_matrix, num_ants=5, num_iterations=5, seed=8).solveTSP()
+             for _ in range(2)]
+    assert tours[0] == tours[1]
+
+
+def benchmark_draws(number=20000):
+    """热循环中各类抽样的单次耗时（秒），取多次重复的最小值；只在直接运行本文件时输出"""
+    stream, reference = RandomStream(1), random.Random(1)
+
+    def best(statement, count=number):
+        return min(timeit.repeat(statement, number=count, repeat=5)) / count
+
+    return {
+        'random': best(stream.random),
+        'reference_random': best(reference.random),
+        'randint': best(lambda: stream.randint(0, 99)),
+        'reference_randint': best(lambda: reference.randint(0, 99)),
+        'pair': best(lambda: stream.pair(0, 100)),
+        'reference_pair': best(lambda: reference.sample(range(100), 2)),
+        'substream': best(lambda: substream(7, 3, 1), count=500),
+    }
+
+
+if __name__ == "__main__":
+    test_reproducible_stream()
+    test_pairs()
+    test_random_api()
+    test_substreams()
+    test_pickle_round_trip()
+    test_seeded_tsp_solvers()
+    for name, seconds in benchmark_draws().items():
+        print(f"{name:>18}: {seconds * 1e9:8.0f} ns")
+    print("✓ 随机数服务测试通过")
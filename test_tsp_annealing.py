@@ -0,0 +1,121 @@
+import math
+import random
+import time
+
+from src.smart_decision_miniproject.TSP_datamodel.distance_matrix_factory import RandomDistanceMatrixFactory
+from src.smart_decision_miniproject.solver.TSP import MOVE_BLOCK_SIZE, SimulatedAnnealingTSPSolver
+from src.smart_decision_miniproject.solver.rng import MAX_EXPONENTIAL, RandomStream
+
+
+def _random_matrix(n, seed):
+    """生成随机对称距离矩阵"""
+    random.seed(seed)
+    return RandomDistanceMatrixFactory(dimension=n, min_distance=10, max_distance=100).create_distance_matrix()
+
+
+def test_swap_delta_matches_full_distance():
+    """O(1) 交换增量与重新计算整条路径的差值一致（含相邻位置与首尾相接）"""
+    for n in (3, 4, 12):
+        solver = SimulatedAnnealingTSPSolver(_random_matrix(n, n), seed=n)
+        tour = solver.generate_initial_solution()
+        distance = solver.calculate_tour_distance(tour)
+        for i in range(1, n):
+            for j in range(1, n):
+                if i == j:
+                    continue
+                swapped = tour.copy()
+                swapped[i], swapped[j] = swapped[j], swapped[i]
+                assert math.isclose(solver.swap_delta(tour, i, j),
+                                    solver.calculate_tour_distance(swapped) - distance, abs_tol=1e-9)
+
+
+def test_exponential_threshold():
+    """-ln(u) 阈值不超过上限，接受概率与 exp(-delta/T) 一致"""
+    stream = RandomStream(1, block_size=256)
+    values = [stream.exponential() for _ in range(20000)]
+    assert all(0.0 <= value <= MAX_EXPONENTIAL for value in values)
+    assert abs(sum(values) / len(values) - 1.0) < 0.03
+
+    solver = SimulatedAnnealingTSPSolver(_random_matrix(5, 0), seed=2)
+    accepted = sum(solver.accept_solution(100.0, 150.0, 50.0) for _ in range(20000)) / 20000
+    assert abs(accepted - math.exp(-1.0)) < 0.02
+    assert solver.accept_solution(150.0, 100.0, 1e-9)
+    assert not solver.accept_solution(100.0, 100.0 + 40.0, 1.0)
+
+
+def test_moves_per_temperature():
+    """每个温度尝试多次移动：结果合法、可复现，且总移动数仍受 max_iterations 限制"""
+    distance_matrix = _random_matrix(40, 3)
+    solvers = [SimulatedAnnealingTSPSolver(distance_matrix, cooling_rate=0.9, max_iterations=20000,
+                                           moves_per_temperature=200, seed=5) for _ in range(2)]
+    tours = [solver.solveTSP() for solver in solvers]
+    assert tours[0] == tours[1]
+    assert tours[0][0] == 0 and sorted(tours[0]) == list(range(40))
+
+    solvers[0].rng.seed(5)
+    initial = solvers[0].generate_initial_solution()
+    assert solvers[0].calculate_tour_distance(tours[0]) < solvers[0].calculate_tour_distance(initial)
+
+    try:
+        SimulatedAnnealingTSPSolver(distance_matrix, moves_per_temperature=0)
+        assert False, "moves_per_temperature 小于1时应抛出 ValueError"
+    except ValueError:
+        pass
+
+
+def test_drawn_move_schedule():
+    """成块抽取的移动：位置合法、阈值对应各自温度，并在降到最低温度前截止"""
+    solver = SimulatedAnnealingTSPSolver(_random_matrix(10, 4), initial_temperature=100.0, min_temperature=1.0,
+                                         cooling_rate=0.5, moves_per_temperature=3, seed=6)
+    firsts, seconds, thresholds = solver.draw_moves(0, 100)
+    assert len(thresholds) == 7 * 3  # 100 * 0.5^6 > 1 >= 100 * 0.5^7
+    assert all(i != j and 1 <= i < 10 and 1 <= j < 10 for i, j in zip(firsts, seconds))
+    for move, threshold in enumerate(thresholds):
+        assert 0.0 <= threshold <= 100.0 * 0.5 ** (move // 3) * MAX_EXPONENTIAL
+
+    # 跨越多个块时温度继续下降，结果仍可复现
+    _, _, thresholds = solver.draw_moves(19, 10)
+    assert len(thresholds) == 2
+    solvers = [SimulatedAnnealingTSPSolver(_random_matrix(30, 5), cooling_rate=0.9999,
+                                           max_iterations=3 * MOVE_BLOCK_SIZE + 5, seed=9) for _ in range(2)]
+    assert solvers[0].solveTSP() == solvers[1].solveTSP()
+
+
+def _scalar_draw_annealing(solver):
+    """逐次抽样的参照实现（每步调用 pair 与 accept_solution），用于对比速度"""
+    current = solver.generate_initial_solution()
+    current_distance = best_distance = solver.calculate_tour_distance(current)
+    temperature, iteration = solver.initial_temperature, 0
+    while temperature > solver.min_temperature and iteration < solver.max_iterations:
+        for _ in range(min(solver.moves_per_temperature, solver.max_iterations - iteration)):
+            i, j = solver.rng.pair(1, len(current))
+            delta = solver.swap_delta(current, i, j)
+            if solver.accept_solution(current_distance, current_distance + delta, temperature):
+                current[i], current[j] = current[j], current[i]
+                current_distance += delta
+                best_distance = min(best_distance, current_distance)
+        temperature *= solver.cooling_rate
+        iteration += solver.moves_per_temperature
+    return best_distance
+
+
+def benchmark_moves(n=200, moves=100000):
+    """成块抽样与逐次抽样的每秒移动数；只在直接运行本文件时输出"""
+    solver = SimulatedAnnealingTSPSolver(_random_matrix(n, 7), cooling_rate=0.99999, min_temperature=1e-9,
+                                         max_iterations=moves, seed=1)
+    rates = {}
+    for name, run in (('block', solver.solveTSP), ('scalar', lambda: _scalar_draw_annealing(solver))):
+        start = time.perf_counter()
+        run()
+        rates[name] = moves / (time.perf_counter() - start)
+    return rates
+
+
+if __name__ == "__main__":
+    test_swap_delta_matches_full_distance()
+    test_exponential_threshold()
+    test_moves_per_temperature()
+    test_drawn_move_schedule()
+    for name, rate in benchmark_moves().items():
+        print(f"{name:>6}: {rate / 1e6:.2f}M 次移动/秒")
+    print("✓ 模拟退火快速接受测试通过")
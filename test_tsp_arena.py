@@ -0,0 +1,82 @@
+import random
+
+import numpy as np
+
+from src.smart_decision_miniproject.TSP_datamodel.distance_matrix_factory import RandomDistanceMatrixFactory
+from src.smart_decision_miniproject.solver.TSP import (
+    AntColonyOptimizationTSPSolver,
+    SimulatedAnnealingTSPSolver,
+    SolverArena,
+)
+
+
+def _random_matrix(n, seed):
+    """生成随机对称距离矩阵"""
+    random.seed(seed)
+    return RandomDistanceMatrixFactory(dimension=n, min_distance=10, max_distance=100).create_distance_matrix()
+
+
+def test_arena_reuses_buffers_across_sizes():
+    """规模扫描中缓冲区只分配一次，各规模使用同一块内存的视图"""
+    arena = SolverArena(60)
+    solver = AntColonyOptimizationTSPSolver(num_ants=3, num_iterations=3, arena=arena, heuristic_cache=None)
+    buffers = None
+    for dim in (20, 40, 60):
+        solver.update_distance_matrix(_random_matrix(dim, dim))
+        tour = solver.solveTSP()
+        assert sorted(tour) == list(range(dim))
+        if buffers is None:
+            buffers = dict(arena.buffers)
+        assert arena.buffers == buffers
+        assert np.shares_memory(solver.pheromone.data, buffers['aco_pheromone_packed'])
+    assert arena.allocations == len(buffers) == 3
+
+    try:
+        solver.update_distance_matrix(_random_matrix(61, 0))
+        assert False, "超过预分配规模应抛出ValueError"
+    except ValueError:
+        pass
+
+
+def test_arena_candidate_mode():
+    """候选边模式同样使用预分配缓冲区"""
+    arena = SolverArena(50)
+    solver = AntColonyOptimizationTSPSolver(num_ants=3, num_iterations=3, num_candidates=6,
+                                            candidate_threshold=30, arena=arena, heuristic_cache=None)
+    allocations = None
+    for dim in (50, 40, 45):
+        solver.update_distance_matrix(_random_matrix(dim, dim))
+        assert solver.uses_candidate_lists
+        assert sorted(solver.solveTSP()) == list(range(dim))
+        allocations = allocations or arena.allocations
+        assert arena.allocations == allocations
+    assert np.shares_memory(solver.pheromone.values, arena.buffers['aco_pheromone'])
+    assert solver.pheromone.values.shape == (45, 6)
+
+
+def test_simulated_annealing_in_place_moves():
+    """模拟退火原地交换并在拒绝时撤销，结果与逐次复制邻域解相同"""
+    distance_matrix = _random_matrix(30, 1)
+    solver = SimulatedAnnealingTSPSolver(distance_matrix, max_iterations=3000, seed=7)
+    tour = solver.solveTSP()
+    assert tour[0] == 0 and sorted(tour) == list(range(30))
+
+    # 参照实现：按相同的随机抽样逐次复制邻域解并重新计算整条路径
+    solver.rng.seed(7)
+    current = solver.generate_initial_solution()
+    current_distance = best_distance = solver.calculate_tour_distance(current)
+    for i, j, threshold in zip(*solver.draw_moves(0, solver.max_iterations)):
+        neighbor = current.copy()
+        neighbor[i], neighbor[j] = neighbor[j], neighbor[i]
+        neighbor_distance = solver.calculate_tour_distance(neighbor)
+        if neighbor_distance - current_distance < threshold:
+            current, current_distance = neighbor, neighbor_distance
+            best_distance = min(best_distance, current_distance)
+    assert solver.calculate_tour_distance(tour) == best_distance
+
+
+if __name__ == "__main__":
+    test_arena_reuses_buffers_across_sizes()
+    test_arena_candidate_mode()
+    test_simulated_annealing_in_place_moves()
+    print("✓ 缓冲区复用测试通过")
@@ -0,0 +1,65 @@
+import random
+
+import numpy as np
+
+from src.smart_decision_miniproject.TSP_datamodel.distance_matrix_factory import RandomDistanceMatrixFactory
+from src.smart_decision_miniproject.solver.TSP import AntColonyOptimizationTSPSolver
+from src.smart_decision_miniproject.solver.tsp_heuristic import HeuristicCache, matrix_fingerprint
+
+
+def _random_matrix(n, seed):
+    """生成随机对称距离矩阵"""
+    random.seed(seed)
+    return RandomDistanceMatrixFactory(dimension=n, min_distance=10, max_distance=100).create_distance_matrix()
+
+
+def test_fingerprint_follows_content():
+    """相同内容的矩阵指纹相同，修改距离后指纹改变"""
+    first, second = _random_matrix(15, 1), _random_matrix(15, 1)
+    assert matrix_fingerprint(first) == matrix_fingerprint(second)
+    second.set_distance_between_sites_by_name('site_0', 'site_1', 1)
+    assert matrix_fingerprint(first) != matrix_fingerprint(second)
+
+
+def test_parameter_sweep_reuses_heuristic():
+    """同一实例上改变 alpha/挥发率/蚂蚁数时复用 η^β，改变 beta 时重新计算"""
+    cache = HeuristicCache()
+    distance_matrix = _random_matrix(25, 2)
+    solvers = [
+        AntColonyOptimizationTSPSolver(distance_matrix, num_ants=ants, alpha=alpha, beta=2.0,
+                                       evaporation_rate=rho, num_iterations=2, heuristic_cache=cache)
+        for ants, alpha, rho in ((5, 1.0, 0.5), (8, 1.5, 0.3), (3, 0.5, 0.7))
+    ]
+    assert cache.misses == 1 and cache.hits == 2
+    assert all(solver.heuristic is solvers[0].heuristic for solver in solvers)
+    for i, j in ((0, 1), (3, 7), (24, 5)):
+        assert np.isclose(solvers[0].heuristic.get(i, j), (1.0 / distance_matrix[i][j]) ** 2, rtol=1e-5)
+    for solver in solvers:
+        assert sorted(solver.solveTSP()) == list(range(25))
+
+    # beta 改变后，求解前重新取得 η^β
+    solvers[0].beta = 3.0
+    solvers[0].solveTSP()
+    assert cache.misses == 2
+    assert np.isclose(solvers[0].heuristic.get(0, 1), (1.0 / distance_matrix[0][1]) ** 3, rtol=1e-5)
+    assert solvers[1].heuristic.get(0, 1) != solvers[0].heuristic.get(0, 1)
+
+
+def test_candidate_mode_reuses_candidates():
+    """候选边模式下候选列表与 η^β 同样被缓存"""
+    cache = HeuristicCache()
+    distance_matrix = _random_matrix(40, 3)
+    first = AntColonyOptimizationTSPSolver(distance_matrix, num_candidates=6, candidate_threshold=30,
+                                           heuristic_cache=cache)
+    second = AntColonyOptimizationTSPSolver(distance_matrix, alpha=2.0, num_candidates=6, candidate_threshold=30,
+                                            heuristic_cache=cache)
+    assert second.candidates is first.candidates
+    assert second.heuristic is first.heuristic
+    assert cache.misses == 2 and cache.hits == 2
+
+
+if __name__ == "__main__":
+    test_fingerprint_follows_content()
+    test_parameter_sweep_reuses_heuristic()
+    test_candidate_mode_reuses_candidates()
+    print("✓ 启发式缓存测试通过")
@@ -0,0 +1,103 @@
+import random
+
+import numpy as np
+
+from src.smart_decision_miniproject.TSP_datamodel.distance_matrix_factory import RandomDistanceMatrixFactory
+from src.smart_decision_miniproject.solver.TSP import (
+    AntColonyOptimizationTSPSolver,
+    CandidateEdgeMatrix,
+    PackedSymmetricMatrix,
+    nearest_candidates,
+)
+
+
+def _random_matrix(n, seed):
+    """生成随机对称距离矩阵"""
+    random.seed(seed)
+    return RandomDistanceMatrixFactory(dimension=n, min_distance=10, max_distance=100).create_distance_matrix()
+
+
+def test_packed_matrix_is_symmetric():
+    """压缩上三角存储：读写对称，行读取与稠密矩阵一致"""
+    n = 7
+    matrix = PackedSymmetricMatrix(n, fill_value=1.0)
+    dense = np.ones((n, n))
+    matrix.deposit(np.array([0, 3, 6]), np.array([3, 6, 0]), 2.0)
+    for i, j in ((0, 3), (3, 6), (6, 0)):
+        dense[i, j] += 2.0
+        dense[j, i] += 2.0
+    matrix.scale(0.5)
+    dense *= 0.5
+
+    assert matrix.data.dtype == np.float32
+    assert len(matrix.data) == n * (n + 1) // 2
+    for i in range(n):
+        assert np.allclose(matrix.row(i), dense[i])
+        for j in range(n):
+            assert matrix.get(i, j) == matrix.get(j, i) == dense[i, j]
+
+
+def test_visibility_stores():
+    """可见度为 1/d（对角线为0）；候选边存储只保存最近邻"""
+    distance_matrix = _random_matrix(30, 1)
+    packed = PackedSymmetricMatrix.visibility(distance_matrix)
+    for i in range(30):
+        for j in range(30):
+            expected = 0.0 if i == j else 1.0 / distance_matrix[i][j]
+            assert abs(packed.get(i, j) - expected) < 1e-6
+
+    candidates = nearest_candidates(distance_matrix, 5)
+    assert candidates.shape == (30, 5)
+    for i in range(30):
+        assert i not in candidates[i]
+        others = sorted(distance_matrix[i][j] for j in range(30) if j != i)
+        assert sorted(distance_matrix[i][j] for j in candidates[i]) == others[:5]
+    sparse = CandidateEdgeMatrix.visibility(distance_matrix, candidates)
+    assert abs(sparse.get(0, candidates[0, 0]) - 1.0 / distance_matrix[0][candidates[0, 0]]) < 1e-6
+
+
+def test_candidate_pheromone_deposit_and_default():
+    """候选边信息素双向更新，其它边使用随挥发衰减的默认值"""
+    distance_matrix = _random_matrix(20, 2)
+    candidates = nearest_candidates(distance_matrix, 4)
+    pheromone = CandidateEdgeMatrix(candidates, fill_value=1.0, default=1.0)
+    i, j = 0, int(candidates[0, 0])
+    far = next(c for c in range(1, 20) if c not in candidates[0] and 0 not in candidates[c])
+
+    pheromone.deposit(np.array([i, 0]), np.array([j, far]), 3.0)
+    assert pheromone.get(i, j) == pheromone.get(j, i) == 4.0
+    assert pheromone.get(0, far) == 1.0
+    pheromone.scale(0.5)
+    assert pheromone.get(i, j) == 2.0 and pheromone.get(0, far) == 0.5
+    assert pheromone.nbytes == 20 * 4 * (4 + 8)
+
+
+def test_aco_storage_modes():
+    """小实例使用压缩稠密存储，大实例使用候选边存储，两种模式都得到合法回路"""
+    distance_matrix = _random_matrix(60, 3)
+    dense = AntColonyOptimizationTSPSolver(distance_matrix, num_ants=5, num_iterations=10)
+    assert not dense.uses_candidate_lists
+    assert isinstance(dense.pheromone, PackedSymmetricMatrix)
+    tour = dense.solveTSP()
+    assert tour[0] == 0 and sorted(tour) == list(range(60))
+
+    sparse = AntColonyOptimizationTSPSolver(distance_matrix, num_ants=5, num_iterations=10,
+                                            num_candidates=8, candidate_threshold=50)
+    assert sparse.uses_candidate_lists
+    assert isinstance(sparse.pheromone, CandidateEdgeMatrix)
+    assert sparse.pheromone.values.shape == (60, 8)
+    tour = sparse.solveTSP()
+    assert tour[0] == 0 and sorted(tour) == list(range(60))
+
+    # 更新距离矩阵后重新选择存储方式
+    sparse.update_distance_matrix(_random_matrix(40, 4))
+    assert not sparse.uses_candidate_lists
+    assert sorted(sparse.solveTSP()) == list(range(40))
+
+
+if __name__ == "__main__":
+    test_packed_matrix_is_symmetric()
+    test_visibility_stores()
+    test_candidate_pheromone_deposit_and_default()
+    test_aco_storage_modes()
+    print("✓ 信息素存储测试通过")
@@ -0,0 +1,71 @@
+import random
+
+import numpy as np
+
+from src.smart_decision_miniproject.TSP_datamodel.distance_matrix_factory import RandomDistanceMatrixFactory
+from src.smart_decision_miniproject.solver.TSP import AntColonyOptimizationTSPSolver
+from src.smart_decision_miniproject.solver.tsp_selection import AliasTables, cumulative_choice
+
+
+def _frequencies(draw, size, samples=20000):
+    counts = np.zeros(size)
+    for _ in range(samples):
+        counts[draw()] += 1
+    return counts / samples
+
+
+def test_cumulative_choice():
+    """二分查找轮盘赌：按权重抽样，零权重不会被选中，全零返回-1"""
+    rng = random.Random(0)
+    weights = np.array([0.0, 1.0, 3.0, 0.0, 4.0])
+    frequencies = _frequencies(lambda: cumulative_choice(weights, rng.random()), 5)
+    assert frequencies[0] == frequencies[3] == 0.0
+    assert np.allclose(frequencies, weights / weights.sum(), atol=0.02)
+    assert cumulative_choice(np.zeros(3), 0.5) == -1
+    assert cumulative_choice(weights, 0.0) == 1
+    assert cumulative_choice(weights, 1.0 - 1e-16) == 4
+
+
+def test_alias_tables():
+    """别名表O(1)抽样的分布与权重一致；全零权重时均匀抽样"""
+    rng = random.Random(1)
+    tables = AliasTables(2, 6)
+    weights = np.array([5.0, 0.0, 1.0, 2.0, 0.5, 1.5])
+    tables.build(0, weights, version=3)
+    tables.build(1, np.zeros(6), version=3)
+    assert tables.is_current(0, 3) and not tables.is_current(0, 4)
+
+    frequencies = _frequencies(lambda: tables.draw(0, rng.random()), 6)
+    assert frequencies[1] == 0.0
+    assert np.allclose(frequencies, weights / weights.sum(), atol=0.02)
+    assert np.allclose(_frequencies(lambda: tables.draw(1, rng.random()), 6), 1 / 6, atol=0.02)
+
+
+def test_aco_alias_selection():
+    """候选边模式下别名表只在信息素更新后重建，且不会选中已访问的城市"""
+    random.seed(2)
+    distance_matrix = RandomDistanceMatrixFactory(dimension=40, min_distance=10, max_distance=100).create_distance_matrix()
+    solver = AntColonyOptimizationTSPSolver(distance_matrix, num_ants=4, num_iterations=5,
+                                            num_candidates=8, candidate_threshold=30)
+    tour = solver.solveTSP()
+    assert sorted(tour) == list(range(40))
+
+    unvisited = np.ones(40, dtype=bool)
+    unvisited[solver.candidates[0][:6]] = False
+    for _ in range(200):
+        next_city = solver._select_next_city(0, unvisited)
+        assert unvisited[next_city]
+    version = solver._weights_version
+    assert solver._alias.is_current(0, version)
+
+    solver._update_pheromones([tour], [solver.calculate_tour_distance(tour)])
+    assert not solver._alias.is_current(0, solver._weights_version)
+    solver._select_next_city(0, unvisited)
+    assert solver._alias.is_current(0, solver._weights_version)
+
+
+if __name__ == "__main__":
+    test_cumulative_choice()
+    test_alias_tables()
+    test_aco_alias_selection()
+    print("✓ 轮盘赌选择测试通过")
@@ -0,0 +1,61 @@
+import math
+
+from src.smart_decision_miniproject.solver.VRP import (
+    GeneticAlgorithmVRPSolver,
+    SolomonDataParser,
+    solve_solomon_vrp,
+)
+from src.smart_decision_miniproject.solver.vrp_alns import ALNSVRPSolver
+from src.smart_decision_miniproject.solver.vrp_time_windows import TimeWindows
+from vrp_test_helpers import random_instance
+
+
+def test_repair_operators_reinsert_removed_customers():
+    """各破坏算子移除的客户都能被贪心/后悔插入重新插回"""
+    distance_matrix, demands = random_instance(50, 2)
+    solver = ALNSVRPSolver(distance_matrix, demands, 100.0, 25, seed=0, polish=False)
+    routes = solver.initial_solution()
+    solver.fleet_limit = len(routes) + 2
+    checker = GeneticAlgorithmVRPSolver(distance_matrix, demands, 100.0, 25)
+
+    for _, destroy in solver.destroy_operators:
+        for _, k in solver.repair_operators:
+            partial, removed = destroy(routes, 10)
+            assert len(removed) >= 10
+            repaired, unassigned = solver.regret_insertion(partial, removed, k)
+            assert unassigned == []
+            assert checker.is_solution_feasible(repaired)
+
+
+def test_alns_on_solomon_instance():
+    """ALNS在C101上得到满足时间窗的解，且不差于初始解"""
+    with open('test_solomon_c101.txt', encoding='utf-8') as f:
+        content = f.read()
+    customers, params = SolomonDataParser.parse_solomon_file(content)
+    distance_matrix = [[math.dist((a.x, a.y), (b.x, b.y)) for b in customers] for a in customers]
+    time_windows = TimeWindows(
+        [c.ready_time for c in customers],
+        [c.due_time for c in customers],
+        [c.service_time for c in customers],
+        distance_matrix,
+    )
+    solver = ALNSVRPSolver(distance_matrix, [c.demand for c in customers], params['vehicle_capacity'],
+                           params['num_vehicles'], time_windows=time_windows, time_limit=None,
+                           max_iterations=300, seed=1)
+    initial_cost = solver.calculate_solution_fitness(solver.initial_solution())
+    routes = solver.solve_vrp()
+
+    assert sorted(sum(routes, [])) == list(range(1, len(customers)))
+    assert all(time_windows.is_route_feasible(route) for route in routes)
+    assert solver.calculate_solution_fitness(routes) <= initial_cost + 1e-9
+    assert solver.last_statistics['iterations'] == 300
+
+    result = solve_solomon_vrp(content, use_time_windows=True, solver_type='alns', time_limit=1.0)
+    print(f"ALNS距离: {result.total_distance:.2f}, 车辆数: {result.num_vehicles_used}")
+    assert all(time_windows.is_route_feasible(route) for route in result.routes)
+
+
+if __name__ == "__main__":
+    test_repair_operators_reinsert_removed_customers()
+    test_alns_on_solomon_instance()
+    print("✓ ALNS测试通过")
@@ -0,0 +1,94 @@
+import csv
+import io
+import json
+import os
+import tempfile
+import zipfile
+
+from src.smart_decision_miniproject.solver.vrp_batch import ResultWriter, load_bks, main, read_instances, solve_batch
+
+
+def _c101():
+    with open('test_solomon_c101.txt', encoding='utf-8') as f:
+        return f.read()
+
+
+def _small_instance(content, num_customers):
+    """截取前若干个客户，构造一个更小的实例"""
+    lines = content.splitlines()
+    header_end = next(i for i, line in enumerate(lines) if 'XCOORD' in line.upper()) + 1
+    return '\n'.join(lines[:header_end + 1 + num_customers]) + '\n'
+
+
+def test_read_instances_from_directory_and_zip():
+    """从目录和zip压缩包读取实例"""
+    content = _c101()
+    with tempfile.TemporaryDirectory() as folder:
+        with open(os.path.join(folder, 'C101.txt'), 'w', encoding='utf-8') as f:
+            f.write(content)
+        with open(os.path.join(folder, 'notes.md'), 'w', encoding='utf-8') as f:
+            f.write('ignored')
+        assert read_instances(folder) == [('C101', content)]
+
+        archive_path = os.path.join(folder, 'suite.zip')
+        with zipfile.ZipFile(archive_path, 'w') as archive:
+            archive.writestr('solomon/C101.txt', content)
+            archive.writestr('solomon/C102.txt', _small_instance(content, 5))
+        assert [name for name, _ in read_instances(archive_path)] == ['C101', 'C102']
+
+
+def test_solve_batch_streams_results_with_gap():
+    """批量求解：每个实例一条记录，给出与BKS的差距"""
+    content = _c101()
+    instances = [('small', _small_instance(content, 8)), ('C101', content)]
+    records = list(solve_batch(instances, solver_type='alns', time_limit=0.3, workers=2, bks={'c101': 191.3}))
+
+    assert sorted(record['instance'] for record in records) == ['C101', 'small']
+    full = next(record for record in records if record['instance'] == 'C101')
+    assert full['customers'] == 25 and full['bks'] == 191.3
+    assert full['gap'] == round(100 * (full['distance'] - 191.3) / 191.3, 2)
+
+    stream = io.StringIO()
+    writer = ResultWriter(stream, 'json')
+    for record in records:
+        writer.write(record)
+    assert [json.loads(line)['instance'] for line in stream.getvalue().splitlines()] == \
+        [record['instance'] for record in records]
+
+
+def test_command_line():
+    """命令行：读取目录与BKS表，输出CSV"""
+    with tempfile.TemporaryDirectory() as folder:
+        suite = os.path.join(folder, 'suite')
+        os.mkdir(suite)
+        with open(os.path.join(suite, 'C101.txt'), 'w', encoding='utf-8') as f:
+            f.write(_c101())
+        bks_path = os.path.join(folder, 'bks.csv')
+        with open(bks_path, 'w', encoding='utf-8') as f:
+            f.write('instance,vehicles,distance\nC101,3,191.3\n')
+        assert load_bks(bks_path) == {'c101': 191.3}
+
+        output = os.path.join(folder, 'results.csv')
+        assert main([suite, '-o', output, '--bks', bks_path, '--time-limit', '0.2', '--workers', '1']) == 0
+        with open(output, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 1 and rows[0]['instance'] == 'C101' and rows[0]['gap'] != ''
+
+        # HGS 只支持容量约束：未加 --no-time-windows 时也按容量约束求解
+        assert main([suite, '-o', output, '--solver', 'hgs', '--time-limit', '0.2', '--workers', '1']) == 0
+        with open(output, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        assert len(rows) == 1 and rows[0]['error'] == '' and rows[0]['distance'] != ''
+
+    try:
+        list(solve_batch([('C101', _c101())], solver_type='hgs', use_time_windows=True))
+        assert False, "HGS 显式要求时间窗时应抛出 ValueError"
+    except ValueError:
+        pass
+
+
+if __name__ == "__main__":
+    test_read_instances_from_directory_and_zip()
+    test_solve_batch_streams_results_with_gap()
+    test_command_line()
+    print("✓ 批量求解测试通过")
@@ -0,0 +1,56 @@
+import random
+
+from src.smart_decision_miniproject.solver.VRP import GeneticAlgorithmVRPSolver
+from src.smart_decision_miniproject.solver.vrp_crossover import PermutationCrossover
+from vrp_test_helpers import random_instance
+
+
+def test_crossover_produces_permutations():
+    """OX / PMX / ERX 子代都是合法排列，且复用缓冲区"""
+    rng = random.Random(3)
+    operators = PermutationCrossover(51)
+    for _ in range(50):
+        parent1 = list(range(1, 51))
+        parent2 = list(range(1, 51))
+        rng.shuffle(parent1)
+        rng.shuffle(parent2)
+        point1 = rng.randint(0, 25)
+        point2 = rng.randint(point1 + 1, 50)
+
+        ox_child = operators.order_crossover(parent1, parent2, point1, point2)
+        assert ox_child[point1:point2] == parent1[point1:point2]
+        assert sorted(ox_child) == sorted(parent1)
+
+        pmx_child = operators.partially_mapped_crossover(parent1, parent2, point1, point2)
+        assert pmx_child[point1:point2] == parent1[point1:point2]
+        assert sorted(pmx_child) == sorted(parent1)
+
+        buffer = [0] * 50
+        erx_child = operators.edge_recombination(parent1, parent2, out=buffer, rng=rng)
+        assert erx_child is buffer
+        assert sorted(erx_child) == sorted(parent1)
+
+
+def test_ga_crossover_writes_child_buffers():
+    """遗传算法的交叉写入求解器的两个子代缓冲区；保留下来的个体是独立副本"""
+    distance_matrix, demands = random_instance(20, 8)
+    for operator in ('ox', 'pmx', 'erx'):
+        solver = GeneticAlgorithmVRPSolver(distance_matrix, demands, 60.0, 10, population_size=12,
+                                           crossover_rate=1.0, mutation_rate=0.5, crossover_operator=operator,
+                                           seed=1)
+        solver.initialize_population()
+        buffers = solver._child_buffers
+        offspring = solver.breed_giant_tours(solver.population[0], solver.population[1])
+        assert offspring[0] is buffers[0] and offspring[1] is buffers[1]
+        assert all(sorted(child) == list(range(1, 21)) for child in offspring)
+
+        for _ in range(3):
+            solver.evolve_generation()
+        assert not any(tour is buffer for tour in solver.population for buffer in buffers)
+        assert all(sorted(tour) == list(range(1, 21)) for tour in solver.population)
+
+
+if __name__ == "__main__":
+    test_crossover_produces_permutations()
+    test_ga_crossover_writes_child_buffers()
+    print("✓ 交叉算子测试通过")
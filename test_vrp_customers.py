@@ -0,0 +1,47 @@
+import math
+
+from src.smart_decision_miniproject.solver.VRP import Customer, CustomerTable, SolomonDataParser, VRPResult
+
+
+def _load_c101():
+    with open('test_solomon_c101.txt', encoding='utf-8') as f:
+        return f.read()
+
+
+def test_table_matches_customer_list():
+    """列式客户表与Customer列表内容一致，按下标访问得到Customer视图"""
+    customers, _ = SolomonDataParser.parse_solomon_file(_load_c101())
+    table, _ = SolomonDataParser.load_customer_table(_load_c101())
+
+    assert len(table) == len(customers)
+    assert table[5] == customers[5]
+    assert list(table) == customers
+    assert table == CustomerTable.from_customers(customers)
+    assert table.x[3] == customers[3].x and table.due_time[7] == customers[7].due_time
+
+    distance_matrix = table.distance_matrix()
+    for a in (0, 4, 11):
+        for b in (2, 9, 25):
+            assert math.isclose(distance_matrix[a][b], math.dist((customers[a].x, customers[a].y),
+                                                                  (customers[b].x, customers[b].y)))
+
+
+def test_result_statistics_from_columns():
+    """VRPResult接受Customer列表，统计信息由列数据向量化计算"""
+    customers = [Customer(0, 0.0, 0.0, 0, 0, 100, 0), Customer(1, 3.0, 4.0, 5, 0, 100, 0),
+                 Customer(2, 6.0, 8.0, 7, 0, 100, 0)]
+    result = VRPResult([[1, 2]], 20.0, customers)
+    assert isinstance(result.customers, CustomerTable)
+
+    details = result.get_statistics()['routes_details'][0]
+    assert details['route_distance'] == 20.0
+    assert details['total_demand'] == 12
+
+    result.customers.append(Customer(3, 1.0, 1.0, 2, 0, 100, 0))
+    assert len(result.customers) == 4 and result.customers[3].demand == 2
+
+
+if __name__ == "__main__":
+    test_table_matches_customer_list()
+    test_result_statistics_from_columns()
+    print("✓ 客户表测试通过")
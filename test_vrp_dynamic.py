@@ -0,0 +1,81 @@
+import math
+
+from src.smart_decision_miniproject.solver.VRP import Customer, VRPResult, solve_solomon_vrp
+from src.smart_decision_miniproject.solver.vrp_time_windows import TimeWindows
+
+
+def _load_content():
+    with open('test_solomon_c101.txt', encoding='utf-8') as f:
+        return f.read()
+
+
+def _route_distance(result):
+    total = 0.0
+    for route in result.routes:
+        path = [0] + route + [0]
+        total += sum(result.distance_matrix[a][b] for a, b in zip(path, path[1:]))
+    return total
+
+
+def test_insert_and_remove_customers():
+    """在已有方案中插入新订单、删除取消的订单，距离与可行性保持一致"""
+    result = solve_solomon_vrp(_load_content(), use_time_windows=True, solver_type='alns', time_limit=0.5)
+    time_windows = result.time_windows
+    depot = result.customers[0]
+
+    new_orders = [
+        Customer(id=101, x=depot.x + 5, y=depot.y + 5, demand=10, ready_time=0, due_time=1000, service_time=10),
+        Customer(id=102, x=depot.x - 8, y=depot.y + 3, demand=20, ready_time=100, due_time=900, service_time=10),
+    ]
+    indices = result.add_customers(new_orders)
+    routed = sorted(sum(result.routes, []))
+    assert indices == [len(result.customers) - 2, len(result.customers) - 1]
+    assert result.unassigned_customers == []
+    assert routed == list(range(1, len(result.customers)))
+    assert all(time_windows.is_route_feasible(route) for route in result.routes)
+    assert math.isclose(result.total_distance, _route_distance(result))
+
+    result.remove_customers([1, indices[0]], polish=True)
+    routed = sum(result.routes, [])
+    assert 1 not in routed and indices[0] not in routed
+    assert len(routed) == len(result.customers) - 3
+    assert all(time_windows.is_route_feasible(route) for route in result.routes)
+    assert all(sum(result.customers[c].demand for c in route) <= result.vehicle_capacity for route in result.routes)
+    assert math.isclose(result.total_distance, _route_distance(result))
+
+
+def test_infeasible_order_stays_unassigned():
+    """无法满足时间窗的订单保留在未分配列表中"""
+    result = solve_solomon_vrp(_load_content(), use_time_windows=True, solver_type='alns', time_limit=0.2)
+    depot = result.customers[0]
+    late = Customer(id=200, x=depot.x + 30, y=depot.y, demand=5, ready_time=0,
+                    due_time=0, service_time=10)
+    index = result.add_customers([late])[0]
+    assert result.unassigned_customers == [index]
+    result.remove_customers([index])
+    assert result.unassigned_customers == []
+
+
+def test_time_windows_without_distance_matrix():
+    """只给出时间窗（无距离矩阵）时，新客户的行驶时间也随距离矩阵一起扩展"""
+    customers = [Customer(id=0, x=0, y=0, demand=0, ready_time=0, due_time=1000, service_time=0),
+                 Customer(id=1, x=10, y=0, demand=10, ready_time=0, due_time=500, service_time=5),
+                 Customer(id=2, x=0, y=10, demand=10, ready_time=0, due_time=500, service_time=5)]
+    travel_times = [[math.hypot(a.x - b.x, a.y - b.y) for b in customers] for a in customers]
+    time_windows = TimeWindows([0.0] * 3, [1000.0, 500.0, 500.0], [0.0, 5.0, 5.0], travel_times)
+    result = VRPResult([[1], [2]], 40.0, customers, 0.0, vehicle_capacity=50, time_windows=time_windows)
+
+    index = result.add_customers([Customer(id=3, x=10, y=10, demand=10, ready_time=0, due_time=500,
+                                           service_time=5)])[0]
+    assert len(time_windows.travel_times) == 4 and all(len(row) == 4 for row in time_windows.travel_times)
+    assert time_windows.travel_times[index][0] == result.distance_matrix[index][0]
+    assert result.unassigned_customers == []
+    assert all(time_windows.is_route_feasible(route) for route in result.routes)
+    assert math.isclose(result.total_distance, _route_distance(result))
+
+
+if __name__ == "__main__":
+    test_insert_and_remove_customers()
+    test_infeasible_order_stays_unassigned()
+    test_time_windows_without_distance_matrix()
+    print("✓ 动态插入/删除测试通过")
@@ -0,0 +1,44 @@
+from src.smart_decision_miniproject.solver.VRP import GeneticAlgorithmVRPSolver, solve_solomon_vrp
+from vrp_test_helpers import random_instance
+
+
+def test_stop_reasons():
+    """遗传算法按收敛、目标值、时间上限提前停止，并记录停止原因"""
+    distance_matrix, demands = random_instance(20, 9)
+    for encoding in ('giant_tour', 'routes'):
+        solver = GeneticAlgorithmVRPSolver(distance_matrix, demands, 80.0, 10, population_size=20,
+                                           num_generations=5000, encoding=encoding, seed=1, patience=15)
+        solver.solve_vrp()
+        assert solver.stop_reason == 'converged'
+
+        solver = GeneticAlgorithmVRPSolver(distance_matrix, demands, 80.0, 10, population_size=20,
+                                           num_generations=5000, encoding=encoding, seed=1,
+                                           target_fitness=float('inf'))
+        solver.solve_vrp()
+        assert solver.stop_reason == 'target_fitness'
+
+        solver = GeneticAlgorithmVRPSolver(distance_matrix, demands, 80.0, 10, population_size=20,
+                                           num_generations=10 ** 6, encoding=encoding, seed=1,
+                                           time_limit=0.2, deduplicate=False)
+        solver.solve_vrp()
+        assert solver.stop_reason == 'time_limit'
+
+        solver = GeneticAlgorithmVRPSolver(distance_matrix, demands, 80.0, 10, population_size=20,
+                                           num_generations=3, encoding=encoding, seed=1)
+        solver.solve_vrp()
+        assert solver.stop_reason == 'max_generations'
+
+
+def test_stop_reason_in_result():
+    """VRPResult中包含停止原因"""
+    with open('test_solomon_c101.txt', encoding='utf-8') as f:
+        content = f.read()
+    result = solve_solomon_vrp(content, time_limit=0.5)
+    assert result.stop_reason in ('max_generations', 'converged', 'time_limit')
+    assert result.get_statistics()['stop_reason'] == result.stop_reason
+
+
+if __name__ == "__main__":
+    test_stop_reasons()
+    test_stop_reason_in_result()
+    print("✓ 提前停止测试通过")
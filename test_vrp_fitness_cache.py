@@ -0,0 +1,77 @@
+from src.smart_decision_miniproject.solver.VRP import GeneticAlgorithmVRPSolver
+from src.smart_decision_miniproject.solver.vrp_fitness_cache import (
+    KEY_DIGEST_SIZE,
+    FitnessCache,
+    canonical_solution_key,
+    tour_key,
+)
+from vrp_test_helpers import random_instance
+
+
+def test_canonical_key_and_lru_cache():
+    """规范化键与路径顺序无关；缓存按最近最少使用淘汰"""
+    assert canonical_solution_key([[3, 4], [1, 2], []]) == canonical_solution_key([[1, 2], [3, 4]])
+    assert canonical_solution_key([[1, 2]]) != canonical_solution_key([[2, 1]])
+    assert canonical_solution_key([[1, 2], [3]]) != canonical_solution_key([[1], [2, 3]])
+
+    # 缓存键是定长摘要，不随客户数增长
+    long_tour = list(range(1, 1001))
+    assert len(tour_key(long_tour)) == len(canonical_solution_key([long_tour])) == KEY_DIGEST_SIZE
+    assert tour_key(long_tour) == tour_key(tuple(long_tour)) != tour_key(long_tour[::-1])
+
+    cache = FitnessCache(max_size=2)
+    cache.put('a', 1.0)
+    cache.put('b', 2.0)
+    assert cache.get('a') == 1.0
+    cache.put('c', 3.0)  # 淘汰最久未使用的 'b'
+    assert cache.get('b') is None
+    assert cache.statistics() == {'hits': 1, 'misses': 1, 'size': 2, 'hit_rate': 0.5}
+
+
+def test_ga_population_has_no_clones():
+    """去重后种群中没有重复个体，缓存命中节省了评估"""
+    distance_matrix, demands = random_instance(25, 6)
+    for encoding in ('giant_tour', 'routes'):
+        solver = GeneticAlgorithmVRPSolver(distance_matrix, demands, 80.0, 12, population_size=30,
+                                           num_generations=30, encoding=encoding, seed=4)
+        routes = solver.solve_vrp()
+        assert solver.is_solution_feasible(routes)
+        statistics = solver.cache_statistics()
+        assert statistics['hits'] > 0
+        assert statistics['duplicates_replaced'] > 0
+
+    solver = GeneticAlgorithmVRPSolver(distance_matrix, demands, 80.0, 12, population_size=30, seed=4)
+    solver.initialize_population()
+    for _ in range(20):
+        solver.evolve_generation()
+    assert len({tuple(tour) for tour in solver.population}) == len(solver.population)
+    assert len(set(solver.population_keys)) == len(solver.population)
+
+
+def test_reordered_giant_tours_are_clones():
+    """路线顺序不同但解码结果相同的巨型路线被视为重复个体"""
+    distance_matrix, demands = random_instance(25, 7)
+    solver = GeneticAlgorithmVRPSolver(distance_matrix, demands, 80.0, 12, population_size=10, seed=5)
+    solver.initialize_population()
+    routes = solver.decode_giant_tour(solver.best_tour)[1]
+    reordered = sum(reversed(routes), [])
+    assert reordered != solver.best_tour
+    assert solver.giant_tour_entry(reordered)[1] == solver.giant_tour_entry(solver.best_tour)[1]
+
+    # 让所有后代都是最优个体的重排，去重后它们都被替换
+    solver.mutation_rate = 0.0
+    solver.crossover_rate = 0.0
+    solver.population = [solver.best_tour] + [reordered] * (len(solver.population) - 1)
+    solver.population_keys = [solver.giant_tour_entry(tour)[1] for tour in solver.population]
+    solver.fitness_scores = [solver.giant_tour_fitness(tour) for tour in solver.population]
+    replaced = solver.duplicates_replaced
+    solver.evolve_generation()
+    assert solver.duplicates_replaced - replaced >= len(solver.population) - solver.elite_size
+    assert len(set(solver.population_keys)) == len(solver.population)
+
+
+if __name__ == "__main__":
+    test_canonical_key_and_lru_cache()
+    test_ga_population_has_no_clones()
+    test_reordered_giant_tours_are_clones()
+    print("✓ 去重与适应度缓存测试通过")
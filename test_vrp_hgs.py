@@ -0,0 +1,64 @@
+import random
+import time
+
+from src.smart_decision_miniproject.solver.VRP import GeneticAlgorithmVRPSolver, solve_solomon_vrp
+from src.smart_decision_miniproject.solver.vrp_hgs import HGSVRPSolver
+from src.smart_decision_miniproject.solver.vrp_local_search import GranularLocalSearch
+from vrp_test_helpers import random_instance
+
+
+def test_penalized_local_search_reduces_excess():
+    """软容量局部搜索从超载解出发，总代价（距离+惩罚）不增加"""
+    distance_matrix, demands = random_instance(40, 1)
+    routes = [list(range(1, 21)), list(range(21, 41))]  # 两条严重超载的路线
+    search = GranularLocalSearch(distance_matrix, demands, 100.0)
+
+    def penalized(solution):
+        excess = sum(max(0.0, sum(demands[c] for c in route) - 100.0) for route in solution)
+        return search.solution_cost(solution) + 50.0 * excess
+
+    improved = search.improve(routes, random.Random(0), capacity_penalty=50.0)
+    assert sorted(sum(improved, [])) == list(range(1, 41))
+    assert penalized(improved) < penalized(routes)
+
+
+def test_hgs_beats_ga_at_equal_time():
+    """相同时间内HGS得到可行解，且不差于遗传算法"""
+    distance_matrix, demands = random_instance(60, 5)
+    hgs = HGSVRPSolver(distance_matrix, demands, 100.0, 30, time_limit=None, max_iterations=150, seed=0)
+    start = time.time()
+    routes = hgs.solve_vrp()
+    elapsed = time.time() - start
+
+    assert sorted(sum(routes, [])) == list(range(1, 61))
+    assert all(sum(demands[c] for c in route) <= 100.0 for route in routes)
+    assert hgs.stop_reason == 'max_iterations'
+    assert hgs.last_statistics['iterations'] == 150
+
+    ga = GeneticAlgorithmVRPSolver(distance_matrix, demands, 100.0, 30, num_generations=100000,
+                                   time_limit=elapsed, seed=0)
+    ga_routes = ga.solve_vrp()
+    print(f"HGS: {hgs.calculate_solution_fitness(routes):.2f}, GA: {ga.calculate_solution_fitness(ga_routes):.2f}")
+    assert hgs.calculate_solution_fitness(routes) <= ga.calculate_solution_fitness(ga_routes) + 1e-9
+
+
+def test_hgs_through_solomon_entry_point():
+    """通过solve_solomon_vrp调用HGS（仅容量约束）"""
+    with open('test_solomon_c101.txt', encoding='utf-8') as f:
+        content = f.read()
+    result = solve_solomon_vrp(content, use_time_windows=False, solver_type='hgs', time_limit=1.0)
+    assert sorted(sum(result.routes, [])) == list(range(1, 26))
+    assert result.stop_reason == 'time_limit'
+
+    try:
+        solve_solomon_vrp(content, use_time_windows=True, solver_type='hgs')
+        assert False, "HGS不支持时间窗，应抛出ValueError"
+    except ValueError:
+        pass
+
+
+if __name__ == "__main__":
+    test_penalized_local_search_reduces_excess()
+    test_hgs_beats_ga_at_equal_time()
+    test_hgs_through_solomon_entry_point()
+    print("✓ HGS测试通过")
@@ -0,0 +1,64 @@
+import time
+
+import numpy as np
+
+from src.smart_decision_miniproject.solver.VRP import GeneticAlgorithmVRPSolver
+from src.smart_decision_miniproject.solver.vrp_island import IslandModelVRPSolver
+from src.smart_decision_miniproject.solver.vrp_parallel import build_solver, solver_config
+from src.smart_decision_miniproject.solver.vrp_time_windows import TimeWindows
+from vrp_test_helpers import random_instance
+
+
+def test_islands_stop_on_patience():
+    """各岛按收敛条件提前停止，返回可行解、收敛轨迹与停止原因"""
+    distance_matrix, demands = random_instance(25, 1)
+    solver = IslandModelVRPSolver(distance_matrix, demands, 80.0, 12, num_islands=2, migration_interval=5,
+                                  time_limit=60.0, seed=3, population_size=16, patience=5)
+    start = time.time()
+    result = solver.run()
+    assert time.time() - start < 30
+    assert solver.island_template.is_solution_feasible(result.routes)
+    assert sorted(sum(result.routes, [])) == list(range(1, 26))
+    assert len(result.convergence_traces) == 2 and all(result.generations)
+    assert result.stop_reasons == ['converged', 'converged']
+    assert solver.stop_reason == 'converged'
+
+
+def test_failing_island_raises():
+    """某个岛进程出错时立即报错，而不是一直等待结果"""
+    distance_matrix, demands = random_instance(10, 2)
+    due_times = [1000.0] + [0.0] + [1000.0] * 9  # 1号客户无法按时服务
+    time_windows = TimeWindows([0.0] * 11, due_times, [0.0] * 11, distance_matrix)
+    solver = IslandModelVRPSolver(distance_matrix, demands, 80.0, 10, num_islands=2, time_limit=1.0,
+                                  time_windows=time_windows, seed=0, population_size=8)
+    start = time.time()
+    try:
+        solver.run()
+        assert False, "岛进程出错时应抛出 RuntimeError"
+    except RuntimeError as error:
+        assert "Island" in str(error) and "ValueError" in str(error)
+    assert time.time() - start < 15
+
+
+def test_settings_reach_islands_and_workers():
+    """早停参数原样传给岛与并行工作进程；岛模型不支持的参数直接报错"""
+    distance_matrix, demands = random_instance(10, 3)
+    solver = GeneticAlgorithmVRPSolver(distance_matrix, demands, 80.0, 10, encoding='routes', patience=7,
+                                       convergence_threshold=0.5, time_limit=3.0, target_fitness=100.0)
+    rebuilt = build_solver(np.asarray(distance_matrix), solver_config(solver))
+    for name in ('encoding', 'patience', 'convergence_threshold', 'time_limit', 'target_fitness'):
+        assert getattr(rebuilt, name) == getattr(solver, name)
+
+    for params in ({'encoding': 'routes'}, {'num_workers': 2}):
+        try:
+            IslandModelVRPSolver(distance_matrix, demands, 80.0, 10, **params)
+            assert False, "不支持的参数应抛出 ValueError"
+        except ValueError:
+            pass
+
+
+if __name__ == "__main__":
+    test_islands_stop_on_patience()
+    test_failing_island_raises()
+    test_settings_reach_islands_and_workers()
+    print("✓ 岛模型测试通过")
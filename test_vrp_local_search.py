@@ -0,0 +1,69 @@
+import math
+import random
+
+from src.smart_decision_miniproject.solver.VRP import GeneticAlgorithmVRPSolver, SolomonDataParser
+from src.smart_decision_miniproject.solver.vrp_local_search import GranularLocalSearch
+from src.smart_decision_miniproject.solver.vrp_time_windows import TimeWindows
+from vrp_test_helpers import random_instance
+
+
+def test_local_search_improves_random_solutions():
+    """局部搜索保持可行性并降低随机解的总距离"""
+    for seed in range(5):
+        distance_matrix, demands = random_instance(60, seed)
+        solver = GeneticAlgorithmVRPSolver(distance_matrix, demands, 100.0, 30, seed=seed)
+        local_search = GranularLocalSearch(distance_matrix, demands, 100.0, num_neighbours=10)
+
+        routes = solver.generate_random_solution()
+        improved = local_search.improve(routes, random.Random(seed))
+
+        assert sorted(sum(improved, [])) == list(range(1, 61))
+        assert all(sum(demands[c] for c in route) <= 100.0 for route in improved)
+        assert local_search.solution_cost(improved) < local_search.solution_cost(routes)
+        # 局部最优解再次搜索不再改进
+        again = local_search.improve(improved, random.Random(seed))
+        assert math.isclose(local_search.solution_cost(again), local_search.solution_cost(improved))
+
+
+def test_local_search_respects_time_windows():
+    """带时间窗时局部搜索只接受满足时间窗的移动"""
+    with open('test_solomon_c101.txt', encoding='utf-8') as f:
+        customers, params = SolomonDataParser.parse_solomon_file(f.read())
+    distance_matrix = [[math.dist((a.x, a.y), (b.x, b.y)) for b in customers] for a in customers]
+    demands = [c.demand for c in customers]
+    time_windows = TimeWindows(
+        [c.ready_time for c in customers],
+        [c.due_time for c in customers],
+        [c.service_time for c in customers],
+        distance_matrix,
+    )
+    capacity = params['vehicle_capacity']
+    solver = GeneticAlgorithmVRPSolver(distance_matrix, demands, capacity, params['num_vehicles'],
+                                       time_windows=time_windows, seed=2)
+    local_search = GranularLocalSearch(distance_matrix, demands, capacity, time_windows=time_windows)
+
+    for _ in range(5):
+        routes = solver.generate_random_solution()
+        improved = local_search.improve(routes, random.Random(0))
+        assert sorted(sum(improved, [])) == list(range(1, len(customers)))
+        assert all(time_windows.is_route_feasible(route) for route in improved)
+        assert all(sum(demands[c] for c in route) <= capacity for route in improved)
+        assert local_search.solution_cost(improved) <= local_search.solution_cost(routes) + 1e-9
+
+
+def test_genetic_algorithm_with_education():
+    """遗传算法开启局部搜索教育后结果可行"""
+    distance_matrix, demands = random_instance(40, 11)
+    for encoding in ('giant_tour', 'routes'):
+        solver = GeneticAlgorithmVRPSolver(distance_matrix, demands, 100.0, 20, population_size=20,
+                                           num_generations=10, encoding=encoding, seed=3,
+                                           local_search_rate=0.5)
+        routes = solver.solve_vrp()
+        assert solver.is_solution_feasible(routes)
+
+
+if __name__ == "__main__":
+    test_local_search_improves_random_solutions()
+    test_local_search_respects_time_windows()
+    test_genetic_algorithm_with_education()
+    print("✓ 局部搜索测试通过")
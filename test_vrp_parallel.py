@@ -0,0 +1,53 @@
+import math
+import random
+
+import numpy as np
+
+from src.smart_decision_miniproject.solver.VRP import GeneticAlgorithmVRPSolver
+from src.smart_decision_miniproject.solver.vrp_parallel import build_solver, solver_config
+from src.smart_decision_miniproject.solver.vrp_time_windows import TimeWindows
+from vrp_test_helpers import random_instance
+
+
+def test_parallel_ga_is_reproducible():
+    """并行繁殖结果只取决于随机种子，与进程数无关"""
+    rng = random.Random(11)
+    points = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(31)]
+    distance_matrix = [[math.dist(p, q) for q in points] for p in points]
+    demands = [0.0] + [float(rng.randint(1, 20)) for _ in range(30)]
+
+    results = []
+    for num_workers in (1, 2):
+        solver = GeneticAlgorithmVRPSolver(
+            distance_matrix, demands, 60.0, 15,
+            population_size=20, num_generations=5, mutation_rate=0.2,
+            seed=7, num_workers=num_workers
+        )
+        routes = solver.solve_vrp()
+        assert solver.is_solution_feasible(routes)
+        results.append((routes, solver.calculate_solution_fitness(routes)))
+
+    assert results[0] == results[1]
+
+
+def test_worker_solver_uses_list_matrix():
+    """工作进程的求解器：逐元素访问使用一次性构建的列表矩阵，向量化计算直接读取共享数组"""
+    distance_matrix, demands = random_instance(12, 6)
+    time_windows = TimeWindows([0.0] * 13, [1000.0] * 13, [0.0] * 13, distance_matrix)
+    solver = GeneticAlgorithmVRPSolver(distance_matrix, demands, 80.0, 10, time_windows=time_windows,
+                                       local_search_rate=0.5, seed=2)
+    shared = np.asarray(distance_matrix, dtype=np.float64)
+    rebuilt = build_solver(shared, solver_config(solver))
+
+    assert isinstance(rebuilt.distance_matrix, list) and rebuilt.distance_matrix == distance_matrix
+    assert rebuilt.time_windows.travel_times is rebuilt.distance_matrix
+    assert rebuilt.local_search.distance_matrix is rebuilt.distance_matrix
+    assert rebuilt._numpy_distances() is shared
+    tour = list(range(1, 13))
+    assert rebuilt.decode_giant_tour(tour) == solver.decode_giant_tour(tour)
+
+
+if __name__ == "__main__":
+    test_parallel_ga_is_reproducible()
+    test_worker_solver_uses_list_matrix()
+    print("✓ 并行GA测试通过")
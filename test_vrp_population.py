@@ -0,0 +1,55 @@
+import math
+
+import numpy as np
+
+from src.smart_decision_miniproject.solver.VRP import GeneticAlgorithmVRPSolver
+from src.smart_decision_miniproject.solver.vrp_population import RoutePopulation
+from vrp_test_helpers import random_instance
+
+
+def test_vectorized_evaluation_matches_lists():
+    """数组编码种群的距离与载重计算与逐条路径计算一致"""
+    distance_matrix, demands = random_instance(30, 4)
+    solver = GeneticAlgorithmVRPSolver(distance_matrix, demands, 60.0, 15, encoding='routes', seed=0)
+    solutions = [solver.generate_random_solution() for _ in range(25)]
+
+    population = RoutePopulation.from_solutions(solutions, 30)
+    assert population.tours.dtype == np.int32
+    assert [population.solution(i) for i in range(len(population))] == solutions
+
+    distances = population.distances(np.asarray(distance_matrix), 0)
+    for solution, distance in zip(solutions, distances):
+        assert math.isclose(distance, solver.calculate_solution_fitness(solution), rel_tol=1e-12)
+    assert solver.evaluate_population(solutions) == distances.tolist()
+
+    loads, _ = population.loads(np.asarray(demands))
+    for row, solution in enumerate(solutions):
+        expected = [sum(demands[c] for c in route) for route in solution]
+        assert np.allclose(loads[row, :len(expected)], expected)
+        assert np.all(loads[row, len(expected):] == 0)
+    assert np.all(population.capacity_excess(np.asarray(demands), 60.0) == 0)
+
+
+def test_route_store_reused_across_generations():
+    """路线编码GA在各代之间复用同一个数组种群，只改写未命中缓存的个体"""
+    distance_matrix, demands = random_instance(30, 5)
+    solver = GeneticAlgorithmVRPSolver(distance_matrix, demands, 60.0, 15, population_size=20, num_generations=2,
+                                       encoding='routes', seed=1)
+    solver.solve_vrp()
+    store = solver._route_store
+    tours = store.tours
+    solver.num_generations = 5
+    routes = solver.solve_vrp()
+    assert solver._route_store is store and store.tours is tours
+
+    # 批量评估同样写入这个数组种群，结果与逐条计算一致
+    fitness = solver.evaluate_population([routes])
+    assert solver._route_store is store
+    assert store.solution(0) == [route for route in routes if route]
+    assert math.isclose(fitness[0], solver.calculate_solution_fitness(routes), rel_tol=1e-12)
+
+
+if __name__ == "__main__":
+    test_vectorized_evaluation_matches_lists()
+    test_route_store_reused_across_generations()
+    print("✓ 数组编码种群测试通过")
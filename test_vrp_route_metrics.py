@@ -0,0 +1,53 @@
+import math
+
+from src.smart_decision_miniproject.solver.VRP import Customer, solve_solomon_vrp
+
+
+def _load_content():
+    with open('test_solomon_c101.txt', encoding='utf-8') as f:
+        return f.read()
+
+
+def test_metrics_match_route_evaluation():
+    """向量化计算的路径指标与逐条路径计算的结果一致"""
+    result = solve_solomon_vrp(_load_content(), use_time_windows=True, solver_type='alns', time_limit=0.3)
+    time_windows = result.time_windows
+    metrics = result.route_metrics
+    routes = [route for route in result.routes if route]
+    assert len(metrics) == len(routes)
+
+    for k, route in enumerate(routes):
+        path = [0] + route + [0]
+        distance = sum(result.distance_matrix[a][b] for a, b in zip(path, path[1:]))
+        assert math.isclose(metrics.distances[k], distance)
+        assert metrics.loads[k] == sum(result.customers[c].demand for c in route)
+        assert math.isclose(metrics.durations[k], time_windows.route_duration(route))
+        assert metrics.slacks[k] >= -1e-9  # 可行解不违反时间窗
+    assert math.isclose(metrics.distances.sum(), result.total_distance)
+
+
+def test_metrics_are_cached_and_invalidated():
+    """指标只计算一次；路径重新赋值或动态修改后重新计算"""
+    result = solve_solomon_vrp(_load_content(), use_time_windows=True, solver_type='alns', time_limit=0.3)
+    metrics = result.route_metrics
+    assert result.route_metrics is metrics
+    result.to_dict()
+    assert result.route_metrics is metrics
+
+    result.routes = [route[:] for route in result.routes]
+    assert result.route_metrics is not metrics
+
+    metrics = result.route_metrics
+    depot = result.customers[0]
+    result.add_customers([Customer(id=101, x=depot.x + 5, y=depot.y + 5, demand=10,
+                                   ready_time=0, due_time=1000, service_time=10)])
+    assert result.route_metrics is not metrics
+    assert math.isclose(result.route_metrics.distances.sum(), result.total_distance)
+    details = result.get_statistics()['routes_details']
+    assert sum(d['num_customers'] for d in details) == len(result.customers) - 1
+
+
+if __name__ == "__main__":
+    test_metrics_match_route_evaluation()
+    test_metrics_are_cached_and_invalidated()
+    print("✓ 路径指标测试通过")
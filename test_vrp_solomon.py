@@ -0,0 +1,98 @@
+import os
+import tempfile
+
+from src.smart_decision_miniproject.solver.VRP import SolomonDataParser
+from src.smart_decision_miniproject.solver import vrp_solomon
+from src.smart_decision_miniproject.solver.vrp_solomon import SolomonInstanceCache, content_key, parse_solomon_columns
+
+
+def _read_c101():
+    with open('test_solomon_c101.txt', encoding='utf-8') as f:
+        return f.read()
+
+
+def test_parse_columns():
+    """列式解析得到正确的车辆参数与客户数据"""
+    instance = parse_solomon_columns(_read_c101())
+    assert len(instance) == 26
+    assert instance.params == {'num_vehicles': 25, 'vehicle_capacity': 200}
+    assert instance.columns['x'][1] == 45.0 and instance.columns['due_time'][1] == 967
+
+    customers, params = SolomonDataParser.parse_solomon_file(_read_c101())
+    assert params == instance.params
+    assert [c.id for c in customers] == list(range(26))
+    assert customers[3].ready_time == 65
+
+
+def test_parse_skips_invalid_rows():
+    """格式不规范的行被跳过，单行车辆信息也能识别"""
+    content = """R_TEST
+VEHICLE NUMBER 3 CAPACITY 50
+CUST NO.  XCOORD.   YCOORD.    DEMAND   READY TIME  DUE DATE   SERVICE TIME
+    0      10         10          0          0       100          0
+    1      12         15         10          0        50         5
+    bad line
+    2      14         x          10          0        50         5
+    3      16         11         20          0        60         5    extra
+"""
+    customers, params = SolomonDataParser.parse_solomon_file(content)
+    assert params == {'num_vehicles': 3, 'vehicle_capacity': 50}
+    assert [c.id for c in customers] == [0, 1, 3]
+
+
+def test_parse_rows_with_extra_column():
+    """每行多出一列时按行取前七个字段，而不是把所有字段按七个一组重新切分"""
+    rows = [f"    {i}      {10 + i}         {20 + i}         5          0       100          1     {99 - i}"
+            for i in range(7)]  # 7 行 × 8 个字段 = 56 个字段，恰好是 7 的倍数
+    content = "C_TEST\nCUST NO.  XCOORD.   YCOORD.    DEMAND   READY TIME  DUE DATE   SERVICE TIME\n" + "\n".join(rows)
+    instance = parse_solomon_columns(content)
+    assert len(instance) == 7
+    assert instance.columns['id'].tolist() == list(range(7))
+    assert instance.columns['x'].tolist() == [10.0 + i for i in range(7)]
+    assert instance.columns['service_time'].tolist() == [1] * 7
+
+
+def test_instance_cache_round_trip():
+    """相同内容第二次读取命中缓存，磁盘缓存在新进程（新缓存对象）中同样有效"""
+    content = _read_c101()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = SolomonInstanceCache(cache_dir)
+        first = cache.load(content)
+        assert cache.load(content) is first
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert os.path.exists(os.path.join(cache_dir, f"{content_key(content)}.npz"))
+
+        fresh = SolomonInstanceCache(cache_dir)
+        loaded = fresh.load(content)
+        assert (fresh.hits, fresh.misses) == (1, 0)
+        assert loaded.params == first.params
+        for name, column in first.columns.items():
+            assert (loaded.columns[name] == column).all()
+
+        customers, _ = SolomonDataParser.load_solomon_file(content, cache=fresh)
+        assert customers == SolomonDataParser.parse_solomon_file(content)[0]
+
+
+def test_cache_key_versioned_and_default_in_memory():
+    """缓存键包含解析器版本；默认缓存只在内存中，除非设置了缓存目录环境变量"""
+    content = _read_c101()
+    key = content_key(content)
+    version = vrp_solomon.CACHE_VERSION
+    try:
+        vrp_solomon.CACHE_VERSION = version + 1
+        assert content_key(content) != key
+    finally:
+        vrp_solomon.CACHE_VERSION = version
+    assert content_key(content) == key
+
+    if not os.environ.get('SMART_DECISION_CACHE_DIR'):
+        assert vrp_solomon.default_instance_cache.cache_dir is None
+
+
+if __name__ == "__main__":
+    test_parse_columns()
+    test_parse_skips_invalid_rows()
+    test_parse_rows_with_extra_column()
+    test_instance_cache_round_trip()
+    test_cache_key_versioned_and_default_in_memory()
+    print("✓ Solomon解析测试通过")
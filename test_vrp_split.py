@@ -0,0 +1,68 @@
+import math
+import random
+
+from src.smart_decision_miniproject.solver.vrp_split import (
+    split_bellman,
+    split_linear,
+    split_linear_limited_fleet,
+    split_penalized,
+)
+from vrp_test_helpers import random_instance
+
+
+def test_split_linear_matches_bellman():
+    """线性Split与Prins原始Bellman版本结果一致"""
+    for seed in range(20):
+        distance_matrix, demands = random_instance(40, seed)
+        giant_tour = list(range(1, 41))
+        random.Random(seed).shuffle(giant_tour)
+
+        bellman_cost, bellman_routes = split_bellman(giant_tour, distance_matrix, demands, 60.0)
+        linear_cost, linear_routes = split_linear(giant_tour, distance_matrix, demands, 60.0)
+
+        assert math.isclose(bellman_cost, linear_cost, rel_tol=1e-9)
+        assert sum(linear_routes, []) == giant_tour
+        for route in linear_routes:
+            assert sum(demands[c] for c in route) <= 60.0
+
+
+def test_split_limited_fleet():
+    """限定车辆数的Split不超过车辆上限"""
+    distance_matrix, demands = random_instance(30, 7)
+    giant_tour = list(range(1, 31))
+
+    unlimited_cost, unlimited_routes = split_linear(giant_tour, distance_matrix, demands, 100.0)
+    cost, routes = split_linear_limited_fleet(giant_tour, distance_matrix, demands, 100.0, len(unlimited_routes))
+    assert math.isclose(cost, unlimited_cost, rel_tol=1e-9)
+
+    min_routes = math.ceil(sum(demands) / 100.0)
+    cost, routes = split_linear_limited_fleet(giant_tour, distance_matrix, demands, 100.0, min_routes + 1)
+    if routes:
+        assert len(routes) <= min_routes + 1
+        assert cost >= unlimited_cost - 1e-9
+
+    cost, routes = split_linear_limited_fleet(giant_tour, distance_matrix, demands, 100.0, 1)
+    assert cost == math.inf and routes == []
+
+
+def test_split_penalized():
+    """惩罚很大时软容量Split等价于硬约束Split，惩罚较小时代价不更高"""
+    distance_matrix, demands = random_instance(40, 3)
+    giant_tour = list(range(1, 41))
+    bellman_cost, bellman_routes = split_bellman(giant_tour, distance_matrix, demands, 60.0)
+
+    strict_cost, strict_routes = split_penalized(giant_tour, distance_matrix, demands, 60.0, 1e6)
+    assert math.isclose(strict_cost, bellman_cost, rel_tol=1e-9)
+    assert strict_routes == bellman_routes
+
+    soft_cost, soft_routes = split_penalized(giant_tour, distance_matrix, demands, 60.0, 0.1)
+    assert soft_cost <= bellman_cost + 1e-9
+    assert sum(soft_routes, []) == giant_tour
+    assert all(sum(demands[c] for c in route) <= 90.0 for route in soft_routes if len(route) > 1)
+
+
+if __name__ == "__main__":
+    test_split_linear_matches_bellman()
+    test_split_limited_fleet()
+    test_split_penalized()
+    print("✓ Split测试通过")
@@ -0,0 +1,30 @@
+from src.smart_decision_miniproject.solver.vrp_state import SolutionState
+
+
+def test_solution_state_moves():
+    """增量负载状态：可行性检查与写时复制"""
+    demands = [0, 10, 20, 30, 40]
+    routes = [[1, 2], [3, 4]]
+    state = SolutionState(routes, demands, 70)
+    assert state.loads == [30, 70]
+    assert state.locate(2) == (1, 0)
+
+    # 交换1和3后两条路径负载为50和50
+    assert state.can_swap(0, 0, 1, 0)
+    swapped = state.apply_swap(0, 0, 1, 0)
+    assert swapped.routes == [[3, 2], [1, 4]]
+    assert swapped.loads == [50, 50]
+    assert state.routes == [[1, 2], [3, 4]]  # 原状态不变
+
+    # 把4移到第一条路径恰好满载，交换后再移动则超载
+    assert state.can_relocate(1, 1, 0)
+    assert not swapped.can_relocate(1, 1, 0)
+    moved = state.apply_relocate(0, 0, 1, 2)
+    assert moved.routes == [[2], [3, 4, 1]]
+    assert moved.loads == [20, 80] and not moved.is_feasible()
+    assert moved.routes[0] is not routes[0] and state.apply_invert(0, 0, 1).routes[1] is routes[1]
+
+
+if __name__ == "__main__":
+    test_solution_state_moves()
+    print("✓ SolutionState测试通过")
@@ -0,0 +1,117 @@
+import random
+import time
+
+from src.smart_decision_miniproject.solver.VRP import GeneticAlgorithmVRPSolver, solve_solomon_vrp
+from src.smart_decision_miniproject.solver.vrp_alns import ALNSVRPSolver
+from src.smart_decision_miniproject.solver.vrp_hgs import HGSVRPSolver
+from src.smart_decision_miniproject.solver.vrp_warm_start import perturb_solution, repair_solution
+from vrp_test_helpers import random_instance
+
+
+def _assert_feasible(routes, demands, capacity, n):
+    assert sorted(sum(routes, [])) == list(range(1, n + 1))
+    assert all(sum(demands[c] for c in route) <= capacity for route in routes)
+
+
+def test_repair_after_capacity_change():
+    """容量减小后，修复得到覆盖全部客户且不超载的解"""
+    distance_matrix, demands = random_instance(40, 1)
+    solver = ALNSVRPSolver(distance_matrix, demands, 150.0, 10, time_limit=None, max_iterations=200, seed=0)
+    routes = solver.solve_vrp()
+
+    repaired, unassigned = repair_solution(routes, distance_matrix, demands, 80.0)
+    assert unassigned == []
+    _assert_feasible(repaired, demands, 80.0, 40)
+
+
+def test_repair_drops_unknown_and_inserts_missing():
+    """未知及重复的客户被忽略，缺失的客户被插入；车队上限之外的路线被拆散"""
+    distance_matrix, demands = random_instance(20, 2)
+    routes = [list(range(1, 8)), [7, 8, 9, 25], list(range(10, 20))]  # 重复7，未知25，缺少20
+    repaired, unassigned = repair_solution(routes, distance_matrix, demands, 200.0, num_vehicles=2)
+    assert unassigned == []
+    assert len(repaired) <= 2
+    _assert_feasible(repaired, demands, 200.0, 20)
+
+
+def test_perturbation_keeps_feasibility():
+    """扰动后的解仍覆盖全部客户且不超载，并与原解不同"""
+    distance_matrix, demands = random_instance(40, 3)
+    routes, _ = repair_solution([], distance_matrix, demands, 100.0)
+    _assert_feasible(routes, demands, 100.0, 40)
+    rng = random.Random(0)
+    perturbed = [perturb_solution(routes, distance_matrix, demands, 100.0, rng, removal_ratio=0.3) for _ in range(5)]
+    for solution in perturbed:
+        _assert_feasible(solution, demands, 100.0, 40)
+    assert any(sorted(map(tuple, solution)) != sorted(map(tuple, routes)) for solution in perturbed)
+
+
+def test_alns_warm_start_converges_quickly():
+    """ALNS从修改前的解热启动，提前收敛且结果不差于修复后的初始解"""
+    distance_matrix, demands = random_instance(50, 4)
+    cold = ALNSVRPSolver(distance_matrix, demands, 100.0, 20, time_limit=None, max_iterations=2000, seed=0)
+    routes = cold.solve_vrp()
+
+    warm = ALNSVRPSolver(distance_matrix, demands, 90.0, 20, time_limit=None, max_iterations=2000,
+                         patience=200, warm_start_routes=routes, seed=0)
+    initial_cost = warm.calculate_solution_fitness(warm.initial_solution())
+    warm_routes = warm.solve_vrp()
+    _assert_feasible(warm_routes, demands, 90.0, 50)
+    assert warm.stop_reason == 'converged'
+    assert warm.last_statistics['iterations'] < 2000
+    assert warm.calculate_solution_fitness(warm_routes) <= initial_cost + 1e-9
+
+
+def test_ga_and_hgs_warm_start():
+    """遗传算法和HGS的初始种群包含修复后的热启动解"""
+    distance_matrix, demands = random_instance(30, 5)
+    routes, _ = repair_solution([], distance_matrix, demands, 100.0)
+
+    ga = GeneticAlgorithmVRPSolver(distance_matrix, demands, 100.0, 15, population_size=20,
+                                   num_generations=5, warm_start_routes=routes, seed=0)
+    seeds = ga.generate_warm_start_solutions()
+    assert len(seeds) == 4
+    for solution in seeds:
+        _assert_feasible(solution, demands, 100.0, 30)
+    _assert_feasible(ga.solve_vrp(), demands, 100.0, 30)
+
+    hgs = HGSVRPSolver(distance_matrix, demands, 100.0, 15, time_limit=None, max_iterations=20,
+                       warm_start_routes=routes, seed=0)
+    hgs_routes = hgs.solve_vrp()
+    _assert_feasible(hgs_routes, demands, 100.0, 30)
+    assert hgs.calculate_solution_fitness(hgs_routes) <= hgs.calculate_solution_fitness(routes) + 1e-9
+
+    try:
+        GeneticAlgorithmVRPSolver(distance_matrix, demands, 100.0, 15, warm_start_ratio=1.5)
+        assert False, "warm_start_ratio超出[0, 1]应抛出ValueError"
+    except ValueError:
+        pass
+
+
+def test_solomon_warm_start_after_edit():
+    """修改实例（删除一个客户）后以之前的结果热启动，较快返回可行解"""
+    with open('test_solomon_c101.txt', encoding='utf-8') as f:
+        content = f.read()
+    previous = solve_solomon_vrp(content, use_time_windows=True, solver_type='alns', time_limit=1.0)
+
+    lines = content.splitlines()
+    edited = '\n'.join(line for line in lines if not (line.split()[:1] == ['25'] and len(line.split()) == 7))
+    start = time.time()
+    result = solve_solomon_vrp(edited, use_time_windows=True, solver_type='alns', time_limit=5.0, warm_start=previous)
+    assert time.time() - start < 5.0
+    assert result.stop_reason == 'converged'
+    assert sorted(sum(result.routes, [])) == list(range(1, 25))
+
+    ga_result = solve_solomon_vrp(edited, use_time_windows=True, solver_type='ga', time_limit=1.0,
+                                  warm_start=previous.routes)
+    assert sorted(sum(ga_result.routes, [])) == list(range(1, 25))
+
+
+if __name__ == "__main__":
+    test_repair_after_capacity_change()
+    test_repair_drops_unknown_and_inserts_missing()
+    test_perturbation_keeps_feasibility()
+    test_alns_warm_start_converges_quickly()
+    test_ga_and_hgs_warm_start()
+    test_solomon_warm_start_after_edit()
+    print("✓ 热启动测试通过")
@@ -0,0 +1,137 @@
+import math
+import random
+
+from src.smart_decision_miniproject.solver.VRP import GeneticAlgorithmVRPSolver, SolomonDataParser, solve_solomon_vrp
+from src.smart_decision_miniproject.solver.vrp_split import split_bellman, split_bellman_limited_fleet
+from src.smart_decision_miniproject.solver.vrp_time_windows import TimeWindows
+from vrp_test_helpers import random_instance
+
+
+def _load_c101():
+    """读取C101前25个客户的测试数据"""
+    with open('test_solomon_c101.txt', encoding='utf-8') as f:
+        content = f.read()
+    customers, params = SolomonDataParser.parse_solomon_file(content)
+    distance_matrix = [[math.dist((a.x, a.y), (b.x, b.y)) for b in customers] for a in customers]
+    time_windows = TimeWindows(
+        [c.ready_time for c in customers],
+        [c.due_time for c in customers],
+        [c.service_time for c in customers],
+        distance_matrix,
+    )
+    return content, customers, time_windows
+
+
+def _c101_solver(customers, time_windows, num_vehicles):
+    distance_matrix = [[math.dist((a.x, a.y), (b.x, b.y)) for b in customers] for a in customers]
+    return GeneticAlgorithmVRPSolver(distance_matrix, [c.demand for c in customers], 200.0, num_vehicles,
+                                     time_windows=time_windows, seed=0)
+
+
+def test_constant_time_checks_match_full_evaluation():
+    """O(1)插入/删除/替换/拼接检查与整条路径重新计算的结果一致"""
+    _, customers, time_windows = _load_c101()
+    rng = random.Random(5)
+    ids = list(range(1, len(customers)))
+
+    for _ in range(300):
+        rng.shuffle(ids)
+        route1 = sorted(ids[:6], key=lambda c: customers[c].ready_time)
+        route2 = sorted(ids[6:12], key=lambda c: customers[c].ready_time)
+        if not (time_windows.is_route_feasible(route1) and time_windows.is_route_feasible(route2)):
+            continue
+        schedule1 = time_windows.schedule(route1)
+        schedule2 = time_windows.schedule(route2)
+        customer = ids[12]
+
+        for pos in range(len(route1) + 1):
+            expected = time_windows.is_route_feasible(route1[:pos] + [customer] + route1[pos:])
+            assert time_windows.can_insert(route1, schedule1, pos, customer) == expected
+        for pos in range(len(route1)):
+            expected = time_windows.is_route_feasible(route1[:pos] + route1[pos + 1:])
+            assert time_windows.can_remove(route1, schedule1, pos) == expected
+            expected = time_windows.is_route_feasible(route1[:pos] + [customer] + route1[pos + 1:])
+            assert time_windows.can_replace(route1, schedule1, pos, customer) == expected
+        for pos1 in range(len(route1) + 1):
+            for pos2 in range(len(route2) + 1):
+                expected = time_windows.is_route_feasible(route1[:pos1] + route2[pos2:])
+                assert time_windows.can_join(route1, schedule1, pos1, route2, schedule2, pos2) == expected
+
+
+def test_solomon_solution_respects_time_windows():
+    """VRPTW模式下Solomon求解结果满足时间窗"""
+    content, _, time_windows = _load_c101()
+    result = solve_solomon_vrp(content, use_time_windows=True)
+    assert sorted(sum(result.routes, [])) == list(range(1, 26))
+    assert all(time_windows.is_route_feasible(route) for route in result.routes)
+
+
+def test_infeasible_customer_raises():
+    """某客户单独配送也无法满足时间窗时，解码报错而不是返回空路线"""
+    _, customers, _ = _load_c101()
+    due_times = [c.due_time for c in customers]
+    due_times[3] = 0.0
+    distance_matrix = [[math.dist((a.x, a.y), (b.x, b.y)) for b in customers] for a in customers]
+    time_windows = TimeWindows([c.ready_time for c in customers], due_times,
+                               [c.service_time for c in customers], distance_matrix)
+    solver = _c101_solver(customers, time_windows, 25)
+    try:
+        solver.generate_random_solution()
+        assert False, "不可行实例应抛出 ValueError"
+    except ValueError as error:
+        assert "[3]" in str(error)
+
+
+def _brute_force_split(giant_tour, distance_matrix, demands, capacity, max_vehicles, time_windows):
+    """枚举所有切分位置，返回车辆数不超过上限的最优切分代价"""
+    n = len(giant_tour)
+    best = math.inf
+    for mask in range(1 << (n - 1)):
+        cuts = [0] + [i + 1 for i in range(n - 1) if mask >> i & 1] + [n]
+        routes = [giant_tour[cuts[k]:cuts[k + 1]] for k in range(len(cuts) - 1)]
+        if len(routes) > max_vehicles:
+            continue
+        if any(sum(demands[c] for c in route) > capacity or not time_windows.is_route_feasible(route)
+               for route in routes):
+            continue
+        cost = sum(distance_matrix[0][route[0]] + distance_matrix[route[-1]][0]
+                   + sum(distance_matrix[a][b] for a, b in zip(route, route[1:])) for route in routes)
+        best = min(best, cost)
+    return best
+
+
+def test_time_window_split_respects_fleet():
+    """VRPTW解码同样遵守车辆数上限（与穷举一致）；车队不足时退回不限车辆的解"""
+    rng = random.Random(7)
+    limited_splits = 0
+    for seed in range(15):
+        distance_matrix, demands = random_instance(9, seed)
+        ready_times = [0.0] + [rng.uniform(0, 200) for _ in range(9)]
+        due_times = [600.0] + [ready + rng.uniform(80, 300) for ready in ready_times[1:]]
+        time_windows = TimeWindows(ready_times, due_times, [0.0] + [10.0] * 9, distance_matrix)
+        giant_tour = sorted(range(1, 10), key=lambda c: ready_times[c] + rng.uniform(0, 60))
+        cost, routes = split_bellman(giant_tour, distance_matrix, demands, 100.0, time_windows=time_windows)
+        for max_vehicles in range(1, len(routes) + 1):
+            limited_cost, limited_routes = split_bellman_limited_fleet(
+                giant_tour, distance_matrix, demands, 100.0, max_vehicles, time_windows=time_windows)
+            assert math.isclose(limited_cost, _brute_force_split(giant_tour, distance_matrix, demands, 100.0,
+                                                                 max_vehicles, time_windows))
+            solver = GeneticAlgorithmVRPSolver(distance_matrix, demands, 100.0, max_vehicles,
+                                               time_windows=time_windows, seed=0)
+            decoded_routes = solver.decode_giant_tour(giant_tour)[1]
+            if limited_cost == math.inf:
+                assert decoded_routes == routes
+            else:
+                limited_splits += max_vehicles < len(routes)
+                assert len(limited_routes) <= max_vehicles and decoded_routes == limited_routes
+                assert all(time_windows.is_route_feasible(route) for route in limited_routes)
+        assert math.isclose(limited_cost, cost)
+    assert limited_splits > 0
+
+
+if __name__ == "__main__":
+    test_constant_time_checks_match_full_evaluation()
+    test_solomon_solution_respects_time_windows()
+    test_infeasible_customer_raises()
+    test_time_window_split_respects_fleet()
+    print("✓ VRPTW测试通过")
@@ -0,0 +1,13 @@
+"""测试共用的随机VRP实例生成函数"""
+
+import math
+import random
+
+
+def random_instance(n, seed):
+    """生成随机欧氏实例（0号为仓库）"""
+    rng = random.Random(seed)
+    points = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(n + 1)]
+    distance_matrix = [[math.dist(p, q) for q in points] for p in points]
+    demands = [0.0] + [float(rng.randint(1, 30)) for _ in range(n)]
+    return distance_matrix, demands